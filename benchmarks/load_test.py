@@ -0,0 +1,157 @@
+# benchmarks/load_test.py
+
+# 로컬 흉내 서버(benchmarks/mock_cafe.py)를 띄우고 실제 브라우저로 CafeCrawler.collect 실행
+# → pages/s, articles/s + 서버 요청/오류 통계를 JSON 으로 저장 (네트워크 없이 재현 가능)
+# python -m benchmarks.load_test --pages 5 --detail
+# python -m benchmarks.load_test --layout iframe --detail --async --concurrency 8 ^
+#   --latency-ms 120 --jitter-ms 60 --error-rate 0.02
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+# 설정 모듈을 읽기 전에: 페이지 사이 대기 없음, 레이아웃/OCR 캐시는 data/ 에 쓰지 않음
+# (이미 환경변수로 지정한 값은 그대로 사용)
+os.environ.setdefault("NCS_REQUEST_DELAY_SEC", "0")
+os.environ.setdefault("NCS_LAYOUT_CACHE", "")
+os.environ.setdefault("NCS_OCR_CACHE", "")
+
+from benchmarks.mock_cafe import MockCafeServer, add_config_args, config_from_args
+from benchmarks.run import _git_commit, _versions
+from naver_cafe_scraper import config as cfg
+from naver_cafe_scraper.network import ROUTE_PROFILES
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    p = argparse.ArgumentParser(description="로컬 흉내 서버 대상 end-to-end 크롤링 부하 테스트")
+    p.add_argument("--pages", type=int, default=5, help="수집할 목록 페이지 수")
+    p.add_argument("--detail", action="store_true", help="상세 페이지까지 수집")
+    p.add_argument("--detail-delay", type=float, default=0.0, help="상세 사이 대기(초)")
+    p.add_argument("--async", dest="use_async", action="store_true", help="AsyncCafeCrawler 사용")
+    p.add_argument(
+        "--concurrency", type=int, default=cfg.DETAIL_CONCURRENCY, help="--async 상세 동시 수"
+    )
+    p.add_argument("--detail-contexts", type=int, default=1, help="--async 상세 컨텍스트 수")
+    p.add_argument("--tab-max-uses", type=int, default=cfg.DETAIL_TAB_MAX_USES)
+    p.add_argument("--list-route", choices=list(ROUTE_PROFILES), default=cfg.LIST_ROUTE_PROFILE)
+    p.add_argument("--detail-route", choices=list(ROUTE_PROFILES), default=cfg.DETAIL_ROUTE_PROFILE)
+    p.add_argument("--ocr-workers", type=int, default=0, help="OCR 워커 수 (기본 0 = 끔)")
+    p.add_argument("--headed", action="store_true", help="브라우저 창 표시")
+    p.add_argument("--output", help="결과 JSON 경로 (기본: data/benchmarks/load_<시각>.json)")
+    add_config_args(p)
+    return p.parse_args(argv)
+
+
+def _make_crawler(args: argparse.Namespace, server: MockCafeServer, tmp_dir: str):
+    kwargs: Dict[str, Any] = dict(
+        base_url=server.board_url,
+        headless=not args.headed,
+        state_path=os.path.join(tmp_dir, "state.json"),
+        detail_tab_max_uses=args.tab_max_uses,
+        list_route_profile=args.list_route,
+        detail_route_profile=args.detail_route,
+        layout_cache_path=None,
+        index_path=os.path.join(tmp_dir, "index.sqlite3"),
+        ocr_workers=args.ocr_workers,
+        ocr_cache_path=None,
+    )
+    if args.use_async:
+        from naver_cafe_scraper.async_crawler import AsyncCafeCrawler
+
+        return AsyncCafeCrawler(
+            concurrency=args.concurrency, detail_contexts=args.detail_contexts, **kwargs
+        )
+    from naver_cafe_scraper.crawler import CafeCrawler
+
+    return CafeCrawler(**kwargs)
+
+
+def run(args: argparse.Namespace, server: MockCafeServer) -> Dict[str, Any]:
+    """collect 1회 실행 (브라우저 기동/종료 포함 시간) → 처리량"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        crawler = _make_crawler(args, server, tmp_dir)
+        kw = dict(
+            max_pages=args.pages,
+            fetch_detail=args.detail,
+            per_detail_delay_sec=args.detail_delay,
+        )
+        t0 = time.perf_counter()
+        if args.use_async:
+            rows: List[Dict[str, object]] = asyncio.run(crawler.collect(**kw))
+        else:
+            rows = crawler.collect(**kw)
+        elapsed = time.perf_counter() - t0
+
+    # 실제로 행을 돌려준 목록 페이지 수 (게시판이 --pages 보다 짧으면 그만큼 적음)
+    pages = len({r["page"] for r in rows if r.get("page") is not None})
+    details = sum(1 for r in rows if r.get("content_text"))
+    return {
+        "elapsed_s": elapsed,
+        "pages": pages,
+        "articles": len(rows),
+        "details": details,
+        "pages_per_s": pages / elapsed if elapsed else 0.0,
+        "articles_per_s": len(rows) / elapsed if elapsed else 0.0,
+        "details_per_s": details / elapsed if elapsed else 0.0,
+        "route_stats": crawler.route_stats,
+        "ocr_stats": crawler.ocr_stats,
+    }
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    args = parse_args(argv)
+    config = config_from_args(args)
+
+    with MockCafeServer(config) as server:
+        print(f"[mock] {server.board_url}")
+        result = run(args, server)
+        server_stats = dict(server.stats)
+
+    mode = f"async x{args.concurrency}" if args.use_async else "sync"
+    print(
+        f"[load] {config.layout} {mode}: {result['elapsed_s']:.2f}s  "
+        f"pages {result['pages']} ({result['pages_per_s']:.2f}/s)  "
+        f"articles {result['articles']} ({result['articles_per_s']:.2f}/s)  "
+        f"details {result['details']} ({result['details_per_s']:.2f}/s)"
+    )
+    print(f"[mock] {server_stats}")
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "commit": _git_commit(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "versions": _versions(),
+            "args": {k: v for k, v in vars(args).items() if k != "output"},
+            "server": vars(config),
+        },
+        "result": result,
+        "server_stats": server_stats,
+    }
+    output = args.output or os.path.join(
+        cfg.DATA_DIR, "benchmarks", f"load_{datetime.now():%Y%m%d_%H%M%S}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"[save] {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,64 @@
+# benchmarks/make_fixtures.py
+
+# 벤치마크 입력 파일 생성 (seed 고정, 결과물은 benchmarks/fixtures/ 에 커밋)
+# python -m benchmarks.make_fixtures
+
+from __future__ import annotations
+
+import gzip
+import io
+import json
+import os
+import random
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from benchmarks import synth
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+
+def main() -> int:
+    os.makedirs(FIXTURE_DIR, exist_ok=True)
+    rng = random.Random(20250808)
+
+    def write(name: str, data) -> None:
+        path = os.path.join(FIXTURE_DIR, name)
+        mode = "wb" if isinstance(data, bytes) else "w"
+        with open(path, mode, **({} if mode == "wb" else {"encoding": "utf-8"})) as f:
+            f.write(data)
+        print(f"[fixture] {name} ({os.path.getsize(path):,} bytes)")
+
+    # 목록: 한 페이지 50행 (신스킨/구스킨)
+    write("list_new.html", synth.page_html(synth.list_rows_html(rng, 50, 13709326)))
+    write("list_old.html", synth.page_html(synth.list_old_html(rng, 50, 13709326)))
+
+    # 상세: 일반 한국어 글 / 긴 글 / 이미지 많은 글
+    write("post_korean.html", synth.page_html(synth.article_html(rng, 30, 3)))
+    write("post_long.html", synth.page_html(synth.article_html(rng, 600, 5)))
+    write("post_many_images.html", synth.page_html(synth.article_html(rng, 40, 60)))
+
+    # KoBERT 전처리 입력: 짧은 글 ~ 긴 글 섞어서 300건 (gzip, mtime 고정)
+    lines = []
+    for i in range(300):
+        n = rng.choice((3, 10, 30, 120)) if i % 20 else 600
+        lines.append(json.dumps({"content_text": synth.post_text(rng, n)}, ensure_ascii=False))
+    buf = io.BytesIO()
+    with gzip.GzipFile(fileobj=buf, mode="wb", mtime=0) as gz:
+        gz.write(("\n".join(lines) + "\n").encode("utf-8"))
+    write("texts.jsonl.gz", buf.getvalue())
+
+    # OCR 입력 이미지
+    write("img_banner.png", synth.encode(synth.text_image(rng, 860, 320)))
+    long_im = synth.text_image(rng, 860, 6000).convert("L")
+    write("img_long.png", synth.encode(long_im, optimize=True))
+    write("img_photo.jpg", synth.encode(synth.photo_image(rng, 800, 600), "JPEG", quality=80))
+    write("img_icon.png", synth.encode(synth.text_image(rng, 24, 24, line_height=12)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
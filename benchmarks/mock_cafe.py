@@ -0,0 +1,319 @@
+# benchmarks/mock_cafe.py
+"""
+오프라인 부하 테스트용 로컬 네이버 카페 흉내 서버 (http.server, 스레드)
+- 게시판 목록: /cafes/<cafe_id>/menus/<menu_id>?page=N
+    layout="new"    : 메인 DOM 에 신스킨 table.article-table
+    layout="iframe" : iframe#cafe_main(/ArticleList.nhn?...) 안에 구스킨 a.article / a.tit
+- 게시글 상세: /f-e/cafes/<cafe_id>/articles/<no> (iframe 레이아웃이면 /ArticleRead.nhn 프레임)
+- 본문 이미지: /img/<no>/<i>.png (같은 PNG payload, URL 만 다름)
+- 응답마다 지연(latency ± jitter), 확률적 오류(error_rate → error_status)
+- 내용/지연/오류는 seed + 경로(+같은 경로 재요청 횟수)로 결정 → 스레드 순서와 무관하게 재현
+
+python -m benchmarks.mock_cafe --port 8800 --layout iframe --latency-ms 80 --jitter-ms 40
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from benchmarks import synth
+
+LAYOUTS = ("new", "iframe")
+
+# 첫 글 번호 (목록은 최신순이라 top_no 부터 1씩 감소)
+_FIRST_ARTICLE_NO = 10_000_000
+
+
+@dataclass
+class MockCafeConfig:
+    layout: str = "new"
+    cafe_id: int = 29434212
+    menu_id: int = 1
+    articles: int = 10_000  # 게시판 전체 글 수 (마지막 페이지 이후는 빈 목록)
+    rows_per_page: int = 15
+    paragraphs: int = 30  # 상세 본문 문단 수
+    images: int = 3  # 상세 본문 이미지 수
+    image_width: int = 860
+    image_height: int = 1200
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    error_rate: float = 0.0  # 0~1, 목록/상세/이미지 요청 공통
+    error_status: int = 503
+    seed: int = 20250808
+
+
+class MockCafeServer:
+    """
+    with MockCafeServer(MockCafeConfig(layout="iframe", latency_ms=50)) as server:
+        crawler.collect(base_url=server.board_url, ...)
+        server.stats  # {"list": n, "article": n, "image": n, "error": n, "bytes": n, ...}
+
+    port=0 이면 빈 포트 자동 할당. render(path) 는 소켓 없이 응답만 생성
+    """
+
+    def __init__(
+        self, config: Optional[MockCafeConfig] = None, host: str = "127.0.0.1", port: int = 0
+    ):
+        self.config = config or MockCafeConfig()
+        if self.config.layout not in LAYOUTS:
+            raise ValueError(f"알 수 없는 layout: {self.config.layout} (가능: {LAYOUTS})")
+        self.host = host
+        self.port = port
+        self.stats: Counter = Counter()
+        self._attempts: Counter = Counter()
+        self._lock = threading.Lock()
+        self._image: Optional[bytes] = None
+        self._httpd: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    # ------------------------------------------------------------------
+    # URL
+    # ------------------------------------------------------------------
+    @property
+    def base(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def board_url(self) -> str:
+        c = self.config
+        return f"{self.base}/cafes/{c.cafe_id}/menus/{c.menu_id}?page=1"
+
+    @property
+    def top_no(self) -> int:
+        return _FIRST_ARTICLE_NO + self.config.articles
+
+    # ------------------------------------------------------------------
+    # 응답 생성
+    # ------------------------------------------------------------------
+    def _rng(self, *key: object) -> random.Random:
+        return random.Random(":".join(str(k) for k in (self.config.seed,) + key))
+
+    def _image_payload(self) -> bytes:
+        if self._image is None:
+            c = self.config
+            im = synth.text_image(self._rng("image"), c.image_width, c.image_height)
+            self._image = synth.encode(im)
+        return self._image
+
+    def _list_body(self, page_no: int, old_skin: bool) -> str:
+        c = self.config
+        first_no = self.top_no - (page_no - 1) * c.rows_per_page
+        rows = max(0, min(c.rows_per_page, first_no - _FIRST_ARTICLE_NO))
+        rng = self._rng("list", page_no)
+        make = synth.list_old_html if old_skin else synth.list_rows_html
+        return make(rng, rows, first_no, cafe_id=c.cafe_id, base=self.base)
+
+    def _article_body(self, no: int) -> str:
+        c = self.config
+        src = f"{self.base}/img/{no}/{{i}}.png"
+        return synth.article_html(self._rng("article", no), c.paragraphs, c.images, image_src=src)
+
+    @staticmethod
+    def _frame_page(src: str) -> str:
+        return synth.page_html(
+            f'<div id="cafe-body"><iframe id="cafe_main" name="cafe_main" src="{src}" '
+            'width="860" height="2000" frameborder="0"></iframe></div>'
+        )
+
+    def render(self, path: str) -> Tuple[int, str, bytes, str]:
+        """요청 경로 → (status, content_type, body, 통계 키)"""
+        c = self.config
+        parsed = urlparse(path)
+        query = {k: v[-1] for k, v in parse_qs(parsed.query).items()}
+        parts = [p for p in parsed.path.split("/") if p]
+        html_type = "text/html; charset=utf-8"
+
+        def page_no(key: str) -> int:
+            try:
+                return max(1, int(query.get(key, "1")))
+            except ValueError:
+                return 1
+
+        # 게시판 목록
+        if parts[:1] == ["cafes"] and len(parts) == 4 and parts[2] == "menus":
+            n = page_no("page")
+            if c.layout == "iframe":
+                src = (
+                    f"/ArticleList.nhn?search.clubid={c.cafe_id}"
+                    f"&search.menuid={c.menu_id}&search.page={n}"
+                )
+                return 200, html_type, self._frame_page(src).encode("utf-8"), "list"
+            body = synth.page_html(self._list_body(n, False))
+            return 200, html_type, body.encode("utf-8"), "list"
+        if parts == ["ArticleList.nhn"]:
+            body = synth.page_html(self._list_body(page_no("search.page"), True))
+            return 200, html_type, body.encode("utf-8"), "list_frame"
+
+        # 게시글 상세
+        if parts[:2] == ["f-e", "cafes"] and len(parts) == 5 and parts[3] == "articles":
+            no = int(parts[4]) if parts[4].isdigit() else 0
+            if c.layout == "iframe":
+                src = f"/ArticleRead.nhn?clubid={c.cafe_id}&articleid={no}"
+                return 200, html_type, self._frame_page(src).encode("utf-8"), "article"
+            body = synth.page_html(self._article_body(no))
+            return 200, html_type, body.encode("utf-8"), "article"
+        if parts == ["ArticleRead.nhn"]:
+            no = int(query.get("articleid", "0") or 0)
+            body = synth.page_html(self._article_body(no))
+            return 200, html_type, body.encode("utf-8"), "article_frame"
+
+        # 본문 이미지
+        if parts[:1] == ["img"] and len(parts) == 3:
+            return 200, "image/png", self._image_payload(), "image"
+
+        return 404, "text/plain; charset=utf-8", b"not found", "not_found"
+
+    def delay_and_fault(self, path: str) -> Tuple[float, bool]:
+        """이 요청의 (지연 초, 오류 여부): seed + 경로 + 같은 경로 재요청 횟수로 결정"""
+        c = self.config
+        with self._lock:
+            self._attempts[path] += 1
+            attempt = self._attempts[path]
+        rng = self._rng("net", path, attempt)
+        jitter = rng.uniform(-c.jitter_ms, c.jitter_ms) if c.jitter_ms else 0.0
+        delay = max(0.0, c.latency_ms + jitter) / 1000.0
+        return delay, rng.random() < c.error_rate
+
+    def _record(self, key: str, nbytes: int) -> None:
+        with self._lock:
+            self.stats[key] += 1
+            self.stats["requests"] += 1
+            self.stats["bytes"] += nbytes
+
+    # ------------------------------------------------------------------
+    # 서버 수명
+    # ------------------------------------------------------------------
+    def start(self) -> "MockCafeServer":
+        if self.config.images:
+            self._image_payload()  # 첫 요청 지연에 PNG 인코딩 시간이 섞이지 않도록 미리 생성
+        self._httpd = ThreadingHTTPServer((self.host, self.port), _make_handler(self))
+        self._httpd.daemon_threads = True
+        self.port = self._httpd.server_address[1]
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name="mock-cafe", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def __enter__(self) -> "MockCafeServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+def _make_handler(server: MockCafeServer):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive (브라우저 커넥션 재사용)
+
+        def do_GET(self) -> None:
+            delay, fault = server.delay_and_fault(self.path)
+            if delay:
+                time.sleep(delay)
+            if fault:
+                status, ctype, body, key = (
+                    server.config.error_status,
+                    "text/plain; charset=utf-8",
+                    b"injected error",
+                    "error",
+                )
+            else:
+                status, ctype, body, key = server.render(self.path)
+            server._record(key, len(body))
+            self.send_response(status)
+            self.send_header("Content-Type", ctype)
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("Cache-Control", "no-store")
+            self.end_headers()
+            try:
+                self.wfile.write(body)
+            except (BrokenPipeError, ConnectionResetError):
+                pass  # 크롤러가 route 차단/탭 정리로 먼저 끊은 경우
+
+        def log_message(self, format: str, *args) -> None:
+            pass  # 요청마다 stderr 출력하면 측정에 영향
+
+    return Handler
+
+
+# -----------------------------------------------------------------------------
+# 단독 실행 (브라우저로 직접 확인하거나 다른 머신의 크롤러에서 접속)
+# -----------------------------------------------------------------------------
+def add_config_args(p: argparse.ArgumentParser) -> None:
+    """MockCafeConfig 옵션 (load_test 와 공용)"""
+    d = MockCafeConfig()
+    p.add_argument("--layout", choices=LAYOUTS, default=d.layout, help="목록/상세 레이아웃")
+    p.add_argument("--articles", type=int, default=d.articles, help="게시판 전체 글 수")
+    p.add_argument("--rows", type=int, default=d.rows_per_page, help="목록 한 페이지 글 수")
+    p.add_argument("--paragraphs", type=int, default=d.paragraphs, help="상세 본문 문단 수")
+    p.add_argument("--images", type=int, default=d.images, help="상세 본문 이미지 수")
+    p.add_argument("--image-height", type=int, default=d.image_height, help="이미지 높이(px)")
+    p.add_argument("--latency-ms", type=float, default=d.latency_ms, help="응답 지연(ms)")
+    p.add_argument("--jitter-ms", type=float, default=d.jitter_ms, help="지연 ± 흔들림(ms)")
+    p.add_argument("--error-rate", type=float, default=d.error_rate, help="오류 응답 비율(0~1)")
+    p.add_argument("--error-status", type=int, default=d.error_status, help="오류 응답 코드")
+    p.add_argument("--seed", type=int, default=d.seed)
+
+
+def config_from_args(args: argparse.Namespace) -> MockCafeConfig:
+    return MockCafeConfig(
+        layout=args.layout,
+        articles=args.articles,
+        rows_per_page=args.rows,
+        paragraphs=args.paragraphs,
+        images=args.images,
+        image_height=args.image_height,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        seed=args.seed,
+    )
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    p = argparse.ArgumentParser(description="로컬 네이버 카페 흉내 서버")
+    p.add_argument("--host", default="127.0.0.1")
+    p.add_argument("--port", type=int, default=8800)
+    add_config_args(p)
+    args = p.parse_args(argv)
+
+    server = MockCafeServer(config_from_args(args), host=args.host, port=args.port).start()
+    print(f"[mock] {server.board_url} (Ctrl+C 로 종료)")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+        stats: Dict[str, int] = dict(server.stats)
+        print(f"\n[mock] {stats}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
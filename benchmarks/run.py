@@ -0,0 +1,446 @@
+# benchmarks/run.py
+
+# 핫스팟 함수 마이크로 벤치마크 (처리량 + 메모리) → JSON 결과 저장/이전 결과와 비교
+# python -m benchmarks.run
+# python -m benchmarks.run --only clean,parse --compare data/benchmarks/bench_20250808_231700.json
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import json
+import math
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from naver_cafe_scraper import config as cfg
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+
+@dataclass
+class Bench:
+    group: str
+    name: str
+    fn: Callable[[], object]
+    items: int = 1  # 1회 호출이 처리하는 항목 수
+    nbytes: int = 0  # 1회 호출이 처리하는 입력 크기
+    unit: str = "items"  # items 단위 (texts/rows/posts/px)
+
+
+def fixture_bytes(name: str) -> bytes:
+    with open(os.path.join(FIXTURE_DIR, name), "rb") as f:
+        return f.read()
+
+
+def fixture_text(name: str) -> str:
+    return fixture_bytes(name).decode("utf-8")
+
+
+def fixture_texts() -> List[str]:
+    with gzip.open(os.path.join(FIXTURE_DIR, "texts.jsonl.gz"), "rt", encoding="utf-8") as f:
+        return [json.loads(line)["content_text"] for line in f if line.strip()]
+
+
+class _HtmlFrame:
+    """extract_posts_from_frame 용 가짜 frame (content() = 고정 HTML, evaluate() = 고정 raw)"""
+
+    def __init__(self, html: str, raw: Optional[Dict[str, Any]] = None):
+        self._html, self._raw = html, raw
+
+    def content(self) -> str:
+        return self._html
+
+    def evaluate(self, js: str):
+        return self._raw
+
+
+# -----------------------------------------------------------------------------
+# 벤치마크 목록
+# -----------------------------------------------------------------------------
+def clean_benches() -> List[Bench]:
+    from naver_cafe_scraper.utils import clean_for_kobert, clean_many
+
+    texts = fixture_texts()
+    size = sum(len(t.encode("utf-8")) for t in texts)
+    workers = min(4, os.cpu_count() or 1)
+    return [
+        Bench(
+            "clean",
+            "clean_for_kobert[texts]",
+            lambda: [clean_for_kobert(t) for t in texts],
+            len(texts),
+            size,
+            "texts",
+        ),
+        Bench(
+            "clean",
+            f"clean_many[workers={workers}]",
+            lambda: clean_many(texts * 10, workers=workers, chunksize=64),
+            len(texts) * 10,
+            size * 10,
+            "texts",
+        ),
+    ]
+
+
+def parse_benches() -> List[Bench]:
+    from naver_cafe_scraper.html_parser import (
+        parse_article_detail_html,
+        parse_posts_html,
+        posts_raw_from_html,
+    )
+    from naver_cafe_scraper.parser import extract_posts_from_frame
+
+    out: List[Bench] = []
+    for name in ("list_new.html", "list_old.html"):
+        html = fixture_text(name)
+        rows = len(parse_posts_html(html))
+        frame = _HtmlFrame(html, posts_raw_from_html(html))
+        size = len(html.encode("utf-8"))
+        out += [
+            Bench(
+                "parse",
+                f"extract_posts_from_frame[html,{name}]",
+                lambda f=frame: extract_posts_from_frame(f, mode="html"),
+                rows,
+                size,
+                "rows",
+            ),
+            # 브라우저 쪽 스크립트 시간은 빼고 raw → row 변환만
+            Bench(
+                "parse",
+                f"extract_posts_from_frame[evaluate,{name}]",
+                lambda f=frame: extract_posts_from_frame(f, mode="evaluate"),
+                rows,
+                size,
+                "rows",
+            ),
+        ]
+    for name in ("post_korean.html", "post_long.html", "post_many_images.html"):
+        html = fixture_text(name)
+        out.append(
+            Bench(
+                "parse",
+                f"parse_article_detail_html[{name}]",
+                lambda h=html: parse_article_detail_html(h),
+                1,
+                len(html.encode("utf-8")),
+                "posts",
+            )
+        )
+    return out
+
+
+def ocr_benches() -> List[Bench]:
+    from io import BytesIO
+
+    from PIL import Image
+
+    from naver_cafe_scraper.ocr import OcrGate, pixel_digest
+    from naver_cafe_scraper.parser import _OCR_THRESH, _pil_unsharp_threshold, _tile_bands
+
+    out: List[Bench] = []
+    for name in ("img_banner.png", "img_long.png", "img_photo.jpg"):
+        data = fixture_bytes(name)
+        im = Image.open(BytesIO(data))
+        im.load()
+        pixels = im.size[0] * im.size[1]
+
+        def decode_threshold(d=data):
+            img = Image.open(BytesIO(d))
+            return _pil_unsharp_threshold(img, _OCR_THRESH)
+
+        def tiled_threshold(img=im):
+            # 띠 분할 OCR 입력 전처리 (기본 띠 높이/겹침, OCR 엔진 호출은 제외)
+            w = img.size[0]
+            return [
+                _pil_unsharp_threshold(img.crop((0, top, w, bottom)), _OCR_THRESH)
+                for top, bottom in _tile_bands(img.size[1], 2000, 120)
+            ]
+
+        out += [
+            Bench(
+                "ocr",
+                f"_pil_unsharp_threshold[{name}]",
+                lambda img=im: _pil_unsharp_threshold(img, _OCR_THRESH),
+                pixels,
+                len(data),
+                "px",
+            ),
+            Bench("ocr", f"decode+threshold[{name}]", decode_threshold, pixels, len(data), "px"),
+            Bench(
+                "ocr",
+                f"OcrGate.check[{name}]",
+                lambda img=im: OcrGate().check(img),
+                pixels,
+                len(data),
+                "px",
+            ),
+            Bench(
+                "ocr",
+                f"pixel_digest[{name}]",
+                lambda d=data, img=im: pixel_digest(d, img),
+                pixels,
+                len(data),
+                "px",
+            ),
+        ]
+        if name == "img_long.png":
+            out.append(
+                Bench("ocr", f"tiled_threshold[{name}]", tiled_threshold, pixels, len(data), "px")
+            )
+
+    # 아이콘: 크기 조건에서 바로 거르는 OcrGate 거부 경로 (디코드 포함, 전처리/OCR 없음)
+    name = "img_icon.png"
+    data = fixture_bytes(name)
+    icon = Image.open(BytesIO(data))
+    icon.load()
+    assert OcrGate().check(icon)[0] == "too_small", name
+
+    def decode_reject(d=data):
+        return OcrGate().check(Image.open(BytesIO(d)))
+
+    pixels = icon.size[0] * icon.size[1]
+    out += [
+        Bench(
+            "ocr",
+            f"OcrGate.check[{name}]",
+            lambda img=icon: OcrGate().check(img),
+            pixels,
+            len(data),
+            "px",
+        ),
+        Bench("ocr", f"decode+OcrGate.check[{name}]", decode_reject, pixels, len(data), "px"),
+    ]
+    return out
+
+
+def export_benches(tmp_dir: str) -> List[Bench]:
+    from naver_cafe_scraper.exporter import JsonlSink, save_csv, save_json, save_parquet
+    from naver_cafe_scraper.html_parser import parse_article_detail_html, parse_posts_html
+
+    # 목록 row × 상세 결과를 합친 1000행 (content_text 는 전처리 입력 텍스트)
+    posts = parse_posts_html(fixture_text("list_new.html"))
+    detail = parse_article_detail_html(fixture_text("post_many_images.html"))
+    texts = fixture_texts()
+    rows = [
+        {
+            **posts[i % len(posts)],
+            **detail,
+            "page": i // 50 + 1,
+            "content_text": texts[i % len(texts)],
+        }
+        for i in range(1000)
+    ]
+    size = len(json.dumps(rows, ensure_ascii=False).encode("utf-8"))
+
+    def jsonl() -> None:
+        with JsonlSink(os.path.join(tmp_dir, "rows.jsonl")) as sink:
+            for i in range(0, len(rows), 50):
+                sink.write_batch(rows[i : i + 50])
+
+    return [
+        Bench(
+            "export",
+            "save_csv[1000 rows]",
+            lambda: save_csv(rows, os.path.join(tmp_dir, "rows.csv")),
+            len(rows),
+            size,
+            "rows",
+        ),
+        Bench(
+            "export",
+            "save_json[1000 rows]",
+            lambda: save_json(rows, os.path.join(tmp_dir, "rows.json")),
+            len(rows),
+            size,
+            "rows",
+        ),
+        Bench(
+            "export",
+            "save_parquet[1000 rows]",
+            lambda: save_parquet(rows, os.path.join(tmp_dir, "rows.parquet")),
+            len(rows),
+            size,
+            "rows",
+        ),
+        Bench("export", "JsonlSink[1000 rows, 50/batch]", jsonl, len(rows), size, "rows"),
+    ]
+
+
+GROUPS: Dict[str, Callable[..., List[Bench]]] = {
+    "clean": clean_benches,
+    "parse": parse_benches,
+    "ocr": ocr_benches,
+    "export": export_benches,
+}
+
+
+# -----------------------------------------------------------------------------
+# 측정
+# -----------------------------------------------------------------------------
+def measure(b: Bench, min_time: float, repeat: int) -> Dict[str, Any]:
+    """
+    1회 워밍업 → 한 묶음이 min_time 이상 걸리도록 호출 횟수 보정 → repeat 묶음 측정
+    메모리는 따로 1회 호출해 tracemalloc 최대치 (Python 할당만, PIL 픽셀 버퍼 등 C 할당 제외)
+    """
+    b.fn()
+    number = 1
+    while True:
+        t0 = time.perf_counter()
+        for _ in range(number):
+            b.fn()
+        elapsed = time.perf_counter() - t0
+        if elapsed >= min_time or number >= 1_000_000:
+            break
+        number = max(number + 1, math.ceil(number * min_time / max(elapsed, 1e-6) * 1.1))
+
+    times = [elapsed / number]
+    for _ in range(repeat - 1):
+        t0 = time.perf_counter()
+        for _ in range(number):
+            b.fn()
+        times.append((time.perf_counter() - t0) / number)
+
+    tracemalloc.start()
+    try:
+        b.fn()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    median = statistics.median(times)
+    return {
+        "group": b.group,
+        "calls_per_round": number,
+        "rounds": len(times),
+        "median_s": median,
+        "min_s": min(times),
+        "stdev_s": statistics.stdev(times) if len(times) > 1 else 0.0,
+        "unit": b.unit,
+        "items_per_call": b.items,
+        "items_per_s": b.items / median if median else None,
+        "mb_per_s": b.nbytes / median / 1e6 if (median and b.nbytes) else None,
+        "peak_alloc_kb": round(peak / 1024, 1),
+    }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT_DIR,
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+        return out.stdout.strip() or None
+    except Exception:
+        return None
+
+
+def _versions() -> Dict[str, Optional[str]]:
+    from importlib.metadata import PackageNotFoundError, version
+
+    out: Dict[str, Optional[str]] = {}
+    for pkg in ("pillow", "selectolax", "pyarrow", "numpy"):
+        try:
+            out[pkg] = version(pkg)
+        except PackageNotFoundError:
+            out[pkg] = None
+    return out
+
+
+def compare(results: Dict[str, Dict[str, Any]], baseline: Dict[str, Dict[str, Any]]) -> None:
+    """median 비율 (현재/기준) 출력, 10% 이상 느려지면 표시"""
+    print("\n[compare] median 현재/기준 (1.00 미만 = 빨라짐)")
+    for name, r in results.items():
+        old = baseline.get(name)
+        if not old or not old.get("median_s"):
+            print(f"  {name:<58} (기준 없음)")
+            continue
+        ratio = r["median_s"] / old["median_s"]
+        flag = "  ← 느려짐" if ratio > 1.10 else ""
+        print(f"  {name:<58} {ratio:6.2f}x{flag}")
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    p = argparse.ArgumentParser(description="핫스팟 함수 마이크로 벤치마크")
+    p.add_argument("--only", help=f"실행할 그룹 (콤마 구분: {','.join(GROUPS)})")
+    p.add_argument("--filter", help="이름에 이 문자열이 들어간 벤치마크만")
+    p.add_argument("--min-time", type=float, default=0.2, help="한 묶음 최소 측정 시간(초)")
+    p.add_argument("--repeat", type=int, default=5, help="측정 묶음 수 (median/min/stdev)")
+    p.add_argument(
+        "--output",
+        help="결과 JSON 경로 (기본값 data/benchmarks/bench_<시각>.json)",
+    )
+    p.add_argument("--compare", help="비교할 이전 결과 JSON")
+    return p.parse_args(argv)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    args = parse_args(argv)
+    groups = [g.strip() for g in args.only.split(",")] if args.only else list(GROUPS)
+    unknown = [g for g in groups if g not in GROUPS]
+    if unknown:
+        print(f"[ERR] 알 수 없는 그룹: {unknown} (가능: {list(GROUPS)})")
+        return 1
+
+    results: Dict[str, Dict[str, Any]] = {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for group in groups:
+            benches = GROUPS[group](tmp_dir) if group == "export" else GROUPS[group]()
+            for b in benches:
+                if args.filter and args.filter not in b.name:
+                    continue
+                r = results[b.name] = measure(b, args.min_time, max(1, args.repeat))
+                rate = f"{r['items_per_s']:,.0f} {b.unit}/s" if r["items_per_s"] else ""
+                mbs = f"{r['mb_per_s']:.1f} MB/s" if r["mb_per_s"] else ""
+                print(
+                    f"[bench] {b.name:<58} {r['median_s'] * 1e3:10.3f} ms  "
+                    f"{rate:>18} {mbs:>12} {r['peak_alloc_kb']:>10,.0f} KB"
+                )
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "commit": _git_commit(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "versions": _versions(),
+            "min_time": args.min_time,
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+    output = args.output or os.path.join(
+        cfg.DATA_DIR, "benchmarks", f"bench_{datetime.now():%Y%m%d_%H%M%S}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"[save] {output}")
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            compare(results, json.load(f).get("results") or {})
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
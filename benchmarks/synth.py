@@ -0,0 +1,213 @@
+# benchmarks/synth.py
+"""
+벤치마크/부하 테스트용 합성 데이터 (seed 고정 → 항상 같은 결과)
+- 게시판 목록 HTML (신스킨 table.article-table / 구스킨 a.article)
+- 게시글 상세 HTML (se-viewer 본문, 이미지/캡션/외부 링크)
+- KoBERT 전처리 입력 텍스트 (노이즈 라인/시간/URL/기호런 포함)
+- OCR 입력 이미지 (배너, 세로로 긴 상세 이미지, 사진, 아이콘)
+"""
+
+from __future__ import annotations
+
+import html
+import random
+from io import BytesIO
+from typing import List, Optional
+
+WORDS = (
+    "오늘 어제 내일 정말 진짜 너무 완전 가격 할인 특가 무료 배송 쿠폰 적립 이벤트 후기 "
+    "리뷰 추천 비교 구매 주문 결제 상품 사은품 한정 수량 마감 임박 공구 육아 아이 엄마 "
+    "아빠 유치원 초등 학습 교구 장난감 그림책 과학 생활동화 세트 전집 중고 새책 나눔 "
+    "질문 답변 문의 댓글 감사 부탁 확인 공지 안내 주의 사항 정보 공유 맛집 카페 여행 "
+    "캠핑 주말 나들이 체험 수업 방학 선물 생일 케이크 간식 건강 영양제 유산균 비타민"
+).split()
+ENGLISH = "SALE NEW BEST HOT EVENT FREE COUPON LIMITED OPEN SPECIAL".split()
+NICKNAMES = "탐딜을찾아 똘돌잉 하늘맘 별빛아빠 꼬마곰 딸기우유 초코맘 바다소년 달콤쌤".split()
+NOISE_LINES = (
+    "==========",
+    "------------------------------",
+    "~~~~~~~~",
+    "12:30",
+    "▶▶▶",
+    "ㅋㅋㅋㅋ",
+    "...",
+    "* * *",
+)
+
+
+def sentence(rng: random.Random, min_words: int = 4, max_words: int = 14) -> str:
+    words = [rng.choice(WORDS) for _ in range(rng.randint(min_words, max_words))]
+    if rng.random() < 0.3:
+        words.insert(rng.randrange(len(words) + 1), rng.choice(ENGLISH))
+    if rng.random() < 0.2:
+        words.append(f"{rng.randint(1, 99) * 1000:,}원")
+    return " ".join(words) + rng.choice((".", "!", "?", "~", ""))
+
+
+def post_text(rng: random.Random, lines: int) -> str:
+    """게시글 본문 텍스트 (가끔 노이즈 라인/시간/URL/전화번호/중복 문장)"""
+    out: List[str] = []
+    for _ in range(lines):
+        r = rng.random()
+        if r < 0.08:
+            out.append(rng.choice(NOISE_LINES))
+        elif r < 0.12:
+            out.append(f"문의 010-{rng.randint(1000, 9999)}-{rng.randint(1000, 9999)}")
+        elif r < 0.16:
+            out.append(f"https://smartstore.naver.com/shop/products/{rng.randint(10**6, 10**7)}")
+        elif r < 0.19:
+            out.append(f"{rng.randint(0, 23):02d}:{rng.randint(0, 59):02d} 오픈 예정")
+        elif r < 0.22 and out:
+            out.append(rng.choice(out))
+        else:
+            out.append(sentence(rng))
+    return "\n".join(out)
+
+
+# -----------------------------------------------------------------------------
+# HTML
+# -----------------------------------------------------------------------------
+def article_url(cafe_id: int, no: int, base: str = "https://cafe.naver.com") -> str:
+    return f"{base}/f-e/cafes/{cafe_id}/articles/{no}"
+
+
+def list_rows_html(
+    rng: random.Random, rows: int, first_no: int, cafe_id: int = 29434212, base: str = ""
+) -> str:
+    """신스킨 목록 테이블 (article_no 는 first_no 부터 1씩 감소 = 최신순)"""
+    trs = []
+    for i in range(rows):
+        no = first_no - i
+        title = html.escape(sentence(rng, 3, 8))
+        head = '<span class="head">[광고]</span>' if rng.random() < 0.2 else ""
+        trs.append(
+            "<tr>"
+            f'<td class="td_normal type_articleNumber">{no}</td>'
+            f'<td><a class="article" href="{article_url(cafe_id, no, base or "https://cafe.naver.com")}">'
+            f"{head}{title}</a></td>"
+            f'<td><div class="ArticleBoardWriterInfo"><span class="nickname">'
+            f"{rng.choice(NICKNAMES)}</span></div></td>"
+            f'<td class="td_normal type_date">2025.08.{rng.randint(1, 28):02d}.</td>'
+            f'<td class="td_normal type_readCount">{rng.randint(0, 20000):,}</td>'
+            f'<td class="td_normal type_likeCount">{rng.randint(0, 99)}</td>'
+            "</tr>"
+        )
+    return (
+        '<div class="article-board"><table class="article-table"><tbody>'
+        + "".join(trs)
+        + "</tbody></table></div>"
+    )
+
+
+def list_old_html(
+    rng: random.Random, rows: int, first_no: int, cafe_id: int = 29434212, base: str = ""
+) -> str:
+    """구스킨 목록 (a.article / a.tit 만 있음)"""
+    links = []
+    for i in range(rows):
+        cls = "article" if i % 2 else "tit"
+        url = article_url(cafe_id, first_no - i, base or "https://cafe.naver.com")
+        links.append(
+            f'<div class="board-list"><a class="{cls}" href="{url}">'
+            f"{html.escape(sentence(rng, 3, 8))}</a></div>"
+        )
+    return "".join(links)
+
+
+def page_html(body: str, title: str = "네이버 카페") -> str:
+    return (
+        "<!doctype html><html><head><meta charset='utf-8'>"
+        f"<title>{html.escape(title)}</title></head><body>{body}</body></html>"
+    )
+
+
+def article_html(
+    rng: random.Random,
+    paragraphs: int,
+    images: int,
+    image_src: Optional[str] = None,
+    title: Optional[str] = None,
+) -> str:
+    """상세 본문 (se-viewer). image_src 에 "{i}" 가 있으면 이미지 순번으로 채움"""
+    src = image_src or "https://cafeptthumb-phinf.pstatic.net/MjAyNTA4/{i}.jpg"
+    parts: List[str] = []
+    every = max(1, paragraphs // images) if images else 0
+    placed = 0
+    for p in range(paragraphs):
+        text = html.escape(sentence(rng, 6, 20))
+        parts.append(
+            f'<div class="se-module se-module-text"><p class="se-text-paragraph">{text}</p></div>'
+        )
+        if rng.random() < 0.05:
+            url = f"https://www.11st.co.kr/products/{rng.randint(10**6, 10**7)}"
+            parts.append(f'<a class="se-link" href="{url}">{url}</a>')
+        if images and placed < images and (p + 1) % every == 0:
+            alt = html.escape(sentence(rng, 2, 5)) if rng.random() < 0.5 else ""
+            parts.append(
+                '<div class="se-module se-module-image">'
+                f'<img src="{src.format(i=placed)}" alt="{alt}" width="860">'
+                + (
+                    f'<div class="se-caption">{html.escape(sentence(rng, 3, 6))}</div>'
+                    if rng.random() < 0.3
+                    else ""
+                )
+                + "</div>"
+            )
+            placed += 1
+    while placed < images:
+        parts.append(f'<img src="{src.format(i=placed)}">')
+        placed += 1
+    head = (
+        f'<div class="ArticleTitle"><h3 class="title_text">'
+        f"{html.escape(title or sentence(rng, 3, 8))}</h3></div>"
+        f'<div class="WriterInfo"><span class="nickname">{rng.choice(NICKNAMES)}</span></div>'
+        f'<div class="article_info"><span class="date">2025.08.08. 23:17</span>'
+        f'<span class="count">조회 {rng.randint(0, 20000):,}</span></div>'
+        f'<div class="like_no"><em class="u_cnt">{rng.randint(0, 99)}</em></div>'
+    )
+    return head + '<div class="se-viewer">' + "".join(parts) + "</div>"
+
+
+# -----------------------------------------------------------------------------
+# 이미지
+# -----------------------------------------------------------------------------
+def _font(size: int):
+    from PIL import ImageFont
+
+    try:
+        return ImageFont.load_default(size=size)
+    except TypeError:  # Pillow < 10.1
+        return ImageFont.load_default()
+
+
+def text_image(rng: random.Random, width: int, height: int, line_height: int = 40) -> "Image":
+    """흰 바탕 + 검은 글자 줄 (상세 이미지/배너 근사)"""
+    from PIL import Image, ImageDraw
+
+    im = Image.new("RGB", (width, height), "white")
+    draw = ImageDraw.Draw(im)
+    font = _font(int(line_height * 0.7))
+    for y in range(10, height - line_height, line_height):
+        if rng.random() < 0.15:
+            continue  # 문단 사이 여백
+        words = [rng.choice(ENGLISH) for _ in range(rng.randint(2, 6))]
+        draw.text((20, y), " ".join(words) + f" {rng.randint(1, 99)}% OFF", fill="black", font=font)
+    return im
+
+
+def photo_image(rng: random.Random, width: int, height: int) -> "Image":
+    """글자 없는 사진 근사 (저주파 노이즈)"""
+    from PIL import Image, ImageFilter
+
+    small = Image.frombytes(
+        "RGB",
+        (width // 10, height // 10),
+        bytes(rng.getrandbits(8) for _ in range(width * height * 3 // 100)),
+    )
+    return small.resize((width, height), Image.BICUBIC).filter(ImageFilter.GaussianBlur(8))
+
+
+def encode(im, fmt: str = "PNG", **kw) -> bytes:
+    buf = BytesIO()
+    im.save(buf, fmt, **kw)
+    return buf.getvalue()
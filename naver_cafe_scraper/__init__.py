@@ -5,9 +5,19 @@ naver_cafe_scraper 패키지
 
 모듈 구성:
 - config.py    : 환경설정 및 경로 정의
+- core.py      : sync/async 크롤러 공용 설정·상태·헬퍼(CrawlerCore)
 - crawler.py   : 크롤러 클래스(CafeCrawler)
+- async_crawler.py : 비동기 크롤러(AsyncCafeCrawler, 상세 동시 수집)
 - parser.py    : HTML 파싱 로직
-- exporter.py  : CSV/JSON 저장 유틸
+- html_parser.py : 오프라인 HTML 파서 백엔드(selectolax)
+- ocr.py       : OCR 워커 풀(OcrWorkerPool) + OCR 결과 캐시(OcrCache, SQLite)
+- pool.py      : 상세 페이지 탭 풀(PagePool/AsyncPagePool)
+- network.py   : 네트워크 요청 차단 프로필(RouteBlocker)
+- readiness.py : 페이지 준비 조건 + 적응형 타임아웃(Readiness)
+- layout.py    : 게시판별 스킨/프레임 프로필 캐시(LayoutStore)
+- index.py     : 증분 수집용 게시글 인덱스(ArticleIndex, SQLite)
+- checkpoint.py : 수집 체크포인트(CrawlCheckpoint, 중단 후 재개)
+- exporter.py  : CSV/JSON/Parquet 저장 + 스트리밍 싱크(JsonlSink/CsvSink)
 - utils.py     : 공통 유틸 함수
 - login.py     : 네이버 로그인 세션 처리
 """
@@ -19,11 +29,14 @@ from .config import (
     HEADLESS,
     WAIT_MS,
     REQUEST_DELAY_SEC,
+    DETAIL_CONCURRENCY,
     DEBUG,
 )
 from .crawler import CafeCrawler
-from .exporter import save_csv, save_json
-from .parser import extract_posts_from_frame
+from .async_crawler import AsyncCafeCrawler
+from .exporter import save_csv, save_json, save_parquet
+from .parser import extract_posts_from_frame, extract_article_detail
+from .html_parser import parse_posts_html, parse_article_detail_html
 
 __all__ = [
     # 설정 상수
@@ -33,10 +46,16 @@ __all__ = [
     "HEADLESS",
     "WAIT_MS",
     "REQUEST_DELAY_SEC",
+    "DETAIL_CONCURRENCY",
     "DEBUG",
     # 주요 클래스/함수
     "CafeCrawler",
+    "AsyncCafeCrawler",
     "extract_posts_from_frame",
+    "extract_article_detail",
+    "parse_posts_html",
+    "parse_article_detail_html",
     "save_csv",
     "save_json",
+    "save_parquet",
 ]
@@ -0,0 +1,373 @@
+# naver_cafe_scraper/async_crawler.py
+from __future__ import annotations
+
+import asyncio
+from typing import AsyncIterator, List, Dict, Optional, Set
+
+from playwright.async_api import async_playwright
+
+from .config import (
+    MAX_PAGES,
+    REQUEST_DELAY_SEC,
+    DETAIL_CONCURRENCY,
+    DEBUG,
+    LOGIN_REQUIRED,
+)
+from .core import CrawlerCore, core_property
+from .layout import infer_list_skin
+from .login import aprompt_login_and_persist
+from .html_parser import parse_article_detail_html
+from .ocr import OcrWorkerPool
+from .parser import (
+    acapture_ocr_images,
+    aextract_article_detail,
+    aextract_posts_from_frame,
+    merge_ocr_texts,
+)
+from .pool import AsyncPagePool
+from .utils import build_page_url, aload_storage_state, asave_storage_state
+
+
+class AsyncCafeCrawler:
+    """
+    playwright.async_api 기반 크롤러 (CafeCrawler 의 형제 클래스, collect/iter_collect 가 async)
+    - 목록 페이지는 순서대로, 상세 페이지는 concurrency 개까지 동시에 수집
+    - 설정/상태/row 병합·중복 제거 규칙은 CafeCrawler 와 같은 CrawlerCore(self.core) 공유
+    - detail_contexts > 1 이면 상세 탭을 여러 BrowserContext에 분산
+    """
+
+    layout = core_property("layout")
+    route_stats = core_property("route_stats")
+    ocr_stats = core_property("ocr_stats")
+
+    # 예전 CafeCrawler 의 설정 속성/헬퍼 이름 (self.core 로 위임)
+    base_url = core_property("base_url", writable=True)
+    headless = core_property("headless", writable=True)
+    state_path = core_property("state_path", writable=True)
+    wait_ms = core_property("wait_ms", writable=True)
+    detail_nav_timeout_ms = core_property("detail_nav_timeout_ms", writable=True)
+    detail_selector_timeout_ms = core_property("detail_selector_timeout_ms", writable=True)
+    detail_inner_selector_timeout_ms = core_property(
+        "detail_inner_selector_timeout_ms", writable=True
+    )
+    _print_progress = staticmethod(CrawlerCore.print_progress)
+    _get_frames = staticmethod(CrawlerCore.get_frames)
+    _merge_truthy = staticmethod(CrawlerCore.merge_truthy)
+    _dedupe_rows = staticmethod(CrawlerCore.dedupe_rows)
+    _resolve_url = staticmethod(CrawlerCore.resolve_url)
+
+    def __init__(
+        self,
+        *args,
+        concurrency: int = DETAIL_CONCURRENCY,
+        detail_contexts: int = 1,
+        **kwargs,
+    ):
+        self.core = CrawlerCore(*args, **kwargs)
+        self.concurrency = max(1, int(concurrency))
+        self.detail_contexts = max(1, int(detail_contexts))
+
+    # ------------------------------------------------------------------
+    # Frame helpers
+    # ------------------------------------------------------------------
+    def _debug_print_frames(self, page) -> None:
+        self.core.debug_print_frames(page)
+
+    async def _afind_content_frame(self, page) -> Optional[object]:
+        """CafeCrawler._find_content_frame의 비동기 버전"""
+        await self.core.readiness.await_frame_or_content(page)
+        return self.core.pick_content_frame(page)
+
+    async def _alayout_frame(self, page, in_frame: Optional[bool]) -> Optional[object]:
+        """CafeCrawler._layout_frame의 비동기 버전"""
+        if in_frame is False:
+            return None
+        if in_frame:
+            await self.core.readiness.await_frame_or_content(page, selector="iframe#cafe_main")
+            fr = self.core.pick_content_frame(page)
+            if fr:
+                return fr
+        return await self._afind_content_frame(page)
+
+    # ------------------------------------------------------------------
+    # Detail helpers
+    # ------------------------------------------------------------------
+    async def _aextract_detail(self, target) -> Dict[str, object]:
+        """CafeCrawler._extract_detail의 비동기 버전"""
+        if self.core.ocr is None:
+            return await aextract_article_detail(target)
+        return await aextract_article_detail(target, ocr=False)
+
+    async def _afetch_detail(self, pool: AsyncPagePool, link: str) -> Dict[str, object]:
+        """
+        CafeCrawler._fetch_detail의 비동기 버전
+        - core.offline_detail 이면 HTML만 받아 탭을 즉시 반납하고 파싱은 워커 스레드에서 수행
+        - OCR 워커 풀이 있으면 이미지 캡처까지만 하고 풀에 넘김 (결과는 _aenrich_rows 에서 병합)
+        """
+        url = self.core.resolve_url(link)
+        offline = self.core.offline_detail
+        images: List[tuple] = []
+        async with pool.page() as page:
+            await page.goto(
+                url,
+                wait_until="domcontentloaded",
+                timeout=self.core.nav_timeout_ms,
+            )
+
+            known = self.core.layout.detail_frame
+            frame = await self._alayout_frame(page, known)
+            target = frame if frame else page
+            if not await self.core.readiness.await_detail(target):
+                self.core.warn_not_ready("상세", url)
+
+            if offline:
+                html = await target.content()
+            else:
+                det = await self._aextract_detail(target)
+                if self.core.stale_detail_layout(known, det):
+                    frame = await self._afind_content_frame(page)
+                    target = frame if frame else page
+                    if not await self.core.readiness.await_detail(target):
+                        self.core.warn_not_ready("상세", url)
+                    det = await self._aextract_detail(target)
+                if self.core.ocr is not None:
+                    fetch = self.core.fetcher.afetch if self.core.fetcher else None
+                    images = await acapture_ocr_images(
+                        target, skip=self.core.ocr.skip_capture, fetch=fetch
+                    )
+
+        if offline:
+            det = await asyncio.to_thread(parse_article_detail_html, html)
+            # 탭은 이미 반납 → 프로필 없이 다시 열어 전체 탐색으로 재시도
+            if self.core.stale_detail_layout(known, det):
+                return await self._afetch_detail(pool, link)
+        if not self.core.detail_is_empty(det):
+            self.core.learn_layout(detail_frame=frame is not None)
+        if images:
+            self.core.ocr_pending[link] = await self.core.ocr.asubmit_many(images)
+        return det
+
+    async def _aextract_list(self, page) -> List[Dict[str, object]]:
+        """CafeCrawler._extract_list의 비동기 버전"""
+        layout = self.core.layout
+        known = layout.list_frame is not None
+        frame = await self._alayout_frame(page, layout.list_frame)
+        target = frame if frame else page
+        if not await self.core.readiness.await_list(target, selector=layout.list_row_selector):
+            self.core.warn_not_ready("목록")
+        rows = await aextract_posts_from_frame(target)
+
+        if not rows and known:
+            layout.forget("list_frame", "list_skin")
+            frame = await self._afind_content_frame(page)
+            target = frame if frame else page
+            if not await self.core.readiness.await_list(target):
+                self.core.warn_not_ready("목록")
+            rows = await aextract_posts_from_frame(target)
+
+        if rows:
+            self.core.learn_layout(list_frame=frame is not None, list_skin=infer_list_skin(rows))
+        return rows
+
+    async def _aenrich_rows(
+        self,
+        pool: AsyncPagePool,
+        rows: List[Dict[str, object]],
+        page_no: int,
+        per_detail_delay_sec: float,
+        show_progress: bool,
+    ) -> List[Dict[str, object]]:
+        """
+        한 목록 페이지의 상세를 동시 수집.
+        - 세마포어로 동시 탭 수 제한, 탭마다 per_detail_delay_sec 간격 유지
+        - 결과 순서는 입력 rows 순서 그대로
+        - OCR 결과는 세마포어를 놓은 뒤 기다림 (그동안 다른 상세가 탭을 사용)
+        """
+        sem = asyncio.Semaphore(self.concurrency)
+        done = 0
+
+        async def enrich(r: Dict[str, object]) -> Dict[str, object]:
+            nonlocal done
+            link = r.get("url") or ""
+            if not link:
+                return r
+            det: Optional[Dict[str, object]] = None
+            async with sem:
+                try:
+                    det = await self._afetch_detail(pool, link)
+                except Exception:
+                    det = None
+                done += 1
+                if show_progress:
+                    self.core.print_progress(
+                        f"[detail] 페이지 {page_no} 상세 수집: {done}/{len(rows)}",
+                        end="\r",
+                    )
+                await asyncio.sleep(per_detail_delay_sec)
+            if det is None:
+                return r
+            try:
+                futures = self.core.ocr_pending.pop(link, None)
+                if futures is not None:
+                    merge_ocr_texts(det, await OcrWorkerPool.aresults(futures))
+                return self.core.merge_truthy(r, det)
+            except Exception:
+                return r
+
+        return list(await asyncio.gather(*(enrich(r) for r in rows)))
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+    async def collect(
+        self,
+        max_pages: int = MAX_PAGES,
+        base_url: str | None = None,
+        fetch_detail: bool = False,
+        per_detail_delay_sec: float = 0.5,
+        show_progress: bool = False,
+        incremental: bool = False,
+        checkpoint_path: Optional[str] = None,
+        resume: bool = False,
+        defer_index: bool = False,
+    ) -> List[Dict[str, object]]:
+        """
+        CafeCrawler.collect의 비동기 버전 (인자/반환 형식 동일)
+        - fetch_detail=True 시 상세 페이지를 self.concurrency 개씩 동시에 수집
+        """
+        uniq: List[Dict[str, object]] = []
+        async for batch in self.iter_collect(
+            max_pages=max_pages,
+            base_url=base_url,
+            fetch_detail=fetch_detail,
+            per_detail_delay_sec=per_detail_delay_sec,
+            show_progress=show_progress,
+            incremental=incremental,
+            checkpoint_path=checkpoint_path,
+            resume=resume,
+            defer_index=defer_index,
+        ):
+            uniq.extend(batch)
+
+        if show_progress:
+            print(f"[done] 총 {len(uniq)}건 수집 완료")
+
+        return uniq
+
+    async def iter_collect(
+        self,
+        max_pages: int = MAX_PAGES,
+        base_url: str | None = None,
+        fetch_detail: bool = False,
+        per_detail_delay_sec: float = 0.5,
+        show_progress: bool = False,
+        incremental: bool = False,
+        checkpoint_path: Optional[str] = None,
+        resume: bool = False,
+        defer_index: bool = False,
+    ) -> AsyncIterator[List[Dict[str, object]]]:
+        """CafeCrawler.iter_collect의 비동기 버전 (async for batch in crawler.iter_collect(...))"""
+        start_url = base_url or self.core.base_url
+        self.core.load_layout(start_url)
+
+        async with async_playwright() as pw:
+            browser = await pw.chromium.launch(
+                headless=self.core.headless,
+                slow_mo=100 if DEBUG and not self.core.headless else 0,
+            )
+            context = await aload_storage_state(browser, self.core.state_path)
+            blockers = self.core.route_blockers(start_url)
+            page = await context.new_page()
+            await blockers["list"].ainstall(page)
+            detail_ctxs = [context]
+            for _ in range(self.detail_contexts - 1):
+                detail_ctxs.append(await aload_storage_state(browser, self.core.state_path))
+            for ctx in detail_ctxs:
+                await blockers["detail"].ainstall(ctx)
+            detail_pool = AsyncPagePool(
+                detail_ctxs, size=self.concurrency, max_uses=self.core.detail_tab_max_uses
+            )
+            index = self.core.open_index(incremental)
+            ckpt = self.core.open_checkpoint(checkpoint_path, resume, start_url, fetch_detail)
+            self.core.start_ocr(fetch_detail, context)
+
+            seen: Set[tuple] = set()
+            total = 0
+            try:
+                for p in range(1, max_pages + 1):
+                    if ckpt and ckpt.page_done(p):
+                        continue
+
+                    if show_progress:
+                        self.core.print_progress(
+                            f"[crawl] 페이지 {p}/{max_pages} 로딩 중...", end="\r"
+                        )
+
+                    await page.goto(
+                        build_page_url(start_url, p),
+                        wait_until="domcontentloaded",
+                        timeout=self.core.nav_timeout_ms,
+                    )
+
+                    if p == 1 and LOGIN_REQUIRED:
+                        await aprompt_login_and_persist(page, context, self.core.state_path)
+
+                    rows = await self._aextract_list(page)
+                    if DEBUG:
+                        print(f"[page {p}] list items: {len(rows)}")
+
+                    for r in rows:
+                        r["page"] = p
+
+                    rows, caught_up = self.core.split_known(index, rows)
+                    if caught_up and show_progress:
+                        print(f"[crawl] 페이지 {p}: 새 글 없음 (달라진 글 {len(rows)}건) → 중단")
+                    if caught_up and not rows:
+                        break
+                    if ckpt:
+                        rows = ckpt.unfinished(rows)
+                    listed = rows
+
+                    if fetch_detail and rows:
+                        rows = await self._aenrich_rows(
+                            detail_pool, rows, p, per_detail_delay_sec, show_progress
+                        )
+                        if show_progress:
+                            self.core.print_progress(
+                                f"[detail] 페이지 {p} 상세 수집 완료: {len(rows)}/{len(rows)}",
+                                end="\n",
+                            )
+
+                    batch = self.core.dedupe_batch(rows, fetch_detail, seen)
+                    total += len(batch)
+                    yield batch
+                    # 소비 측이 배치를 저장하고 다음 배치를 요청한 뒤에만 체크포인트/인덱스에 기록
+                    if ckpt:
+                        ckpt.complete_page(p, batch)
+                    self.core.mark_seen(index, rows, fetch_detail, listed, defer=defer_index)
+                    if caught_up:
+                        break
+                    await asyncio.sleep(REQUEST_DELAY_SEC)
+
+                    if show_progress:
+                        self.core.print_progress(
+                            f"[crawl] 페이지 {p}/{max_pages} 완료 (누적 {total}건)",
+                            end="\n",
+                        )
+            finally:
+                await detail_pool.close()
+                self.core.close_ocr_pool()
+                if index is not None:
+                    index.close()
+                if ckpt:
+                    ckpt.close()
+                await asave_storage_state(context, self.core.state_path)
+                for ctx in detail_ctxs[1:]:
+                    await ctx.close()
+                await context.close()
+                await browser.close()
+                self.core.report_route_stats(blockers)
+
+    def commit_index(self) -> int:
+        """collect(defer_index=True) 결과를 저장한 뒤 호출 → 미뤄 둔 글을 증분 인덱스에 기록"""
+        return self.core.commit_index()
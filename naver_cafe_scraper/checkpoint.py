@@ -0,0 +1,110 @@
+# naver_cafe_scraper/checkpoint.py
+"""
+수집 체크포인트 (JSONL, 추가 쓰기 전용)
+- 크롤링: 진행 정보만 기록 (완료된 페이지 번호 + 그 페이지에서 저장된 글 번호)
+  row 데이터는 스트리밍 싱크(CsvSink/JsonlSink)가 저장 → 재개 시 싱크에 이어서 기록
+- OCR 백필(scripts/run_ocr.py): 끝에 한꺼번에 저장하므로 행마다 결과를 detail 로 기록
+- 강제 종료로 마지막 줄이 잘렸으면 그 줄만 버리고 이어서 기록
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from typing import Dict, List, Optional, Set
+
+from .index import article_key
+from .utils import ensure_dir
+
+
+class CrawlCheckpoint:
+    """
+    레코드 형식 (한 줄 = 한 레코드)
+      {"type": "meta", "start_url": ..., "fetch_detail": ...}
+      {"type": "page", "page": 3, "articles": ["13709326", ...]}
+      {"type": "detail", "page": 0, "url": "...", "data": {...}}   (OCR 백필 전용)
+
+    resume=False 면 기존 파일을 비우고 새로 시작,
+    resume=True 면 기존 기록을 읽어 진행 정보를 복원 (meta 가 다르면 ValueError)
+    """
+
+    def __init__(self, path: str, meta: Dict[str, object], resume: bool = False):
+        self.path = path
+        self.meta = dict(meta)
+        self.pages: Set[int] = set()
+        self.articles: Set[str] = set()
+        self.details: Dict[str, Dict[str, object]] = {}
+        ensure_dir(os.path.dirname(os.path.abspath(path)))
+
+        loaded = resume and os.path.exists(path) and self._load()
+        self._fh = open(path, "a" if loaded else "w", encoding="utf-8")
+        if not loaded:
+            self._write({"type": "meta", **self.meta}, sync=True)
+
+    # ------------------------------------------------------------------
+    # 읽기
+    # ------------------------------------------------------------------
+    def _load(self) -> bool:
+        """기존 기록 복원. 기록이 없으면 False"""
+        good_end, meta = 0, None
+        with open(self.path, "rb") as f:
+            for line in f:
+                try:
+                    rec = json.loads(line)
+                except ValueError:
+                    break  # 잘린 마지막 줄
+                if not line.endswith(b"\n"):
+                    break
+                good_end += len(line)
+                kind = rec.pop("type", None)
+                if kind == "meta":
+                    meta = rec
+                elif kind == "detail":
+                    self.details[rec["url"]] = rec["data"]
+                elif kind == "page":
+                    self.pages.add(int(rec["page"]))
+                    self.articles.update(rec.get("articles") or [])
+        if meta is None:
+            return False
+        if meta != self.meta:
+            raise ValueError(
+                f"체크포인트 수집 설정이 다릅니다: {self.path} ({meta} != {self.meta})"
+            )
+        os.truncate(self.path, good_end)
+        return True
+
+    def page_done(self, page_no: int) -> bool:
+        """이전 실행에서 완료(저장까지)된 페이지인지"""
+        return page_no in self.pages
+
+    def unfinished(self, rows: List[Dict[str, object]]) -> List[Dict[str, object]]:
+        """이미 저장된 글 제외 (새 글이 올라와 다음 페이지로 밀린 글은 상세를 다시 열지 않음)"""
+        return [r for r in rows if article_key(r) not in self.articles]
+
+    def detail(self, url: str) -> Optional[Dict[str, object]]:
+        return self.details.get(url)
+
+    # ------------------------------------------------------------------
+    # 쓰기
+    # ------------------------------------------------------------------
+    def _write(self, rec: Dict[str, object], sync: bool = False) -> None:
+        self._fh.write(json.dumps(rec, ensure_ascii=False) + "\n")
+        self._fh.flush()
+        if sync:
+            os.fsync(self._fh.fileno())
+
+    def add_detail(self, page_no: int, url: str, data: Dict[str, object]) -> None:
+        self._write({"type": "detail", "page": page_no, "url": url, "data": data})
+
+    def complete_page(self, page_no: int, rows: List[Dict[str, object]]) -> None:
+        """
+        페이지 완료 기록 (디스크 동기화까지)
+        rows 가 저장된 뒤에 호출 → 글 번호만 남기고 row 데이터는 기록하지 않음
+        """
+        keys = [k for k in (article_key(r) for r in rows) if k]
+        self.pages.add(page_no)
+        self.articles.update(keys)
+        self._write({"type": "page", "page": page_no, "articles": keys}, sync=True)
+
+    def close(self) -> None:
+        self._fh.close()
@@ -24,6 +24,15 @@ WAIT_MS: int = int(os.getenv("NCS_WAIT_MS", "3000"))  # 느린 환경 고려 def
 # 요청 간 딜레이(초) – 과도한 요청 방지
 REQUEST_DELAY_SEC: float = float(os.getenv("NCS_REQUEST_DELAY_SEC", "1.0"))
 
+# 상세 페이지 동시 수집 수(AsyncCafeCrawler)
+DETAIL_CONCURRENCY: int = int(os.getenv("NCS_DETAIL_CONCURRENCY", "4"))
+
+# 상세 탭 재사용 횟수 상한(초과 시 탭 폐기 후 재생성)
+DETAIL_TAB_MAX_USES: int = int(os.getenv("NCS_DETAIL_TAB_MAX_USES", "50"))
+
+# 파싱 모드: evaluate(페이지 내 스크립트) | html(content() 후 오프라인 파싱) | dom
+PARSE_MODE: str = os.getenv("NCS_PARSE_MODE", "evaluate").lower()
+
 # 디버그 출력 (프레임/네트워크 등 로그 도움)
 DEBUG: bool = os.getenv("NCS_DEBUG", "false").lower() in {"1", "true", "yes", "y"}
 
@@ -40,12 +49,42 @@ OUTPUT_DIR = os.path.join(DATA_DIR, "output")
 # 네이버 로그인 세션(Playwright storage state) 저장 파일
 STATE_PATH: str = os.getenv("NCS_STATE_PATH", os.path.join(DATA_DIR, "naver_state.json"))
 
+# 게시판별 레이아웃 프로필 캐시(빈 값이면 디스크에 저장하지 않음) / 유효기간(초)
+LAYOUT_CACHE_PATH: str = os.getenv(
+    "NCS_LAYOUT_CACHE", os.path.join(DATA_DIR, "layout_profiles.json")
+)
+LAYOUT_TTL_SEC: float = float(os.getenv("NCS_LAYOUT_TTL_SEC", str(7 * 24 * 3600)))
+
+# 증분 수집(이미 본 글 건너뛰기)용 게시글 인덱스(SQLite)
+INDEX_PATH: str = os.getenv("NCS_INDEX_PATH", os.path.join(DATA_DIR, "article_index.sqlite3"))
+
+# 수집 체크포인트(완료 페이지/글 번호만 기록, --checkpoint 로 켜고 --resume 으로 재개)
+CHECKPOINT_PATH: str = os.getenv(
+    "NCS_CHECKPOINT_PATH", os.path.join(DATA_DIR, "crawl_checkpoint.jsonl")
+)
+
 # OCR 설정
 OCR_ENABLED: bool = os.getenv("NCS_OCR", "false").lower() in {"1", "true", "yes", "y"}
 OCR_LANG: str = os.getenv("NCS_OCR_LANG", "kor+eng")
 TESSERACT_CMD: str = os.getenv(
     "NCS_TESSERACT_CMD", r"C:\Program Files\Tesseract-OCR\tesseract.exe"
 )
+# OCR 프로세스 풀 크기 (0이면 상세 파싱 중에 바로 OCR)
+OCR_WORKERS: int = int(os.getenv("NCS_OCR_WORKERS", str(max(1, (os.cpu_count() or 2) - 1))))
+# OCR 결과 캐시(SQLite, 빈 값이면 사용 안 함) / 최대 항목 수(초과 시 오래 안 쓴 것부터 삭제)
+OCR_CACHE_PATH: str = os.getenv("NCS_OCR_CACHE", os.path.join(DATA_DIR, "ocr_cache.sqlite3"))
+OCR_CACHE_MAX_ENTRIES: int = int(os.getenv("NCS_OCR_CACHE_MAX", "100000"))
+# OCR 이미지 입력: fetch(원본 src 다운로드, 실패 시 스크린샷) | screenshot(요소 스크린샷만)
+OCR_IMAGE_SOURCE: str = os.getenv("NCS_OCR_IMAGE_SOURCE", "fetch").lower()
+OCR_FETCH_CONCURRENCY: int = int(os.getenv("NCS_OCR_FETCH_CONCURRENCY", "4"))
+# OCR 게이트(작은/단색/글자 없어 보이는/중복 이미지는 OCR 생략)
+OCR_GATE: bool = os.getenv("NCS_OCR_GATE", "true").lower() in {"1", "true", "yes", "y"}
+
+# 네트워크 차단 프로필(list-lite | detail-lite | detail-ocr | none)
+LIST_ROUTE_PROFILE: str = os.getenv("NCS_LIST_ROUTE_PROFILE", "list-lite")
+DETAIL_ROUTE_PROFILE: str = os.getenv(
+    "NCS_DETAIL_ROUTE_PROFILE", "detail-ocr" if OCR_ENABLED else "detail-lite"
+)
 
 # 출력 파일 기본 경로(필요 시 scripts에서 덮어씀)
 DEFAULT_OUTPUT_CSV: str = os.path.join(OUTPUT_DIR, "naver_cafe_titles.csv")
@@ -0,0 +1,402 @@
+# naver_cafe_scraper/core.py
+"""
+sync/async 크롤러 공용 설정 + 상태 + 헬퍼
+- CafeCrawler / AsyncCafeCrawler 는 서로 상속하지 않는 형제 클래스이고,
+  각자 CrawlerCore 하나를 self.core 로 들고 Playwright 호출(대기/탐색/추출)만 따로 구현
+- 여기에는 Playwright 를 await 하지 않는 로직만 둠 (프레임 선택, 병합/중복 제거, 인덱스,
+  체크포인트, OCR 풀, 요청 차단 통계, 레이아웃 학습)
+"""
+
+from __future__ import annotations
+
+import sys
+from concurrent.futures import Future
+from typing import Dict, List, Optional, Set, Tuple
+from urllib.parse import urljoin, urlparse
+
+from .config import (
+    BASE_URL,
+    STATE_PATH,
+    HEADLESS,
+    WAIT_MS,
+    DETAIL_TAB_MAX_USES,
+    LIST_ROUTE_PROFILE,
+    DETAIL_ROUTE_PROFILE,
+    LAYOUT_CACHE_PATH,
+    LAYOUT_TTL_SEC,
+    INDEX_PATH,
+    OCR_ENABLED,
+    OCR_WORKERS,
+    OCR_CACHE_PATH,
+    OCR_CACHE_MAX_ENTRIES,
+    OCR_IMAGE_SOURCE,
+    OCR_FETCH_CONCURRENCY,
+    OCR_GATE,
+    PARSE_MODE,
+    DEBUG,
+)
+from .checkpoint import CrawlCheckpoint
+from .index import ArticleIndex, article_key
+from .layout import LayoutProfile, LayoutStore, board_key
+from .network import RouteBlocker
+from .ocr import ImageFetcher, OcrCache, OcrGate, OcrWorkerPool
+from .readiness import Readiness
+
+# 프레임 URL에 나타나는 키워드(신스킨/구스킨 호환)
+CONTENT_URL_KEYWORDS = (
+    "ArticleList",
+    "Menu",
+    "/menus/",
+    "ArticleList.nhn",
+    "MenuArticles.nhn",
+)
+
+
+def core_property(name: str, writable: bool = False) -> property:
+    """크롤러에서 self.core.<name> 을 그대로 읽는 속성 (writable=True 면 대입도 core 로 전달)"""
+
+    def fget(self):
+        return getattr(self.core, name)
+
+    def fset(self, value) -> None:
+        setattr(self.core, name, value)
+
+    return property(fget, fset if writable else None)
+
+
+class CrawlerCore:
+    def __init__(
+        self,
+        base_url: str = BASE_URL,
+        headless: bool = HEADLESS,
+        state_path: str = STATE_PATH,
+        wait_ms: int = WAIT_MS,
+        detail_nav_timeout_ms: int = 6000,
+        detail_selector_timeout_ms: int = 1500,
+        detail_inner_selector_timeout_ms: int = 800,
+        detail_tab_max_uses: int = DETAIL_TAB_MAX_USES,
+        list_route_profile: str = LIST_ROUTE_PROFILE,
+        detail_route_profile: str = DETAIL_ROUTE_PROFILE,
+        layout_cache_path: Optional[str] = LAYOUT_CACHE_PATH,
+        layout_ttl_sec: float = LAYOUT_TTL_SEC,
+        index_path: str = INDEX_PATH,
+        ocr_workers: int = OCR_WORKERS,
+        ocr_cache_path: Optional[str] = OCR_CACHE_PATH,
+        ocr_image_source: str = OCR_IMAGE_SOURCE,
+    ):
+        self.base_url = base_url
+        self.headless = headless
+        self.state_path = state_path
+        self.wait_ms = wait_ms
+        self.detail_nav_timeout_ms = detail_nav_timeout_ms
+        self.detail_selector_timeout_ms = detail_selector_timeout_ms
+        self.detail_inner_selector_timeout_ms = detail_inner_selector_timeout_ms
+        self.detail_tab_max_uses = detail_tab_max_uses
+        self.list_route_profile = list_route_profile
+        self.detail_route_profile = detail_route_profile
+        self.index_path = index_path
+        self.ocr_workers = max(0, int(ocr_workers))
+        self.ocr_cache_path = ocr_cache_path or None
+        self.ocr_image_source = ocr_image_source
+        # 페이지 타입별 준비 조건 + 관측 기반 적응형 타임아웃
+        self.readiness = Readiness(
+            frame_ms=wait_ms,
+            list_ms=max(wait_ms, 10000),
+            detail_ms=detail_selector_timeout_ms + detail_inner_selector_timeout_ms,
+        )
+        # 게시판별 스킨/프레임 프로필 (collect 시작 시 start_url 기준으로 다시 로드)
+        self.layouts = LayoutStore(layout_cache_path, ttl_sec=layout_ttl_sec)
+        self.layout: LayoutProfile = self.layouts.get(board_key(base_url))
+        # 마지막 collect의 요청 허용/차단 통계
+        self.route_stats: Dict[str, Dict[str, object]] = {}
+        # collect 동안만 열리는 OCR 워커 풀 + 결과 대기 중인 상세(URL → futures)
+        self.ocr: Optional[OcrWorkerPool] = None
+        self.ocr_pending: Dict[str, List[Future]] = {}
+        self.fetcher: Optional[ImageFetcher] = None
+        # 마지막 collect의 OCR 풀/캐시 통계
+        self.ocr_stats: Dict[str, Dict[str, int]] = {}
+        # defer_index 수집에서 결과 저장 후 인덱스에 기록할 목록 행
+        self.pending_seen: List[Dict[str, object]] = []
+
+    @property
+    def nav_timeout_ms(self) -> int:
+        """목록/상세 goto 타임아웃"""
+        return max(self.wait_ms, 30000)
+
+    # ------------------------------------------------------------------
+    # Progress helpers
+    # ------------------------------------------------------------------
+    @staticmethod
+    def print_progress(msg: str, end: str = "\r", flush: bool = True) -> None:
+        """간단한 단일 라인 진행상황 출력 (tqdm 무의존)."""
+        sys.stdout.write(msg + end)
+        if flush:
+            sys.stdout.flush()
+
+    @staticmethod
+    def warn_not_ready(kind: str, where: str = "") -> None:
+        """준비 대기가 재시도까지 타임아웃 → 덜 로드된 DOM 에서 추출하게 됨을 알림"""
+        print(f"[warn] {kind} 준비 대기 시간 초과 → 현재 DOM 으로 추출 {where}".rstrip())
+
+    # ------------------------------------------------------------------
+    # Frame / layout helpers
+    # ------------------------------------------------------------------
+    @staticmethod
+    def get_frames(page):
+        """Playwright Page에서 frames 안전 추출"""
+        try:
+            fr_attr = getattr(page, "frames", None)
+            if callable(fr_attr):
+                return fr_attr() or []
+            if fr_attr is not None:
+                return fr_attr or []
+        except Exception:
+            pass
+        return []
+
+    def debug_print_frames(self, page) -> None:
+        if not DEBUG:
+            return
+        print("[debug] frames:")
+        for i, f in enumerate(self.get_frames(page)):
+            try:
+                name = getattr(f, "name", None)
+                name = name() if callable(name) else name
+                url = getattr(f, "url", "")
+                url = url() if callable(url) else url
+                print(f"  - #{i} name={name!r} url={url}")
+            except Exception:
+                pass
+
+    def pick_content_frame(self, page) -> Optional[object]:
+        """대기 없이 현재 붙어있는 프레임 중 콘텐츠 프레임 선택 (sync/async 공용)"""
+        # 1) id/name=cafe_main
+        try:
+            frame_fn = getattr(page, "frame", None)
+            if callable(frame_fn):
+                fr = frame_fn(name="cafe_main")
+                if fr:
+                    return fr
+        except Exception:
+            pass
+
+        # 2) URL 키워드 매칭
+        self.debug_print_frames(page)
+        for f in self.get_frames(page):
+            try:
+                url = getattr(f, "url", "")
+                url = url() if callable(url) else url
+                if any(k in (url or "") for k in CONTENT_URL_KEYWORDS):
+                    return f
+            except Exception:
+                continue
+        return None
+
+    def load_layout(self, start_url: str) -> LayoutProfile:
+        """collect 시작 시 게시판 프로필 다시 로드"""
+        self.layout = self.layouts.get(board_key(start_url))
+        return self.layout
+
+    def learn_layout(self, **values) -> None:
+        """탐지 결과 기록 (바뀐 경우에만 디스크 저장)"""
+        if self.layout.record(**values):
+            self.layouts.save(self.layout)
+            if DEBUG:
+                print(f"[debug] layout: {self.layout}")
+
+    @staticmethod
+    def detail_is_empty(det: Dict[str, object]) -> bool:
+        return not (det.get("title") or det.get("content_text") or det.get("images"))
+
+    @property
+    def offline_detail(self) -> bool:
+        """
+        NCS_PARSE_MODE=html 이고 OCR 이 꺼져 있으면 상세는 HTML만 받아 탭을 반납한 뒤 파싱
+        (OCR 은 이미지 캡처에 열린 탭이 필요)
+        """
+        return PARSE_MODE == "html" and not OCR_ENABLED
+
+    def stale_detail_layout(self, known: Optional[bool], det: Dict[str, object]) -> bool:
+        """프로필대로 찾았는데 상세가 비었으면 프로필 무효화 후 True (전체 탐색으로 재시도)"""
+        if known is None or not self.detail_is_empty(det):
+            return False
+        self.layout.forget("detail_frame")
+        return True
+
+    @staticmethod
+    def resolve_url(href: str) -> str:
+        """상대 경로를 cafe 도메인 기준으로 보정"""
+        return urljoin("https://cafe.naver.com", href)
+
+    # ------------------------------------------------------------------
+    # Network helpers
+    # ------------------------------------------------------------------
+    def route_blockers(self, start_url: str) -> Dict[str, RouteBlocker]:
+        """목록 탭/상세 컨텍스트용 차단기 (page.route 가 context.route 보다 우선)"""
+        hosts = (urlparse(start_url).hostname or "",)
+        return {
+            "list": RouteBlocker(self.list_route_profile, first_party_hosts=hosts),
+            "detail": RouteBlocker(self.detail_route_profile, first_party_hosts=hosts),
+        }
+
+    def report_route_stats(self, blockers: Dict[str, RouteBlocker]) -> None:
+        self.route_stats = {k: b.summary() for k, b in blockers.items()}
+        if DEBUG:
+            print(f"[debug] route stats: {self.route_stats}")
+
+    # ------------------------------------------------------------------
+    # Row helpers
+    # ------------------------------------------------------------------
+    @staticmethod
+    def merge_truthy(base: dict, patch: dict) -> dict:
+        """
+        빈 값("", [], {}, None)은 덮어쓰지 않고,
+        진짜 값이 있는 필드만 base 위에 patch.
+        """
+        out = dict(base)
+        for k, v in patch.items():
+            if v is None:
+                continue
+            if isinstance(v, str) and not v.strip():
+                continue
+            if isinstance(v, (list, dict)) and not v:
+                continue
+            out[k] = v
+        return out
+
+    @staticmethod
+    def keep_row(r: Dict[str, object], fetch_detail: bool) -> bool:
+        """상세 수집 시 본문/이미지 모두 없는 글은 저장 제외"""
+        if not fetch_detail:
+            return True
+        return bool((r.get("content_text") or "").strip() or r.get("images"))
+
+    @classmethod
+    def dedupe_batch(
+        cls, rows: List[Dict[str, object]], fetch_detail: bool, seen: Set[tuple]
+    ) -> List[Dict[str, object]]:
+        """
+        중복 제거 (제목+URL) + (옵션) 본문/이미지 없는 글 제외
+        seen 을 여러 배치에 걸쳐 공유하면 전체 결과에 대한 중복 제거와 같음
+        """
+        uniq = []
+        for r in rows:
+            if not cls.keep_row(r, fetch_detail):
+                continue
+            k = (r.get("title"), r.get("url"))
+            if k not in seen:
+                uniq.append(r)
+                seen.add(k)
+        return uniq
+
+    @classmethod
+    def dedupe_rows(
+        cls, rows: List[Dict[str, object]], fetch_detail: bool
+    ) -> List[Dict[str, object]]:
+        """중복 제거 (제목+URL) + (옵션) 본문/이미지 없는 글 제외"""
+        return cls.dedupe_batch(rows, fetch_detail, set())
+
+    # ------------------------------------------------------------------
+    # Incremental / checkpoint helpers
+    # ------------------------------------------------------------------
+    def open_index(self, incremental: bool) -> Optional[ArticleIndex]:
+        return ArticleIndex(self.index_path) if incremental else None
+
+    @staticmethod
+    def split_known(
+        index: Optional[ArticleIndex], rows: List[Dict[str, object]]
+    ) -> Tuple[List[Dict[str, object]], bool]:
+        """
+        (처음 보는 글 + 목록 비교 값이 달라진 글, 한 페이지에 처음 보는 글이 없는지)
+        비교 값이 그대로인 이미 본 글은 상세를 다시 열지 않도록 결과에서 제외
+        """
+        if index is None or not rows:
+            return rows, False
+        known = index.known(rows)
+        changed = index.changed(rows)
+        todo = [r for r in rows if (k := article_key(r)) not in known or k in changed]
+        return todo, all(article_key(r) in known for r in rows)
+
+    def mark_seen(
+        self,
+        index: Optional[ArticleIndex],
+        rows: List[Dict[str, object]],
+        fetch_detail: bool,
+        listed: Optional[List[Dict[str, object]]] = None,
+        defer: bool = False,
+    ) -> None:
+        """
+        저장 대상 글만 인덱스에 기록 (상세 실패/빈 본문 글은 다음 실행에서 재시도)
+        listed: 상세 병합 전 목록 행(rows 와 같은 순서) → 비교 값은 목록에 보이던 값으로 기록
+        defer: 기록하지 않고 pending_seen 에 모아 둠 (결과를 저장한 뒤 commit_index 로 기록)
+        """
+        if index is None:
+            return
+        source = listed if listed is not None else rows
+        seen = [m for m, r in zip(source, rows) if self.keep_row(r, fetch_detail)]
+        if defer:
+            self.pending_seen.extend(seen)
+        else:
+            index.mark(seen)
+
+    def commit_index(self) -> int:
+        """defer_index 로 미뤄 둔 글을 인덱스에 기록 → 기록한 글 수 (결과 저장이 끝난 뒤 호출)"""
+        if not self.pending_seen:
+            return 0
+        with ArticleIndex(self.index_path) as index:
+            n = index.mark(self.pending_seen)
+        self.pending_seen = []
+        return n
+
+    @staticmethod
+    def open_checkpoint(
+        path: Optional[str], resume: bool, start_url: str, fetch_detail: bool
+    ) -> Optional[CrawlCheckpoint]:
+        if not path:
+            return None
+        meta = {"start_url": start_url, "fetch_detail": fetch_detail}
+        return CrawlCheckpoint(path, meta, resume=resume)
+
+    # ------------------------------------------------------------------
+    # OCR helpers
+    # ------------------------------------------------------------------
+    def open_ocr_pool(self, fetch_detail: bool) -> Optional[OcrWorkerPool]:
+        """상세+OCR 수집이고 ocr_workers > 0 이면 OCR 을 워커 풀로 분리 (+결과 캐시, 게이트)"""
+        if not (fetch_detail and OCR_ENABLED and self.ocr_workers > 0):
+            return None
+        cache = (
+            OcrCache(self.ocr_cache_path, max_entries=OCR_CACHE_MAX_ENTRIES)
+            if self.ocr_cache_path
+            else None
+        )
+        gate = OcrGate() if OCR_GATE else None
+        return OcrWorkerPool(self.ocr_workers, cache=cache, gate=gate)
+
+    def open_image_fetcher(self, context) -> Optional[ImageFetcher]:
+        """OCR 이미지를 스크린샷 대신 context.request 로 직접 받기 (fetch 모드)"""
+        request = getattr(context, "request", None)
+        if self.ocr is None or self.ocr_image_source != "fetch" or request is None:
+            return None
+        return ImageFetcher(request, concurrency=OCR_FETCH_CONCURRENCY)
+
+    def start_ocr(self, fetch_detail: bool, context) -> None:
+        """collect 시작 시 OCR 워커 풀 + (fetch 모드) 이미지 다운로더 열기"""
+        self.ocr = self.open_ocr_pool(fetch_detail)
+        self.fetcher = self.open_image_fetcher(context)
+
+    def close_ocr_pool(self) -> None:
+        ocr = self.ocr
+        if ocr is not None:
+            ocr.close(wait=False)
+            self.ocr_stats = {"pool": dict(ocr.stats)}
+            if ocr.cache is not None:
+                self.ocr_stats["cache"] = dict(ocr.cache.stats)
+            if ocr.gate is not None:
+                self.ocr_stats["gate"] = dict(ocr.gate.stats)
+            if self.fetcher is not None:
+                self.ocr_stats["fetch"] = dict(self.fetcher.stats)
+            if DEBUG:
+                print(f"[debug] ocr stats: {self.ocr_stats}")
+        self.ocr = None
+        self.fetcher = None
+        self.ocr_pending.clear()
@@ -1,185 +1,185 @@
 # naver_cafe_scraper/crawler.py
 from __future__ import annotations
 
-import sys
 import time
-from typing import List, Dict, Optional
-from urllib.parse import urljoin
+from typing import Iterator, List, Dict, Optional, Set
 
-from playwright.sync_api import sync_playwright, TimeoutError as PWTimeout
+from playwright.sync_api import sync_playwright
 
 from .config import (
-    BASE_URL,
     MAX_PAGES,
-    STATE_PATH,
-    HEADLESS,
-    WAIT_MS,
     REQUEST_DELAY_SEC,
     DEBUG,
     LOGIN_REQUIRED,
 )
+from .core import CrawlerCore, core_property
+from .html_parser import parse_article_detail_html
+from .layout import infer_list_skin
 from .login import prompt_login_and_persist
-from .parser import extract_posts_from_frame, extract_article_detail
-from .utils import build_page_url, load_storage_state, save_storage_state
-
-# 프레임 URL에 나타나는 키워드(신스킨/구스킨 호환)
-CONTENT_URL_KEYWORDS = (
-    "ArticleList",
-    "Menu",
-    "/menus/",
-    "ArticleList.nhn",
-    "MenuArticles.nhn",
+from .ocr import OcrWorkerPool
+from .parser import (
+    capture_ocr_images,
+    extract_article_detail,
+    extract_posts_from_frame,
+    merge_ocr_texts,
 )
+from .pool import PagePool
+from .utils import build_page_url, load_storage_state, save_storage_state
 
 
 class CafeCrawler:
-    def __init__(
-        self,
-        base_url: str = BASE_URL,
-        headless: bool = HEADLESS,
-        state_path: str = STATE_PATH,
-        wait_ms: int = WAIT_MS,
-        detail_nav_timeout_ms: int = 6000,
-        detail_selector_timeout_ms: int = 1500,
-        detail_inner_selector_timeout_ms: int = 800,
-    ):
-        self.base_url = base_url
-        self.headless = headless
-        self.state_path = state_path
-        self.wait_ms = wait_ms
-        self.detail_nav_timeout_ms = detail_nav_timeout_ms
-        self.detail_selector_timeout_ms = detail_selector_timeout_ms
-        self.detail_inner_selector_timeout_ms = detail_inner_selector_timeout_ms
-
-    # ------------------------------------------------------------------
-    # Progress helpers
-    # ------------------------------------------------------------------
-    def _print_progress(self, msg: str, end: str = "\r", flush: bool = True) -> None:
-        """간단한 단일 라인 진행상황 출력 (tqdm 무의존)."""
-        sys.stdout.write(msg + end)
-        if flush:
-            sys.stdout.flush()
+    """
+    playwright.sync_api 기반 크롤러
+    - 설정/상태/공용 헬퍼는 self.core(CrawlerCore), 여기에는 Playwright 호출만 구현
+    - 생성 인자는 CrawlerCore 와 동일
+    """
+
+    layout = core_property("layout")
+    route_stats = core_property("route_stats")
+    ocr_stats = core_property("ocr_stats")
+
+    # 예전 CafeCrawler 의 설정 속성/헬퍼 이름 (self.core 로 위임)
+    base_url = core_property("base_url", writable=True)
+    headless = core_property("headless", writable=True)
+    state_path = core_property("state_path", writable=True)
+    wait_ms = core_property("wait_ms", writable=True)
+    detail_nav_timeout_ms = core_property("detail_nav_timeout_ms", writable=True)
+    detail_selector_timeout_ms = core_property("detail_selector_timeout_ms", writable=True)
+    detail_inner_selector_timeout_ms = core_property(
+        "detail_inner_selector_timeout_ms", writable=True
+    )
+    _print_progress = staticmethod(CrawlerCore.print_progress)
+    _get_frames = staticmethod(CrawlerCore.get_frames)
+    _merge_truthy = staticmethod(CrawlerCore.merge_truthy)
+    _dedupe_rows = staticmethod(CrawlerCore.dedupe_rows)
+    _resolve_url = staticmethod(CrawlerCore.resolve_url)
+
+    def __init__(self, *args, **kwargs):
+        self.core = CrawlerCore(*args, **kwargs)
 
     # ------------------------------------------------------------------
     # Frame helpers
     # ------------------------------------------------------------------
-    def _get_frames(self, page):
-        """Playwright Page에서 frames 안전 추출"""
-        try:
-            fr_attr = getattr(page, "frames", None)
-            if callable(fr_attr):
-                return fr_attr() or []
-            if fr_attr is not None:
-                return fr_attr or []
-        except Exception:
-            pass
-        return []
-
     def _debug_print_frames(self, page) -> None:
-        if not DEBUG:
-            return
-        print("[debug] frames:")
-        for i, f in enumerate(self._get_frames(page)):
-            try:
-                name = getattr(f, "name", None)
-                name = name() if callable(name) else name
-                url = getattr(f, "url", "")
-                url = url() if callable(url) else url
-                print(f"  - #{i} name={name!r} url={url}")
-            except Exception:
-                pass
+        self.core.debug_print_frames(page)
 
     def _find_content_frame(self, page) -> Optional[object]:
         """
-        1) iframe#cafe_main 우선 시도
-        2) 실패 시 URL 키워드 기반 프레임 탐색
+        1) iframe#cafe_main 또는 목록/본문 노드 중 먼저 나타나는 것까지만 대기
+        2) cafe_main 프레임 → URL 키워드 기반 프레임 순으로 탐색
         3) 없으면 None (신스킨: 메인 DOM에 바로 렌더링)
         """
-        # 1) id/name=cafe_main
-        try:
-            page.wait_for_selector("iframe#cafe_main", timeout=self.wait_ms)
-            frame_fn = getattr(page, "frame", None)
-            if callable(frame_fn):
-                fr = frame_fn(name="cafe_main")
-                if fr:
-                    return fr
-        except PWTimeout:
-            pass
-        except Exception:
-            pass
-
-        # 2) URL 키워드 매칭
-        self._debug_print_frames(page)
-        for f in self._get_frames(page):
-            try:
-                url = getattr(f, "url", "")
-                url = url() if callable(url) else url
-                if any(k in (url or "") for k in CONTENT_URL_KEYWORDS):
-                    return f
-            except Exception:
-                continue
-        return None
+        self.core.readiness.wait_frame_or_content(page)
+        return self.core.pick_content_frame(page)
+
+    def _layout_frame(self, page, in_frame: Optional[bool]) -> Optional[object]:
+        """
+        레이아웃 프로필 기반 프레임 선택
+        - False: 메인 DOM (프레임 대기/탐색 생략)
+        - True : iframe#cafe_main 만 대기 후 선택
+        - None : 미탐지 → _find_content_frame 전체 탐색
+        """
+        if in_frame is False:
+            return None
+        if in_frame:
+            self.core.readiness.wait_frame_or_content(page, selector="iframe#cafe_main")
+            fr = self.core.pick_content_frame(page)
+            if fr:
+                return fr
+        return self._find_content_frame(page)
 
     # ------------------------------------------------------------------
     # Detail helpers
     # ------------------------------------------------------------------
-    @staticmethod
-    def _merge_truthy(base: dict, patch: dict) -> dict:
+    def _extract_detail(self, target) -> Dict[str, object]:
+        """워커 풀이 있으면 OCR 은 빼고 파싱 (이미지는 _submit_ocr 로 따로 넘김)"""
+        if self.core.ocr is None:
+            return extract_article_detail(target)
+        return extract_article_detail(target, ocr=False)
+
+    def _submit_ocr(self, link: str, target) -> None:
+        if self.core.ocr is not None:
+            fetch = self.core.fetcher.fetch if self.core.fetcher else None
+            images = capture_ocr_images(target, skip=self.core.ocr.skip_capture, fetch=fetch)
+            self.core.ocr_pending[link] = self.core.ocr.submit_many(images)
+
+    def _merge_pending_ocr(self, rows: List[Dict[str, object]]) -> None:
+        """페이지 상세 수집 중 넘긴 OCR 결과를 기다려 content_text 에 병합"""
+        for r in rows:
+            futures = self.core.ocr_pending.pop(r.get("url") or "", None)
+            if futures is not None:
+                merge_ocr_texts(r, OcrWorkerPool.results(futures))
+
+    def _fetch_detail(self, pool: PagePool, link: str) -> Dict[str, object]:
         """
-        빈 값("", [], {}, None)은 덮어쓰지 않고,
-        진짜 값이 있는 필드만 base 위에 patch.
+        풀에서 탭을 빌려 상세 페이지를 열고 충분히 대기 후 파싱
+        - core.offline_detail 이면 HTML만 받아 탭을 반납한 뒤 html_parser 로 파싱
         """
-        out = dict(base)
-        for k, v in patch.items():
-            if v is None:
-                continue
-            if isinstance(v, str) and not v.strip():
-                continue
-            if isinstance(v, (list, dict)) and not v:
-                continue
-            out[k] = v
-        return out
-
-    def _resolve_url(self, href: str) -> str:
-        """상대 경로를 cafe 도메인 기준으로 보정"""
-        return urljoin("https://cafe.naver.com", href)
-
-    def _fetch_detail(self, context, link: str) -> Dict[str, object]:
-        """새 탭에서 상세 페이지를 열고 충분히 대기 후 파싱"""
-        url = self._resolve_url(link)
-        page = context.new_page()
-        try:
+        url = self.core.resolve_url(link)
+        offline = self.core.offline_detail
+        with pool.page() as page:
             # 1) 빠른 진입: domcontentloaded 까지만
             page.goto(
                 url,
                 wait_until="domcontentloaded",
-                timeout=max(self.wait_ms, 30000),
+                timeout=self.core.nav_timeout_ms,
             )
 
-            # 2) 신스킨 핵심 요소를 짧게 대기
-            selector = "h3.title_text, .ArticleTitle .title_text, .CafeViewer, .se-viewer"
-            try:
-                page.wait_for_selector(selector, timeout=self.detail_selector_timeout_ms)
-            except Exception:
-                page.wait_for_timeout(300)
-
-            # 3) 프레임 전환 필요 시 시도
+            # 2) 프레임 선택 (프로필이 있으면 탐색 생략) → 제목/본문 노드까지만 대기
+            known = self.core.layout.detail_frame
+            frame = self._layout_frame(page, known)
+            target = frame if frame else page
+            if not self.core.readiness.wait_detail(target):
+                self.core.warn_not_ready("상세", url)
+
+            if offline:
+                html = target.content()
+            else:
+                det = self._extract_detail(target)
+                # 3) 프로필대로 찾았는데 비어 있으면 프로필 무효화 후 전체 탐색으로 재시도
+                if self.core.stale_detail_layout(known, det):
+                    frame = self._find_content_frame(page)
+                    target = frame if frame else page
+                    if not self.core.readiness.wait_detail(target):
+                        self.core.warn_not_ready("상세", url)
+                    det = self._extract_detail(target)
+                # 4) OCR 워커 풀이 있으면 이미지만 넘기고 바로 반환 (결과는 페이지 끝에서 병합)
+                self._submit_ocr(link, target)
+
+        if offline:
+            det = parse_article_detail_html(html)
+            # 3') 탭은 이미 반납 → 프로필 없이 다시 열어 전체 탐색으로 재시도
+            if self.core.stale_detail_layout(known, det):
+                return self._fetch_detail(pool, link)
+        if not self.core.detail_is_empty(det):
+            self.core.learn_layout(detail_frame=frame is not None)
+        return det
+
+    def _extract_list(self, page) -> List[Dict[str, object]]:
+        """
+        목록 추출: 레이아웃 프로필로 프레임/행 셀렉터 결정 → 행 수 안정까지 대기 → 추출
+        프로필대로 했는데 결과가 비면 프로필 무효화 후 전체 탐색으로 1회 재시도
+        """
+        layout = self.core.layout
+        known = layout.list_frame is not None
+        frame = self._layout_frame(page, layout.list_frame)
+        target = frame if frame else page
+        # 목록 행 수가 안정될 때까지만 대기 (networkidle 대체)
+        if not self.core.readiness.wait_list(target, selector=layout.list_row_selector):
+            self.core.warn_not_ready("목록")
+        rows = extract_posts_from_frame(target)
+
+        if not rows and known:
+            layout.forget("list_frame", "list_skin")
             frame = self._find_content_frame(page)
             target = frame if frame else page
+            if not self.core.readiness.wait_list(target):
+                self.core.warn_not_ready("목록")
+            rows = extract_posts_from_frame(target)
 
-            # 4) 프레임 내부 재확인(짧게)
-            try:
-                target.wait_for_selector(
-                    selector,
-                    timeout=self.detail_inner_selector_timeout_ms,
-                )
-            except Exception:
-                pass
-
-            # 5) 파싱
-            return extract_article_detail(target)
-        finally:
-            page.close()
+        if rows:
+            self.core.learn_layout(list_frame=frame is not None, list_skin=infer_list_skin(rows))
+        return rows
 
     # ------------------------------------------------------------------
     # Public API
@@ -191,46 +191,107 @@ class CafeCrawler:
         fetch_detail: bool = False,
         per_detail_delay_sec: float = 0.5,
         show_progress: bool = False,  # ← 진척도 출력 스위치
+        incremental: bool = False,
+        checkpoint_path: Optional[str] = None,
+        resume: bool = False,
+        defer_index: bool = False,
     ) -> List[Dict[str, object]]:
         """
         게시판 목록 수집 + (옵션) 상세 페이지 확장 수집
         - fetch_detail=True 시 본문/이미지/외부링크/작성자/날짜 등 병합
         - show_progress=True 시 콘솔에 진행상황 표시
+        - incremental=True 시 게시글 인덱스(index_path)에 없는 새 글과 목록의 작성 날짜가
+          기록과 달라진 글(재게시 등)만 수집/반환하고, 한 페이지가 전부 이미 본 글이면
+          (그 페이지의 달라진 글까지 수집한 뒤) 페이지 넘기기 중단
+        - checkpoint_path 지정 시 저장이 끝난 페이지 번호/글 번호만 기록, resume=True 면 완료된
+          페이지와 글은 건너뛰고 이어서 수집 (결과 행은 반환/yield 하지 않음 → 스트리밍 싱크에 이어 쓰기)
+        - defer_index=True 면 인덱스에 바로 기록하지 않음 → 결과를 파일에 저장한 뒤 commit_index()
+          (저장 전에 죽으면 수집하지 못한 글로 남아 다음 증분 수집에서 다시 수집)
+        전체 결과를 리스트로 모아 반환 (행 단위로 바로 처리하려면 iter_collect 사용)
+        """
+        uniq: List[Dict[str, object]] = []
+        for batch in self.iter_collect(
+            max_pages=max_pages,
+            base_url=base_url,
+            fetch_detail=fetch_detail,
+            per_detail_delay_sec=per_detail_delay_sec,
+            show_progress=show_progress,
+            incremental=incremental,
+            checkpoint_path=checkpoint_path,
+            resume=resume,
+            defer_index=defer_index,
+        ):
+            uniq.extend(batch)
+
+        if show_progress:
+            print(f"[done] 총 {len(uniq)}건 수집 완료")
+
+        return uniq
+
+    def iter_collect(
+        self,
+        max_pages: int = MAX_PAGES,
+        base_url: str | None = None,
+        fetch_detail: bool = False,
+        per_detail_delay_sec: float = 0.5,
+        show_progress: bool = False,
+        incremental: bool = False,
+        checkpoint_path: Optional[str] = None,
+        resume: bool = False,
+        defer_index: bool = False,
+    ) -> Iterator[List[Dict[str, object]]]:
+        """
+        collect 의 스트리밍 버전: 목록 페이지 하나가 (상세 병합까지) 끝날 때마다 그 페이지의
+        row 배치를 yield. 중복 제거/빈 본문 제외는 배치마다 누적 적용(collect 결과와 동일)
+        - 지난 배치를 붙잡고 있지 않으므로 메모리는 페이지 하나 분량만 사용
+        - 소비 측에서 중간에 멈추면(break/close) 브라우저/세션 정리까지 수행
+        - 증분 인덱스에는 소비 측이 배치를 받아 처리하고 다음 배치를 요청한 뒤에 기록
+          (배치를 바로 저장하는 소비 측이면 저장된 글만 기록됨)
         """
-        start_url = base_url or self.base_url
+        start_url = base_url or self.core.base_url
+        self.core.load_layout(start_url)
 
         with sync_playwright() as pw:
             browser = pw.chromium.launch(
-                headless=self.headless,
-                slow_mo=100 if DEBUG and not self.headless else 0,
+                headless=self.core.headless,
+                slow_mo=100 if DEBUG and not self.core.headless else 0,
             )
-            context = load_storage_state(browser, self.state_path)
+            context = load_storage_state(browser, self.core.state_path)
+            blockers = self.core.route_blockers(start_url)
+            blockers["detail"].install(context)
             page = context.new_page()
-
-            all_rows: List[Dict[str, object]] = []
+            blockers["list"].install(page)
+            detail_pool = PagePool(context, size=1, max_uses=self.core.detail_tab_max_uses)
+            index = self.core.open_index(incremental)
+            ckpt = self.core.open_checkpoint(checkpoint_path, resume, start_url, fetch_detail)
+            self.core.start_ocr(fetch_detail, context)
+
+            seen: Set[tuple] = set()
+            total = 0
             try:
                 for p in range(1, max_pages + 1):
+                    # 재개: 체크포인트에 완료 기록된 페이지는 다시 열지 않음 (결과는 싱크에 저장됨)
+                    if ckpt and ckpt.page_done(p):
+                        continue
+
                     if show_progress:
-                        self._print_progress(
+                        self.core.print_progress(
                             f"[crawl] 페이지 {p}/{max_pages} 로딩 중...", end="\r"
                         )
 
                     page_url = build_page_url(start_url, p)
                     page.goto(
                         page_url,
-                        wait_until="networkidle",
-                        timeout=max(self.wait_ms, 30000),
+                        wait_until="domcontentloaded",
+                        timeout=self.core.nav_timeout_ms,
                     )
 
                     # 첫 페이지에서 로그인 확인/세션 저장
                     if p == 1 and LOGIN_REQUIRED:
-                        prompt_login_and_persist(page, context, self.state_path)
-
-                    # 목록이 프레임/신스킨 어디에 있든 타깃 지정
-                    frame = self._find_content_frame(page)
-                    target = frame if frame else page
+                        prompt_login_and_persist(page, context, self.core.state_path)
 
-                    rows = extract_posts_from_frame(target)
+                    # 목록 타깃 지정 (프로필이 있으면 해당 프레임/스킨 셀렉터만 대기)
+                    rows = self._extract_list(page)
                     if DEBUG:
                         print(f"[page {p}] list items: {len(rows)}")
 
@@ -238,10 +299,21 @@ class CafeCrawler:
                     for r in rows:
                         r["page"] = p
 
+                    # 증분 모드: 그대로인 이미 본 글 제외, 전부 본 글이면 이후 페이지도 수집된 것
+                    rows, caught_up = self.core.split_known(index, rows)
+                    if caught_up and show_progress:
+                        print(f"[crawl] 페이지 {p}: 새 글 없음 (달라진 글 {len(rows)}건) → 중단")
+                    if caught_up and not rows:
+                        break
+                    # 재개: 이전 실행에서 이미 저장된 글은 다시 열지 않음
+                    if ckpt:
+                        rows = ckpt.unfinished(rows)
+                    listed = rows
+
                     # 상세 파싱이 켜진 경우
                     if fetch_detail and rows:
                         if show_progress:
-                            self._print_progress(
+                            self.core.print_progress(
                                 f"[detail] 페이지 {p} 상세 수집: 0/{len(rows)}", end="\r"
                             )
                         enriched: List[Dict[str, object]] = []
@@ -249,55 +321,56 @@ class CafeCrawler:
                             link = r.get("url") or ""
                             if link:
                                 try:
-                                    det = self._fetch_detail(context, link)
-                                    merged = self._merge_truthy(r, det)
+                                    det = self._fetch_detail(detail_pool, link)
+                                    merged = self.core.merge_truthy(r, det)
                                     enriched.append(merged)
                                 except Exception:
                                     enriched.append(r)
                                 if show_progress:
-                                    self._print_progress(
+                                    self.core.print_progress(
                                         f"[detail] 페이지 {p} 상세 수집: {i}/{len(rows)}",
                                         end="\r",
                                     )
                                 time.sleep(per_detail_delay_sec)
                             else:
                                 enriched.append(r)
+                        self._merge_pending_ocr(enriched)
                         rows = enriched
                         if show_progress:
-                            self._print_progress(
+                            self.core.print_progress(
                                 f"[detail] 페이지 {p} 상세 수집 완료: {len(rows)}/{len(rows)}",
                                 end="\n",
                             )
 
-                    all_rows.extend(rows)
+                    batch = self.core.dedupe_batch(rows, fetch_detail, seen)
+                    total += len(batch)
+                    yield batch
+                    # 소비 측이 배치를 저장하고 다음 배치를 요청한 뒤에만 체크포인트/인덱스에 기록
+                    if ckpt:
+                        ckpt.complete_page(p, batch)
+                    self.core.mark_seen(index, rows, fetch_detail, listed, defer=defer_index)
+                    if caught_up:
+                        break
                     time.sleep(REQUEST_DELAY_SEC)
 
                     if show_progress:
-                        self._print_progress(
-                            f"[crawl] 페이지 {p}/{max_pages} 완료 (누적 {len(all_rows)}건)",
+                        self.core.print_progress(
+                            f"[crawl] 페이지 {p}/{max_pages} 완료 (누적 {total}건)",
                             end="\n",
                         )
             finally:
                 # 세션 저장 & 정리
-                save_storage_state(context, self.state_path)
+                detail_pool.close()
+                self.core.close_ocr_pool()
+                if index is not None:
+                    index.close()
+                if ckpt:
+                    ckpt.close()
+                save_storage_state(context, self.core.state_path)
                 context.close()
                 browser.close()
+                self.core.report_route_stats(blockers)
 
-            # ✅ 중복 제거 (제목+URL) + (옵션) 본문/이미지 없는 글 제외
-            uniq, seen = [], set()
-            for r in all_rows:
-                if fetch_detail:
-                    no_text = not (r.get("content_text") or "").strip()
-                    no_images = not r.get("images")
-                    if no_text and no_images:
-                        continue  # 본문/이미지 모두 없으면 저장 제외
-
-                k = (r.get("title"), r.get("url"))
-                if k not in seen:
-                    uniq.append(r)
-                    seen.add(k)
-
-            if show_progress:
-                print(f"[done] 총 {len(uniq)}건 수집 완료")
-
-            return uniq
+    def commit_index(self) -> int:
+        """collect(defer_index=True) 결과를 저장한 뒤 호출 → 미뤄 둔 글을 증분 인덱스에 기록"""
+        return self.core.commit_index()
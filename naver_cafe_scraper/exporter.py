@@ -2,9 +2,33 @@
 from __future__ import annotations
 
 import csv
+import gzip
+import io
 import json
+import os
+from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Iterable, Dict, List, Any
+from typing import Iterable, Dict, List, Any, Optional, TextIO
+
+# 상세 + 목록 통합 컬럼 순서 (스트리밍 CSV 의 고정 스키마 기본값)
+PREFERRED_FIELDS: List[str] = [
+    "page",
+    "article_no",
+    "head",
+    "title",
+    "url",
+    "author",
+    "date",
+    "read_count",
+    "like_count",
+    "content_text",
+    "content_html",
+    "external_links",
+    "images",
+    "ocr_texts",
+]
+# 있는 글에만 붙는 키 → save_csv 는 그 키가 있는 행이 있을 때만 컬럼으로 넣음
+OPTIONAL_FIELDS = frozenset({"head", "ocr_texts"})
 
 
 def _ensure_parent(path: str | Path) -> None:
@@ -21,22 +45,10 @@ def _gather_all_keys(rows: Iterable[Dict[str, Any]]) -> List[str]:
 
 def _preferred_order(all_keys: List[str]) -> List[str]:
     # 상세 + 목록 통합 컬럼 순서 (없는 건 뒤로 밀림)
-    preferred = [
-        "page",
-        "article_no",
-        "title",
-        "url",
-        "author",
-        "date",
-        "read_count",
-        "like_count",
-        "content_text",
-        "content_html",
-        "external_links",
-        "images",
-    ]
-    tail = [k for k in all_keys if k not in preferred]
-    return preferred + tail
+    present = set(all_keys)
+    head = [k for k in PREFERRED_FIELDS if k in present or k not in OPTIONAL_FIELDS]
+    tail = [k for k in all_keys if k not in PREFERRED_FIELDS]
+    return head + tail
 
 
 def _serialize(v: Any) -> Any:
@@ -46,26 +58,237 @@ def _serialize(v: Any) -> Any:
     return v
 
 
-def save_csv(rows: List[Dict[str, Any]], path: str | Path) -> None:
+def save_csv(
+    rows: List[Dict[str, Any]], path: str | Path, fields: Optional[List[str]] = None
+) -> str:
+    """fields 지정 시 해당 컬럼만 그 순서대로 저장. 저장 경로 반환"""
     _ensure_parent(path)
     if not rows:
         # 빈 결과라도 헤더는 남기고 싶으면 여기서 기본 헤더 정의 가능
         with open(path, "w", newline="", encoding="utf-8-sig") as f:
             writer = csv.writer(f)
-            writer.writerow(["title", "url"])
-        return
+            writer.writerow(fields or ["title", "url"])
+        return str(path)
 
-    all_keys = _gather_all_keys(rows)
-    fieldnames = _preferred_order(all_keys)
+    fieldnames = fields or _preferred_order(_gather_all_keys(rows))
 
     with open(path, "w", newline="", encoding="utf-8-sig") as f:
         writer = csv.DictWriter(f, fieldnames=fieldnames)
         writer.writeheader()
         for r in rows:
             writer.writerow({k: _serialize(r.get(k, "")) for k in fieldnames})
+    return str(path)
 
 
-def save_json(rows: List[Dict[str, Any]], path: str | Path, indent: int = 2) -> None:
+def save_json(
+    rows: List[Dict[str, Any]],
+    path: str | Path,
+    indent: int = 2,
+    fields: Optional[List[str]] = None,
+) -> str:
+    """fields 지정 시 해당 키만 남겨 저장. 저장 경로 반환"""
     _ensure_parent(path)
+    if fields:
+        rows = [{k: r.get(k) for k in fields} for r in rows]
     with open(path, "w", encoding="utf-8") as f:
         json.dump(rows, f, ensure_ascii=False, indent=indent)
+    return str(path)
+
+
+# -----------------------------------------------------------------------------
+# Parquet (pyarrow, 컬럼 타입 고정)
+# - 조회/좋아요 수는 정수, images/external_links 는 문자열 리스트
+# - author 는 값 반복이 많아 사전(dictionary) 인코딩
+# - CSV 에서 읽어 온 행(JSON 문자열 리스트, NaN, "1,272")도 타입에 맞게 변환
+# -----------------------------------------------------------------------------
+PARQUET_ROW_GROUP_SIZE = 10_000
+
+
+def _parquet_types() -> Dict[str, Any]:
+    import pyarrow as pa
+
+    return {
+        "page": pa.int32(),
+        "article_no": pa.string(),
+        "head": pa.string(),
+        "title": pa.string(),
+        "url": pa.string(),
+        "author": pa.string(),
+        "date": pa.string(),
+        "read_count": pa.int64(),
+        "like_count": pa.int64(),
+        "content_text": pa.string(),
+        "content_html": pa.string(),
+        "external_links": pa.list_(pa.string()),
+        "images": pa.list_(pa.string()),
+        "ocr_texts": pa.list_(pa.string()),
+    }
+
+
+def _is_missing(v: Any) -> bool:
+    return v is None or (isinstance(v, float) and v != v)  # NaN
+
+
+def _to_int(v: Any) -> Optional[int]:
+    if _is_missing(v) or isinstance(v, bool):
+        return None
+    if isinstance(v, (int, float)):
+        return int(v)
+    digits = "".join(ch for ch in str(v) if ch.isdigit())
+    return int(digits) if digits else None
+
+
+def _to_str_list(v: Any) -> Optional[List[str]]:
+    if _is_missing(v):
+        return None
+    if isinstance(v, str):
+        try:
+            v = json.loads(v) if v.strip().startswith("[") else [v]
+        except ValueError:
+            v = [v]
+    if not isinstance(v, (list, tuple)):
+        v = [v]
+    return [str(x) for x in v if not _is_missing(x)]
+
+
+def _to_str(v: Any) -> Optional[str]:
+    if _is_missing(v):
+        return None
+    if isinstance(v, float) and v.is_integer():
+        return str(int(v))  # CSV 에서 읽은 article_no 등
+    if isinstance(v, str):
+        return v
+    if isinstance(v, (list, dict)):
+        return _serialize(v)
+    return str(v)
+
+
+def save_parquet(
+    rows: List[Dict[str, Any]],
+    path: str | Path,
+    fields: Optional[List[str]] = None,
+    compression: str = "zstd",
+    row_group_size: int = PARQUET_ROW_GROUP_SIZE,
+) -> str:
+    """
+    Parquet 저장 (pyarrow 필요). 저장 경로 반환
+    - fields: 저장할 컬럼/순서 (미지정 시 save_csv 와 같은 컬럼 순서)
+    - 알려진 컬럼은 고정 타입, 그 외 컬럼은 문자열
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:  # pragma: no cover - 설치 환경에 따라 다름
+        raise ImportError("Parquet 저장에는 pyarrow가 필요합니다") from e
+
+    _ensure_parent(path)
+    types = _parquet_types()
+    columns = fields or _preferred_order(_gather_all_keys(rows))
+    convert = {pa.int32(): _to_int, pa.int64(): _to_int, pa.list_(pa.string()): _to_str_list}
+
+    schema = pa.schema([(c, types.get(c, pa.string())) for c in columns])
+    data = {}
+    for fld in schema:
+        conv = convert.get(fld.type, _to_str)
+        data[fld.name] = [conv(r.get(fld.name)) for r in rows]
+    table = pa.Table.from_pydict(data, schema=schema)
+
+    pq.write_table(
+        table,
+        str(path),
+        compression=compression,
+        row_group_size=max(1, int(row_group_size)),
+        use_dictionary=[c for c in ("author",) if c in columns],
+    )
+    return str(path)
+
+
+# -----------------------------------------------------------------------------
+# 스트리밍 싱크 (수집 중 배치 단위로 추가 기록)
+# - 경로가 .gz / .zst 로 끝나면 압축 (zstd 는 zstandard 패키지 필요)
+# - write_batch 마다 flush + fsync → 중간에 죽어도 그때까지의 행은 남음
+# -----------------------------------------------------------------------------
+def _open_text_writer(path: str | Path, encoding: str = "utf-8", append: bool = False) -> TextIO:
+    """append=True 면 기존 파일 뒤에 이어 씀 (.gz/.zst 는 새 멤버/프레임으로 이어 붙음)"""
+    p = str(path)
+    if p.endswith(".gz"):
+        return gzip.open(p, "at" if append else "wt", encoding="utf-8", newline="")
+    if p.endswith(".zst"):
+        try:
+            import zstandard
+        except ImportError as e:  # pragma: no cover - 설치 환경에 따라 다름
+            raise ImportError(".zst 출력에는 zstandard 패키지가 필요합니다") from e
+        raw = open(p, "ab" if append else "wb")
+        writer = zstandard.ZstdCompressor(level=3).stream_writer(raw, closefd=True)
+        return io.TextIOWrapper(writer, encoding="utf-8", newline="")
+    return open(p, "a" if append else "w", encoding=encoding, newline="")
+
+
+def _fsync(f: TextIO) -> None:
+    f.flush()
+    try:
+        os.fsync(f.fileno())
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        pass
+
+
+class _StreamSink(ABC):
+    """
+    JsonlSink / CsvSink 공통: with 블록 또는 close() 로 마무리
+    append=True 면 기존 파일 뒤에 이어서 기록 (체크포인트로 재개한 수집)
+    """
+
+    def __init__(self, path: str | Path, encoding: str = "utf-8", append: bool = False):
+        _ensure_parent(path)
+        self.path = str(path)
+        self.rows_written = 0
+        self._f = _open_text_writer(path, encoding=encoding, append=append)
+
+    @abstractmethod
+    def _write_rows(self, rows: List[Dict[str, Any]]) -> None:
+        """rows 를 파일에 기록 (flush/fsync 는 write_batch 에서)"""
+
+    def write_batch(self, rows: List[Dict[str, Any]]) -> int:
+        if rows:
+            self._write_rows(rows)
+            self.rows_written += len(rows)
+        _fsync(self._f)
+        return len(rows)
+
+    def close(self) -> None:
+        if not self._f.closed:
+            _fsync(self._f)
+            self._f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class JsonlSink(_StreamSink):
+    """한 줄에 row 하나(JSON Lines)"""
+
+    def _write_rows(self, rows: List[Dict[str, Any]]) -> None:
+        self._f.write("".join(json.dumps(r, ensure_ascii=False) + "\n" for r in rows))
+
+
+class CsvSink(_StreamSink):
+    """
+    고정 스키마 CSV (fields 외 키는 버림, 리스트/딕셔너리는 JSON 문자열)
+    스키마를 처음에 정하므로 save_csv 처럼 전체 행을 미리 훑을 필요 없음
+    """
+
+    def __init__(self, path: str | Path, fields: Optional[List[str]] = None, append: bool = False):
+        plain = not str(path).endswith((".gz", ".zst"))
+        # 이어 쓰기면 헤더(와 BOM)는 이미 있음
+        fresh = not (append and os.path.exists(path) and os.path.getsize(path) > 0)
+        super().__init__(path, encoding="utf-8-sig" if plain else "utf-8", append=append)
+        self.fields = list(fields or PREFERRED_FIELDS)
+        self._writer = csv.DictWriter(self._f, fieldnames=self.fields, extrasaction="ignore")
+        if fresh:
+            self._writer.writeheader()
+
+    def _write_rows(self, rows: List[Dict[str, Any]]) -> None:
+        self._writer.writerows({k: _serialize(r.get(k, "")) for k in self.fields} for r in rows)
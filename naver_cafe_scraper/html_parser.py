@@ -0,0 +1,172 @@
+# naver_cafe_scraper/html_parser.py
+"""
+오프라인 HTML 파서 백엔드 (selectolax / Lexbor, C 구현)
+- page.content() 결과나 저장된 HTML 파일을 브라우저 없이 파싱
+- 셀렉터 표(parser._LIST_SEL/_DETAIL_SEL)/폴백/출력 키는 extract_posts_from_frame,
+  extract_article_detail 과 동일
+- 스크린샷이 필요한 OCR은 수행하지 않음(라이브 핸들이 있을 때만 parser 쪽에서 수행)
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Dict, List, Optional
+
+from .parser import (
+    _DETAIL_SEL,
+    _LIST_SEL,
+    _assemble_detail,
+    _detail_parts_from_raw,
+    _empty_detail,
+    _posts_from_raw,
+)
+
+# innerText 근사용 태그 분류
+_BLOCK_TAGS = frozenset(
+    (
+        "address article aside blockquote dd div dl dt fieldset figcaption figure footer form "
+        "h1 h2 h3 h4 h5 h6 header hr li main nav ol p pre section table tbody thead tfoot tr ul"
+    ).split()
+)
+_SKIP_TAGS = frozenset({"script", "style", "noscript", "template", "head", "-comment"})
+_WS_RE = re.compile(r"[ \t\n\r\f]+")
+_MULTI_SPACE_RE = re.compile(r" {2,}")
+
+
+# -----------------------------------------------------------------------------
+# 내부 헬퍼
+# -----------------------------------------------------------------------------
+def _parse(html: str):
+    try:
+        from selectolax.lexbor import LexborHTMLParser
+    except ImportError as e:  # pragma: no cover - 설치 환경에 따라 다름
+        raise ImportError("HTML 파서 백엔드에는 selectolax가 필요합니다") from e
+    return LexborHTMLParser(html or "")
+
+
+def _select(node, css: str) -> List[object]:
+    """querySelectorAll 과 같이 문서 순서 + 중복 없는 결과 (쉼표 셀렉터 중복 제거)"""
+    if node is None:
+        return []
+    seen, out = set(), []
+    for n in node.css(css):
+        if n.mem_id not in seen:
+            seen.add(n.mem_id)
+            out.append(n)
+    return out
+
+
+def _first(node, *selectors: str):
+    for sel in selectors:
+        found = _select(node, sel)
+        if found:
+            return found[0]
+    return None
+
+
+def _inner_text(node) -> str:
+    """브라우저 innerText 근사: 공백 축약, <br>/블록 요소 경계에서 줄바꿈"""
+    if node is None:
+        return ""
+    parts: List[str] = []
+
+    def walk(n) -> None:
+        for c in n.iter(include_text=True):
+            tag = c.tag
+            if tag == "-text":
+                parts.append(_WS_RE.sub(" ", c.text_content or ""))
+            elif tag == "br":
+                parts.append("\n")
+            elif tag in _SKIP_TAGS:
+                continue
+            elif tag in _BLOCK_TAGS:
+                parts.append("\n")
+                walk(c)
+                parts.append("\n")
+            else:
+                walk(c)
+
+    walk(node)
+    lines = (_MULTI_SPACE_RE.sub(" ", ln).strip() for ln in "".join(parts).split("\n"))
+    return "\n".join(ln for ln in lines if ln)
+
+
+def _attr(node, name: str) -> Optional[str]:
+    return node.attributes.get(name) if node is not None else None
+
+
+def _inner_html(node) -> str:
+    return "".join(c.html or "" for c in node.iter(include_text=True))
+
+
+# -----------------------------------------------------------------------------
+# raw 추출 (parser._LIST_JS / _DETAIL_JS 와 같은 구조)
+# -----------------------------------------------------------------------------
+def posts_raw_from_html(html: str) -> Dict[str, object]:
+    tree = _parse(html)
+    sel = _LIST_SEL
+    rows: List[Dict[str, str]] = []
+    table = _first(tree.root, sel["table"])
+    if table is not None:
+        for tr in _select(table, sel["row"]):
+            a = _first(tr, sel["link"])
+            title = _inner_text(a)
+            url = _attr(a, "href") or ""
+            if not title or not url:
+                continue
+            row = {"title": title, "url": url}
+            for key, css in sel["cells"].items():
+                row[key] = _inner_text(_first(tr, css))
+            rows.append(row)
+        if rows:
+            return {"skin": "new", "rows": rows}
+    for a in _select(tree.root, sel["old_links"]):
+        title = _inner_text(a)
+        url = _attr(a, "href") or ""
+        if title and url:
+            rows.append({"title": title, "url": url})
+    return {"skin": "old", "rows": rows}
+
+
+def detail_raw_from_html(html: str) -> Dict[str, object]:
+    tree = _parse(html)
+    doc = tree.root
+    sel = _DETAIL_SEL
+    out: Dict[str, object] = {k: _inner_text(_first(doc, *v)) for k, v in sel["fields"].items()}
+    out.update(has_root=False, content_html="")
+    out.update({k: [] for k in ("paras", "links", "images", "alts", "captions")})
+    root = _first(doc, *sel["root"])
+    if root is None:
+        return out
+    out["has_root"] = True
+    out["content_html"] = _inner_html(root)
+    out["paras"] = [t for t in (_inner_text(p) for p in _select(root, sel["paras"])) if t]
+    out["links"] = [
+        h
+        for h in (_attr(a, "href") for a in _select(root, sel["links"]))
+        if h and h.startswith(("http://", "https://"))
+    ]
+    out["images"] = [s for s in (_attr(i, "src") for i in _select(root, sel["images"])) if s]
+    out["alts"] = [
+        a for a in ((_attr(i, "alt") or "").strip() for i in _select(root, sel["alts"])) if a
+    ]
+    out["captions"] = [
+        t for css in sel["captions"] for t in (_inner_text(el) for el in _select(root, css)) if t
+    ]
+    return out
+
+
+# -----------------------------------------------------------------------------
+# 공개 API
+# -----------------------------------------------------------------------------
+def parse_posts_html(html: str) -> List[Dict[str, object]]:
+    """목록 HTML → extract_posts_from_frame 과 같은 row 리스트"""
+    return _posts_from_raw(posts_raw_from_html(html))
+
+
+def parse_article_detail_html(html: str) -> Dict[str, object]:
+    """상세 HTML → extract_article_detail(ocr=False) 과 같은 dict"""
+    data = _empty_detail()
+    parts = _detail_parts_from_raw(detail_raw_from_html(html), data)
+    _assemble_detail(data, *parts, [])
+    return data
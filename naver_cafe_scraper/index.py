@@ -0,0 +1,152 @@
+# naver_cafe_scraper/index.py
+"""
+증분 수집용 게시글 인덱스 (SQLite)
+- 이미 수집한 글의 article_no/URL, 마지막 수집 시각, 목록에 보이던 비교 값(CHANGE_FIELDS)을 보관
+- 목록 한 페이지가 전부 이미 본 글이면 그 뒤 페이지는 더 볼 필요 없음(최신순 게시판)
+- 이미 본 글은 비교 값이 그대로면 상세 페이지를 다시 열지 않고, 달라졌으면(재게시 등) 다시 수집
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import sqlite3
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Set
+
+from .utils import ensure_dir
+
+_ARTICLE_NO_RE = re.compile(r"(?:/articles/|articleid=)(\d+)", re.I)
+_FULL_DATE_RE = re.compile(r"(\d{4})\s*[./-]\s*(\d{1,2})\s*[./-]\s*(\d{1,2})")
+
+
+def _full_date(v: object) -> Optional[str]:
+    """
+    비교용 날짜 "YYYY-MM-DD"
+    오늘 글의 "12:04" 처럼 시각만 보이는 값은 다음 날 "2025.08.08." 로 바뀌므로 비교하지 않음(None)
+    """
+    m = _FULL_DATE_RE.search(str(v or ""))
+    if not m:
+        return None
+    y, mo, d = m.groups()
+    return f"{y}-{int(mo):02d}-{int(d):02d}"
+
+
+# 목록 행에서 비교하는 값 → 비교용 정규화 (둘 다 값이 있을 때만 비교)
+# 조회/좋아요 수는 볼 때마다 늘어나므로 넣지 않음. 댓글/수정 표시는 목록 파서가 읽게 되면 추가
+CHANGE_FIELDS: Dict[str, Callable[[object], Optional[str]]] = {"date": _full_date}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    key           TEXT PRIMARY KEY,
+    article_no    TEXT,
+    url           TEXT,
+    title         TEXT,
+    last_crawled  REAL NOT NULL,
+    date          TEXT
+)
+"""
+
+
+def article_key(row: Dict[str, object]) -> str:
+    """글 식별 키: article_no → URL 안의 글 번호 → URL 순"""
+    no = str(row.get("article_no") or "").strip()
+    if no:
+        return no
+    url = str(row.get("url") or "")
+    m = _ARTICLE_NO_RE.search(url)
+    return m.group(1) if m else url
+
+
+class ArticleIndex:
+    """
+    with ArticleIndex(path) as index:
+        known = index.known(rows)       # 이미 본 글 키 집합
+        changed = index.changed(rows)   # 그중 목록 비교 값이 달라진 글
+        index.mark(rows)                # 수집 완료 기록(last_crawled, 비교 값 갱신)
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        if path != ":memory:":
+            ensure_dir(os.path.dirname(os.path.abspath(path)))
+        self._conn = sqlite3.connect(path)
+        self._conn.execute(_SCHEMA)
+        # 이전 스키마(비교 값 없음) 인덱스는 컬럼만 추가 → 기존 행은 다음 기록 때 채워짐
+        # (예전에 쓰던 read_count 등 남은 컬럼은 읽지 않음)
+        cols = {row[1] for row in self._conn.execute("PRAGMA table_info(articles)")}
+        for name in CHANGE_FIELDS:
+            if name not in cols:
+                self._conn.execute(f"ALTER TABLE articles ADD COLUMN {name} TEXT")
+        self._conn.commit()
+
+    def _lookup(self, keys: List[str]) -> Dict[str, tuple]:
+        """키 → 저장된 비교 값 (SQLite 변수 개수 제한(기본 999) 이내로 나눠 조회)"""
+        found: Dict[str, tuple] = {}
+        for i in range(0, len(keys), 500):
+            chunk = keys[i : i + 500]
+            marks = ",".join("?" * len(chunk))
+            cur = self._conn.execute(
+                f"SELECT key, {', '.join(CHANGE_FIELDS)} FROM articles WHERE key IN ({marks})",
+                chunk,
+            )
+            found.update((k, tuple(vals)) for k, *vals in cur)
+        return found
+
+    def known(self, rows: Iterable[Dict[str, object]]) -> Set[str]:
+        return set(self._lookup(list({article_key(r) for r in rows} - {""})))
+
+    def changed(self, rows: Iterable[Dict[str, object]]) -> Set[str]:
+        """이미 본 글 중 비교 값(CHANGE_FIELDS)이 기록과 다른 글의 키"""
+        rows = [(article_key(r), r) for r in rows]
+        stored = self._lookup(list({k for k, _r in rows} - {""}))
+        out: Set[str] = set()
+        for k, r in rows:
+            old = stored.get(k)
+            if old is None:
+                continue
+            for (name, norm), before in zip(CHANGE_FIELDS.items(), old):
+                before, now = norm(before), norm(r.get(name))
+                if before is not None and now is not None and before != now:
+                    out.add(k)
+                    break
+        return out
+
+    def last_crawled(self, row: Dict[str, object]) -> Optional[float]:
+        cur = self._conn.execute(
+            "SELECT last_crawled FROM articles WHERE key = ?", (article_key(row),)
+        )
+        hit = cur.fetchone()
+        return hit[0] if hit else None
+
+    def mark(self, rows: Iterable[Dict[str, object]], when: Optional[float] = None) -> int:
+        now = time.time() if when is None else when
+        params: List[tuple] = [
+            (k, str(r.get("article_no") or ""), str(r.get("url") or ""), r.get("title"), now)
+            + tuple(norm(r.get(name)) for name, norm in CHANGE_FIELDS.items())
+            for r in rows
+            if (k := article_key(r))
+        ]
+        # 비교 값은 행에 있을 때만 갱신 (없으면 이전 기록 유지)
+        keep = ", ".join(f"{n} = COALESCE(excluded.{n}, {n})" for n in CHANGE_FIELDS)
+        self._conn.executemany(
+            f"INSERT INTO articles (key, article_no, url, title, last_crawled, "
+            f"{', '.join(CHANGE_FIELDS)}) VALUES ({', '.join('?' * (5 + len(CHANGE_FIELDS)))}) "
+            "ON CONFLICT(key) DO UPDATE SET url = excluded.url, title = excluded.title, "
+            f"last_crawled = excluded.last_crawled, {keep}",
+            params,
+        )
+        self._conn.commit()
+        return len(params)
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> "ArticleIndex":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
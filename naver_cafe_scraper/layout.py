@@ -0,0 +1,127 @@
+# naver_cafe_scraper/layout.py
+"""
+게시판별 레이아웃 프로필 (스킨/셀렉터를 1회 탐지 후 캐시)
+- list_frame / detail_frame : 콘텐츠가 iframe#cafe_main 안(True)인지 메인 DOM(False)인지
+- list_skin                 : "new"(table.article-table) | "old"(a.article, a.tit)
+- 게시판 키(카페 id + 메뉴 id)별로 JSON 파일에 저장, ttl_sec 이 지나면 다시 탐지
+- None 인 항목은 미탐지 → 크롤러가 전체 탐색 후 기록, 추출 결과가 비면 해당 항목만 초기화
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import time
+from dataclasses import asdict, dataclass, fields
+from typing import Dict, List, Optional
+from urllib.parse import unquote, urlparse
+
+from .utils import ensure_dir
+
+# 목록 스킨별 행 셀렉터 (readiness 대기/추출 폴백과 같은 셀렉터)
+LIST_ROW_SELECTORS: Dict[str, str] = {
+    "new": "table.article-table tbody > tr",
+    "old": "a.article, a.tit",
+}
+
+_CAFES_RE = re.compile(r"/cafes/(\d+)(?:/menus/(\d+))?")
+_CLUB_RE = re.compile(r"clubid=(\d+)", re.I)
+_MENU_RE = re.compile(r"menuid=(\d+)", re.I)
+
+
+def board_key(url: str) -> str:
+    """
+    게시판 식별 키 "카페id:메뉴id"
+    - 신주소 /f-e/cafes/<cafe>/menus/<menu>, 구주소 ?search.clubid=..&search.menuid=..
+    - 어느 쪽도 아니면 host + path
+    """
+    u = unquote(url or "")
+    m = _CAFES_RE.search(u)
+    if m:
+        return f"{m.group(1)}:{m.group(2) or ''}"
+    club = _CLUB_RE.search(u)
+    if club:
+        menu = _MENU_RE.search(u)
+        return f"{club.group(1)}:{menu.group(1) if menu else ''}"
+    parsed = urlparse(u)
+    return f"{parsed.hostname or ''}{parsed.path}"
+
+
+def infer_list_skin(rows: List[Dict[str, object]]) -> Optional[str]:
+    """목록 추출 결과로 스킨 판별 (신스킨 row 에만 article_no 가 있음)"""
+    if not rows:
+        return None
+    return "new" if any("article_no" in r for r in rows) else "old"
+
+
+@dataclass
+class LayoutProfile:
+    board_key: str
+    list_frame: Optional[bool] = None
+    list_skin: Optional[str] = None
+    detail_frame: Optional[bool] = None
+    detected_at: float = 0.0
+
+    @property
+    def list_row_selector(self) -> Optional[str]:
+        return LIST_ROW_SELECTORS.get(self.list_skin or "")
+
+    def record(self, **values) -> bool:
+        """None 이 아닌 값만 반영, 바뀐 항목이 있으면 detected_at 갱신 후 True"""
+        changed = False
+        for k, v in values.items():
+            if v is not None and getattr(self, k) != v:
+                setattr(self, k, v)
+                changed = True
+        if changed:
+            self.detected_at = time.time()
+        return changed
+
+    def forget(self, *names: str) -> None:
+        """탐지 결과 무효화 (다음 사용 시 전체 탐색)"""
+        for k in names:
+            setattr(self, k, None)
+
+
+class LayoutStore:
+    """
+    board_key → LayoutProfile JSON 캐시
+    path 가 비어 있으면 메모리에만 보관
+    """
+
+    def __init__(self, path: Optional[str], ttl_sec: float = 7 * 24 * 3600):
+        self.path = path or None
+        self.ttl_sec = ttl_sec
+        self._profiles: Dict[str, Dict[str, object]] = self._load()
+
+    def _load(self) -> Dict[str, Dict[str, object]]:
+        if not self.path or not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def get(self, key: str) -> LayoutProfile:
+        """캐시된 프로필 (없거나 만료/손상이면 빈 프로필)"""
+        raw = self._profiles.get(key)
+        if isinstance(raw, dict):
+            known = {f.name for f in fields(LayoutProfile)}
+            profile = LayoutProfile(**{k: v for k, v in raw.items() if k in known})
+            if time.time() - float(profile.detected_at or 0) < self.ttl_sec:
+                profile.board_key = key
+                return profile
+        return LayoutProfile(key)
+
+    def save(self, profile: LayoutProfile) -> None:
+        self._profiles[profile.board_key] = asdict(profile)
+        if not self.path:
+            return
+        ensure_dir(os.path.dirname(os.path.abspath(self.path)))
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self._profiles, f, ensure_ascii=False, indent=2)
+        os.replace(tmp, self.path)
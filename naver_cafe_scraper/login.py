@@ -61,3 +61,33 @@ def prompt_login_and_persist(
         ensure_dir(os.path.dirname(state_path))
         context.storage_state(path=state_path)
         print(f"[login] 기존 로그인 세션 유지, 저장됨: {state_path}")
+
+
+async def aprompt_login_and_persist(
+    page,
+    context,
+    state_path: str,
+    wait_sec: int = 1,
+) -> None:
+    """prompt_login_and_persist의 비동기 버전 (playwright.async_api Page/BrowserContext)"""
+    try:
+        login_btn = await page.query_selector("a#gnb_login_button, a.link_login, .link_login")
+    except Exception:
+        login_btn = None
+
+    if login_btn:
+        print(f"[login] 네이버 로그인 필요: 브라우저에서 로그인 후 {wait_sec}초 대기...")
+        try:
+            await login_btn.click()
+        except Exception:
+            pass
+
+        await page.wait_for_timeout(wait_sec * 1000)
+
+        ensure_dir(os.path.dirname(state_path))
+        await context.storage_state(path=state_path)
+        print(f"[login] 세션 저장됨: {state_path}")
+    else:
+        ensure_dir(os.path.dirname(state_path))
+        await context.storage_state(path=state_path)
+        print(f"[login] 기존 로그인 세션 유지, 저장됨: {state_path}")
@@ -0,0 +1,146 @@
+# naver_cafe_scraper/network.py
+"""
+네트워크 요청 차단 프로필 (route interception)
+- list-lite   : 목록 페이지용. 이미지/미디어/폰트/서드파티/광고·트래킹 요청 차단
+- detail-lite : 상세 페이지용(OCR 미사용). list-lite 와 동일
+- detail-ocr  : 상세 페이지용(OCR 사용). 본문 이미지 호스트의 이미지만 허용
+- none        : 차단 없음
+BrowserContext/Page 어느 쪽에든 설치 가능 (page.route 가 context.route 보다 우선)
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Tuple
+from urllib.parse import urlparse
+
+# 네이버 자체 도메인(이외는 서드파티)
+FIRST_PARTY_SUFFIXES: Tuple[str, ...] = ("naver.com", "naver.net", "pstatic.net")
+
+# 네이버 도메인이지만 본문과 무관한 광고/통계 비콘
+TRACKER_HOST_SUFFIXES: Tuple[str, ...] = ("veta.naver.com", "lcs.naver.com", "nlog.naver.com")
+
+# 게시글 본문 이미지 호스트 (cafeptthumb-phinf, blogfiles-phinf 등 → 단순 접미사 비교)
+CONTENT_IMAGE_HOST_SUFFIXES: Tuple[str, ...] = ("phinf.pstatic.net", "cafefiles.pstatic.net")
+
+
+@dataclass(frozen=True)
+class RouteProfile:
+    name: str
+    block_types: FrozenSet[str] = frozenset()
+    block_third_party: bool = False
+    block_trackers: bool = False
+    # 비어있지 않으면 image 요청은 이 호스트들만 허용
+    image_host_suffixes: Tuple[str, ...] = ()
+
+
+_LITE_TYPES = frozenset({"image", "media", "font"})
+
+ROUTE_PROFILES: Dict[str, RouteProfile] = {
+    "none": RouteProfile("none"),
+    "list-lite": RouteProfile(
+        "list-lite", block_types=_LITE_TYPES, block_third_party=True, block_trackers=True
+    ),
+    "detail-lite": RouteProfile(
+        "detail-lite", block_types=_LITE_TYPES, block_third_party=True, block_trackers=True
+    ),
+    "detail-ocr": RouteProfile(
+        "detail-ocr",
+        block_types=frozenset({"media", "font"}),
+        block_third_party=True,
+        block_trackers=True,
+        image_host_suffixes=CONTENT_IMAGE_HOST_SUFFIXES,
+    ),
+}
+
+
+def _host_matches(host: str, suffixes: Tuple[str, ...]) -> bool:
+    return any(host == s or host.endswith("." + s) for s in suffixes)
+
+
+class RouteBlocker:
+    """
+    프로필 기반 요청 차단기 + 허용/차단 카운터(리소스 타입별)
+
+    blocker = RouteBlocker("list-lite", first_party_hosts=("cafe.example",))
+    blocker.install(page)          # sync API
+    await blocker.ainstall(page)   # async API
+    blocker.summary()              # {"profile": ..., "allowed": n, "blocked": n, ...}
+
+    first_party_hosts: 네이버 도메인 외에 자사 도메인으로 취급할 호스트(크롤 시작 URL 등)
+    """
+
+    def __init__(self, profile: str | RouteProfile, first_party_hosts: Tuple[str, ...] = ()):
+        if isinstance(profile, str):
+            if profile not in ROUTE_PROFILES:
+                raise ValueError(f"알 수 없는 route 프로필: {profile}")
+            profile = ROUTE_PROFILES[profile]
+        self.profile = profile
+        self.first_party = FIRST_PARTY_SUFFIXES + tuple(h.lower() for h in first_party_hosts if h)
+        self.allowed: Counter = Counter()
+        self.blocked: Counter = Counter()
+
+    @property
+    def enabled(self) -> bool:
+        p = self.profile
+        return bool(
+            p.block_types or p.block_third_party or p.block_trackers or p.image_host_suffixes
+        )
+
+    def decide(self, url: str, resource_type: str) -> bool:
+        """True=허용, False=차단"""
+        parsed = urlparse(url or "")
+        if parsed.scheme not in ("http", "https"):
+            return True  # data:, blob:, about: 등은 네트워크 요청 아님
+        host = (parsed.hostname or "").lower()
+        p = self.profile
+        if p.block_trackers and _host_matches(host, TRACKER_HOST_SUFFIXES):
+            return False
+        if p.block_third_party and not _host_matches(host, self.first_party):
+            return False
+        if resource_type == "image" and p.image_host_suffixes:
+            return host.endswith(p.image_host_suffixes)
+        return resource_type not in p.block_types
+
+    def _count(self, route) -> bool:
+        req = route.request
+        rtype = req.resource_type
+        ok = self.decide(req.url, rtype)
+        (self.allowed if ok else self.blocked)[rtype] += 1
+        return ok
+
+    # ------------------------------------------------------------------
+    # Route handlers
+    # ------------------------------------------------------------------
+    def handle(self, route) -> None:
+        if self._count(route):
+            route.continue_()
+        else:
+            route.abort()
+
+    async def ahandle(self, route) -> None:
+        if self._count(route):
+            await route.continue_()
+        else:
+            await route.abort()
+
+    def install(self, target) -> None:
+        """target: sync BrowserContext 또는 Page (route 미지원 객체면 무시)"""
+        route_fn = getattr(target, "route", None)
+        if self.enabled and callable(route_fn):
+            route_fn("**/*", self.handle)
+
+    async def ainstall(self, target) -> None:
+        """target: async BrowserContext 또는 Page (route 미지원 객체면 무시)"""
+        route_fn = getattr(target, "route", None)
+        if self.enabled and callable(route_fn):
+            await route_fn("**/*", self.ahandle)
+
+    def summary(self) -> Dict[str, object]:
+        return {
+            "profile": self.profile.name,
+            "allowed": sum(self.allowed.values()),
+            "blocked": sum(self.blocked.values()),
+            "blocked_by_type": dict(self.blocked),
+        }
@@ -0,0 +1,698 @@
+# naver_cafe_scraper/ocr.py
+"""
+OCR 워커 풀 (크롤 루프와 분리된 OCR 단계) + OCR 결과 캐시
+- 크롤러는 본문 이미지 bytes 만 넘기고 바로 다음 상세로 진행
+- 전처리/Tesseract 는 프로세스 풀에서 수행 (CPU 작업 ↔ 브라우저 I/O 겹치기)
+- 대기 중인 작업 수는 max_pending 으로 제한 → 가득 차면 submit 이 빈 자리를 기다림
+- 캐시(SQLite): 이미지 URL / 픽셀 해시 + OCR 설정 → 텍스트, 용량 초과 시 오래 안 쓴 것부터 삭제
+- 이미지 입력: 원본 src 를 BrowserContext.request 로 직접 다운로드 (실패한 이미지만 스크린샷)
+  수집 후 OCR(scripts/run_ocr.py)은 requests.Session 으로 다운로드
+- 게이트: 너무 작은/단색/글자 없어 보이는 이미지와 이미 OCR 한 이미지(dHash)는 OCR 생략
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import hashlib
+import multiprocessing
+import os
+import sqlite3
+import threading
+import time
+from collections import Counter
+from concurrent.futures import (
+    CancelledError,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from io import BytesIO
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+from urllib.parse import unquote_to_bytes
+
+from .parser import (
+    _OCR_THRESH,
+    _OCR_TILE_THREADS,
+    _dedup_keep_order,
+    _ocr_png_bytes,
+    init_ocr_worker,
+    ocr_settings_key,
+)
+from .utils import ensure_dir
+
+# (이미지 src, 캡처 bytes)
+ImageItem = Tuple[str, bytes]
+
+_CACHE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS ocr_cache (
+    key     TEXT PRIMARY KEY,
+    text    TEXT NOT NULL,
+    used_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ocr_cache_used_at ON ocr_cache (used_at);
+"""
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _open_image(data: bytes):
+    """bytes → 디코딩된 PIL 이미지 (실패 시 None)"""
+    try:
+        from PIL import Image
+
+        im = Image.open(BytesIO(data))
+        im.load()
+        return im
+    except Exception:
+        return None
+
+
+def pixel_digest(data: bytes, im=None) -> str:
+    """
+    디코딩한 픽셀 기준 해시 (같은 그림이면 PNG 인코딩이 달라도 같은 값), 실패 시 bytes 해시
+    im: 이미 디코딩한 이미지가 있으면 재사용
+    """
+    im = im if im is not None else _open_image(data)
+    if im is None:
+        return _digest(data)
+    return _digest(f"{im.mode}{im.size}".encode() + im.tobytes())
+
+
+class OcrCache:
+    """
+    OCR 결과 캐시 (SQLite, 스레드 안전)
+    - 키: "url:<설정>:<src>" 와 "px:<설정>:<픽셀 해시>" 둘 다 기록
+      → URL 이 같으면 캡처 없이, URL 이 달라도 같은 그림이면 OCR 없이 재사용
+    - 설정(ocr_settings_key) 이 바뀌면 키가 달라져 자연히 다시 OCR
+    - 빈 OCR 결과("")도 저장 (글자 없는 배너를 다시 OCR 하지 않음)
+    - max_entries 초과 시 used_at 이 오래된 항목부터 삭제 (LRU)
+    """
+
+    def __init__(self, path: str, max_entries: int = 100_000, settings: Optional[str] = None):
+        self.path = path
+        self.max_entries = max(1, int(max_entries))
+        self.settings = _digest((settings or ocr_settings_key()).encode())[:12]
+        if path != ":memory:":
+            ensure_dir(os.path.dirname(os.path.abspath(path)))
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript(_CACHE_SCHEMA)
+        self._conn.commit()
+        self._lock = threading.Lock()
+        self._puts = 0
+        self.stats: Dict[str, int] = {"url_hits": 0, "pixel_hits": 0, "misses": 0, "evicted": 0}
+
+    def url_key(self, src: str) -> Optional[str]:
+        if not src:
+            return None
+        # data: URI 는 길이가 크므로 해시로
+        return f"url:{self.settings}:{_digest(src.encode()) if src.startswith('data:') else src}"
+
+    def pixel_key(self, data: bytes, im=None) -> Optional[str]:
+        return f"px:{self.settings}:{pixel_digest(data, im)}" if data else None
+
+    def keys(self, src: str, data: bytes, im=None) -> List[str]:
+        return [k for k in (self.url_key(src), self.pixel_key(data, im)) if k]
+
+    def has_url(self, src: str) -> bool:
+        """캡처 생략 여부 판단용 (적중 통계에는 넣지 않음)"""
+        key = self.url_key(src)
+        if key is None:
+            return False
+        with self._lock:
+            hit = self._conn.execute("SELECT 1 FROM ocr_cache WHERE key = ?", (key,)).fetchone()
+        return hit is not None
+
+    def get(self, keys: List[str]) -> Optional[str]:
+        """keys 순서대로 조회, 적중하면 used_at 갱신 + 빠진 키(예: 새 URL) 채움"""
+        with self._lock:
+            for key in keys:
+                hit = self._conn.execute(
+                    "SELECT text FROM ocr_cache WHERE key = ?", (key,)
+                ).fetchone()
+                if hit is None:
+                    continue
+                self.stats["url_hits" if key.startswith("url:") else "pixel_hits"] += 1
+                self._upsert(keys, hit[0])
+                return hit[0]
+            self.stats["misses"] += 1
+            return None
+
+    def put(self, keys: List[str], text: str) -> None:
+        with self._lock:
+            self._upsert(keys, text)
+            self._puts += 1
+            if self._puts % 256 == 0:
+                self._evict()
+
+    def _upsert(self, keys: List[str], text: str) -> None:
+        now = time.time()
+        self._conn.executemany(
+            "INSERT INTO ocr_cache (key, text, used_at) VALUES (?, ?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET text = excluded.text, used_at = excluded.used_at",
+            [(k, text, now) for k in keys],
+        )
+        self._conn.commit()
+
+    def _evict(self) -> None:
+        """max_entries 의 90% 까지 오래된 항목 삭제 (매번 한두 개씩 지우지 않도록 여유분)"""
+        count = self._conn.execute("SELECT COUNT(*) FROM ocr_cache").fetchone()[0]
+        if count <= self.max_entries:
+            return
+        drop = count - int(self.max_entries * 0.9)
+        self._conn.execute(
+            "DELETE FROM ocr_cache WHERE key IN "
+            "(SELECT key FROM ocr_cache ORDER BY used_at LIMIT ?)",
+            (drop,),
+        )
+        self._conn.commit()
+        self.stats["evicted"] += drop
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM ocr_cache").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._evict()
+            self._conn.close()
+
+    def __enter__(self) -> "OcrCache":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class ImageFetcher:
+    """
+    본문 이미지 원본 bytes 다운로드 (BrowserContext.request = APIRequestContext)
+    - 브라우저 컨텍스트의 쿠키/연결을 그대로 재사용, 렌더링/스크롤/래스터화 없음
+    - 화면에 축소 표시된 크기가 아닌 원본 해상도 → Tesseract 입력 품질도 좋아짐
+    - data: URI 는 네트워크 없이 디코딩
+    - 비 2xx / 이미지가 아닌 응답 / max_bytes 초과 / 예외 → None (호출 측이 스크린샷으로 폴백)
+    - async(afetch)는 concurrency 개까지 동시 다운로드, sync(fetch)는 순차
+
+    fetcher = ImageFetcher(context.request)
+    data = fetcher.fetch(src)          # sync API
+    data = await fetcher.afetch(src)   # async API
+    """
+
+    def __init__(
+        self,
+        request,
+        concurrency: int = 4,
+        timeout_ms: int = 10000,
+        max_bytes: int = 20 * 1024 * 1024,
+        referer: str = "https://cafe.naver.com/",
+    ):
+        self.request = request
+        self.concurrency = max(1, int(concurrency))
+        self.timeout_ms = timeout_ms
+        self.max_bytes = max_bytes
+        self.headers = {"Referer": referer} if referer else {}
+        self._sem: Optional[asyncio.Semaphore] = None
+        self.stats: Dict[str, int] = {"fetched": 0, "failed": 0}
+
+    @staticmethod
+    def _decode_data_uri(src: str) -> Optional[bytes]:
+        head, _, payload = src.partition(",")
+        try:
+            if head.endswith(";base64"):
+                return base64.b64decode(payload)
+            return unquote_to_bytes(payload)
+        except ValueError:
+            return None
+
+    def _accept(self, status_ok: bool, headers: Dict[str, str], body: bytes) -> Optional[bytes]:
+        ctype = (headers.get("content-type") or "").lower()
+        if not status_ok or not body or len(body) > self.max_bytes:
+            return None
+        if ctype and not ctype.startswith(("image/", "application/octet-stream")):
+            return None
+        return body
+
+    def _count(self, data: Optional[bytes]) -> Optional[bytes]:
+        self.stats["fetched" if data else "failed"] += 1
+        return data
+
+    def fetch(self, src: str) -> Optional[bytes]:
+        if src.startswith("data:"):
+            return self._count(self._decode_data_uri(src))
+        if not src.startswith(("http://", "https://")):
+            return self._count(None)
+        try:
+            resp = self.request.get(src, headers=self.headers, timeout=self.timeout_ms)
+            try:
+                return self._count(self._accept(resp.ok, resp.headers, resp.body()))
+            finally:
+                resp.dispose()
+        except Exception:
+            return self._count(None)
+
+    async def afetch(self, src: str) -> Optional[bytes]:
+        if src.startswith("data:"):
+            return self._count(self._decode_data_uri(src))
+        if not src.startswith(("http://", "https://")):
+            return self._count(None)
+        if self._sem is None:
+            self._sem = asyncio.Semaphore(self.concurrency)
+        async with self._sem:
+            try:
+                resp = await self.request.get(src, headers=self.headers, timeout=self.timeout_ms)
+                try:
+                    return self._count(self._accept(resp.ok, resp.headers, await resp.body()))
+                finally:
+                    await resp.dispose()
+            except Exception:
+                return self._count(None)
+
+
+def dhash(gray) -> int:
+    """difference hash (9x8 축소 후 가로 인접 픽셀 대소 비교 64비트)"""
+    import numpy as np
+
+    small = np.asarray(gray.resize((9, 8)), dtype=np.int16)
+    bits = (small[:, 1:] > small[:, :-1]).flatten()
+    return int("".join("1" if b else "0" for b in bits), 2)
+
+
+class OcrGate:
+    """
+    OCR 전 저비용 필터 (글자가 있을 법한 이미지만 OCR), 사유별로 stats 에 집계
+    - unreadable  : 디코딩 실패
+    - too_small   : 가로/세로가 min_width/min_height 미만 (이모티콘, 1px 스페이서, 아이콘)
+    - duplicate   : dHash 해밍거리 hash_distance 이하인 이미지를 이미 OCR 에 넘김
+                    (글 안/실행 전체 기준, 먼저 넘긴 이미지의 결과를 함께 사용)
+    - low_contrast: 명암 표준편차 < min_contrast (단색/여백 이미지)
+    - no_text     : thresh 로 이진화한 뒤 행별 흑백 전환 밀도(상위 10% 행) < min_transitions
+                    (글자 줄은 전환이 촘촘하고, 사진은 큰 덩어리라 드묾)
+    판정은 가로 256px 이하로 줄인 그레이스케일에서 수행 (OCR 전처리와 같은 임계값)
+    중복 검색은 64비트 해시를 hash_distance+1 개 구간으로 나눈 버킷에서 후보만 비교
+    (해밍거리 hash_distance 이하면 적어도 한 구간은 정확히 같음 → 전체 선형 탐색 없음)
+    OcrWorkerPool 에서는 사전 점검 스레드 1개에서만 호출됨
+    """
+
+    def __init__(
+        self,
+        min_width: int = 40,
+        min_height: int = 16,
+        min_contrast: float = 8.0,
+        min_transitions: float = 0.04,
+        hash_distance: int = 4,
+        max_hashes: int = 50_000,
+        thresh: int = _OCR_THRESH,
+    ):
+        self.min_width = min_width
+        self.min_height = min_height
+        self.min_contrast = min_contrast
+        self.min_transitions = min_transitions
+        self.hash_distance = hash_distance
+        self.max_hashes = max_hashes
+        self.thresh = thresh
+        self._seen: Dict[int, object] = {}
+        self._bands = self._band_masks(hash_distance)
+        self._buckets: List[Dict[int, Set[int]]] = [{} for _ in self._bands]
+        self.stats: Counter = Counter()
+
+    @staticmethod
+    def _band_masks(hash_distance: int) -> List[Tuple[int, int]]:
+        """64비트를 hash_distance+1 개의 (shift, mask) 구간으로 (0 이하면 구간 없음 = 정확 일치만)"""
+        n = min(64, hash_distance + 1) if hash_distance > 0 else 0
+        bands, shift = [], 0
+        for i in range(n):
+            width = 64 // n + (1 if i < 64 % n else 0)
+            bands.append((shift, (1 << width) - 1))
+            shift += width
+        return bands
+
+    def _skip(self, reason: str) -> str:
+        self.stats[reason] += 1
+        return reason
+
+    def _match(self, h: int) -> Optional[int]:
+        if h in self._seen:
+            return h
+        for (shift, mask), buckets in zip(self._bands, self._buckets):
+            for k in buckets.get((h >> shift) & mask, ()):
+                if bin(k ^ h).count("1") <= self.hash_distance:
+                    return k
+        return None
+
+    def check(self, im) -> Tuple[Optional[str], Optional[int]]:
+        """(건너뛸 사유 또는 None, dHash — duplicate 면 먼저 본 이미지의 dHash)"""
+        import numpy as np
+        from PIL import Image
+
+        if im is None:
+            return self._skip("unreadable"), None
+        w, h = im.size
+        if w < self.min_width or h < self.min_height:
+            return self._skip("too_small"), None
+
+        scale = min(1.0, 256 / w, 4096 / h)
+        if scale < 1.0:
+            size = (max(1, int(w * scale)), max(1, int(h * scale)))
+            im = im.resize(size, Image.BILINEAR)
+        gray = im.convert("L")
+
+        dh = dhash(gray)
+        match = self._match(dh)
+        if match is not None:
+            return self._skip("duplicate"), match
+
+        a = np.asarray(gray)
+        if a.std() < self.min_contrast:
+            return self._skip("low_contrast"), dh
+        bw = a > self.thresh
+        per_row = (bw[:, 1:] != bw[:, :-1]).sum(axis=1)
+        if np.percentile(per_row, 90) / max(1, bw.shape[1] - 1) < self.min_transitions:
+            return self._skip("no_text"), dh
+
+        self.stats["passed"] += 1
+        return None, dh
+
+    def payload(self, h: int) -> object:
+        return self._seen.get(h)
+
+    def remember(self, h: int, payload: object) -> None:
+        """OCR 에 넘긴 이미지 기록 (오래된 것부터 max_hashes 개 유지)"""
+        if h not in self._seen:
+            for (shift, mask), buckets in zip(self._bands, self._buckets):
+                buckets.setdefault((h >> shift) & mask, set()).add(h)
+        self._seen[h] = payload
+        if len(self._seen) > self.max_hashes:
+            oldest = next(iter(self._seen))
+            del self._seen[oldest]
+            for (shift, mask), buckets in zip(self._bands, self._buckets):
+                key = (oldest >> shift) & mask
+                bucket = buckets[key]
+                bucket.discard(oldest)
+                if not bucket:
+                    del buckets[key]
+
+
+class _SessionResponse:
+    def __init__(self, resp):
+        self._resp = resp
+        self.ok = resp.ok
+        self.headers = resp.headers  # 대소문자 구분 없는 dict
+
+    def body(self) -> bytes:
+        return self._resp.content
+
+    def dispose(self) -> None:
+        self._resp.close()
+
+
+class SessionRequest:
+    """
+    requests.Session 을 ImageFetcher 가 쓰는 APIRequestContext 형태(get → ok/headers/body/dispose)로
+    브라우저 없이 이미지를 받을 때 사용 (연결 풀은 Session 어댑터가 관리, sync fetch 만 지원)
+
+    fetcher = ImageFetcher(SessionRequest(requests.Session()))
+    """
+
+    def __init__(self, session):
+        self.session = session
+
+    def get(self, url: str, headers: Optional[Dict[str, str]] = None, timeout: float = 10000):
+        resp = self.session.get(url, headers=headers, timeout=timeout / 1000)
+        return _SessionResponse(resp)
+
+
+def worker_tile_threads(workers: int, cpu_count: Optional[int] = None) -> int:
+    """워커 프로세스당 띠 OCR 스레드 수: 설정값과 (코어 수 // 워커 수) 중 작은 값, 최소 1"""
+    cpus = cpu_count or os.cpu_count() or 1
+    return max(1, min(_OCR_TILE_THREADS, cpus // max(1, workers)))
+
+
+def _done_future(text: str) -> Future:
+    fut: Future = Future()
+    fut.set_result(text)
+    return fut
+
+
+def _chain(src: Future, dst: Future) -> None:
+    """src 의 결과/예외를 dst 로 옮김 (dst = submit 이 먼저 돌려준 Future)"""
+    if src.cancelled():
+        dst.set_exception(CancelledError())
+    elif src.exception() is not None:
+        dst.set_exception(src.exception())
+    else:
+        dst.set_result(src.result())
+
+
+class OcrWorkerPool:
+    """
+    pool = OcrWorkerPool(workers=3)
+    futures = pool.submit_many(images)        # images: [(src, png_bytes), ...]
+    texts = OcrWorkerPool.results(futures)    # 빈 결과/실패 제외, 순서 유지 중복 제거
+    pool.close()
+
+    async 쪽은 asubmit_many / aresults (대기열 자리는 이벤트 루프 밖에서 기다림)
+    cache 가 있으면 적중한 이미지는 OCR 없이 캐시 결과로 완료, 새 결과는 완료 시 저장
+    (capture_ocr_images(target, skip=pool.skip_capture) 로 URL 적중 이미지는 캡처 생략)
+    gate 가 있으면 건너뛸 이미지는 "" 로 완료, 중복 이미지는 먼저 제출한 OCR 결과로 완료
+    디코딩/픽셀 해시/게이트 판정은 사전 점검 스레드 1개에서 수행 → submit 은 자리만 확보하고
+    바로 Future 를 반환 (크롤 스레드/이벤트 루프를 막지 않음, 판정 순서는 제출 순서대로)
+    fn/executor 는 테스트나 다른 OCR 함수용 (fn 은 프로세스 풀로 넘길 수 있어야 함)
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        max_pending: Optional[int] = None,
+        fn: Callable[[bytes], str] = _ocr_png_bytes,
+        executor: Optional[Executor] = None,
+        cache: Optional[OcrCache] = None,
+        gate: Optional[OcrGate] = None,
+    ):
+        self.workers = max(1, int(workers))
+        self.max_pending = max(1, int(max_pending or self.workers * 4))
+        self.fn = fn
+        self.cache = cache
+        self.gate = gate
+        # spawn: Playwright 드라이버 스레드가 있는 프로세스를 fork 하지 않음
+        # 기본 OCR 함수면 워커 시작 시 띠 OCR 스레드 수를 코어 수에 맞게 줄이고
+        # OCR 엔진(모델 로드)을 미리 준비
+        default_fn = fn is _ocr_png_bytes
+        self._executor = executor or ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=init_ocr_worker if default_fn else None,
+            initargs=(worker_tile_threads(self.workers),) if default_fn else (),
+        )
+        # 캐시/게이트가 있을 때만 사전 점검 스레드 사용 (없으면 submit 에서 바로 제출)
+        self._prechecker = (
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix="ocr-precheck")
+            if (cache is not None or gate is not None)
+            else None
+        )
+        # 대기열 자리: 사전 점검 중이거나 OCR 대기/진행 중인 이미지 수 (bytes 보유량 제한)
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+        self._lock = threading.Lock()
+        self.stats: Dict[str, int] = {"submitted": 0, "done": 0, "failed": 0}
+
+    def _on_done(self, fut: Future) -> None:
+        self._slots.release()
+        key = "failed" if fut.cancelled() or fut.exception() is not None else "done"
+        with self._lock:
+            self.stats[key] += 1
+
+    def _store(self, keys: List[str], fut: Future) -> None:
+        if fut.cancelled() or fut.exception() is not None:
+            return
+        try:
+            self.cache.put(keys, fut.result() or "")
+        except sqlite3.Error:
+            pass  # close(wait=False) 뒤에 끝난 작업 (캐시가 이미 닫힘)
+
+    def _submit_slot(
+        self, data: bytes, keys: Optional[List[str]] = None, dh: Optional[int] = None
+    ) -> Future:
+        """자리를 확보한 뒤 호출"""
+        try:
+            fut = self._executor.submit(self.fn, data)
+        except Exception:
+            self._slots.release()
+            raise
+        with self._lock:
+            self.stats["submitted"] += 1
+        fut.add_done_callback(self._on_done)
+        if keys:
+            fut.add_done_callback(lambda f: self._store(keys, f))
+        if dh is not None:
+            self.gate.remember(dh, fut)
+        return fut
+
+    def skip_capture(self, src: str) -> bool:
+        """URL 로 캐시 적중하는 이미지는 캡처 불필요"""
+        return self.cache is not None and self.cache.has_url(src)
+
+    def _url_only(self, src: str) -> Optional[Future]:
+        """bytes 없는 이미지(캡처 생략): URL 캐시 적중이면 완료된 Future, 아니면 None"""
+        key = self.cache.url_key(src) if self.cache is not None else None
+        text = self.cache.get([key]) if key else None
+        return _done_future(text) if text is not None else None
+
+    def _precheck(self, src: str, data: bytes) -> Tuple[Optional[Future], Optional[tuple]]:
+        """
+        제출 전 단계 (사전 점검 스레드): 캐시 → 게이트
+        반환: (바로 쓸 Future 또는 None, 새로 OCR 할 때 _submit_slot 추가 인자 또는 None)
+        """
+        im = _open_image(data) if (self.cache or self.gate) else None
+        keys = self.cache.keys(src, data, im) if self.cache is not None else []
+        text = self.cache.get(keys) if keys else None
+        if text is not None:
+            return _done_future(text), None
+        dh = None
+        if self.gate is not None:
+            reason, dh = self.gate.check(im)
+            if reason == "duplicate":
+                fut = self.gate.payload(dh)
+                if keys:
+                    fut.add_done_callback(lambda f: self._store(keys, f))
+                return fut, None
+            if reason:
+                return None, None
+        return None, (keys, dh)
+
+    def _run_precheck(self, src: str, data: bytes, out: Future) -> None:
+        """자리를 확보한 뒤 호출: 사전 점검 → 필요하면 OCR 제출, 결과는 out 으로"""
+        try:
+            fut, job = self._precheck(src, data)
+        except BaseException as e:
+            self._slots.release()
+            out.set_exception(e)
+            return
+        if job is None:
+            # 캐시 적중/중복/건너뜀: OCR 을 하지 않으므로 자리 반납
+            self._slots.release()
+            if fut is None:
+                out.set_result("")
+                return
+        else:
+            try:
+                fut = self._submit_slot(data, *job)
+            except BaseException as e:
+                out.set_exception(e)
+                return
+        fut.add_done_callback(lambda f: _chain(f, out))
+
+    def _start(self, src: str, data: bytes) -> Future:
+        """자리를 확보한 뒤 호출"""
+        if self._prechecker is None:
+            return self._submit_slot(data)
+
+        out: Future = Future()
+        out.set_running_or_notify_cancel()  # 호출 측 cancel() 로 끊기지 않음
+
+        def cancelled(task: Future) -> None:
+            # close(wait=False) 로 사전 점검 전에 취소됨
+            if task.cancelled():
+                self._slots.release()
+                out.set_exception(CancelledError())
+
+        try:
+            task = self._prechecker.submit(self._run_precheck, src, data, out)
+        except Exception:
+            self._slots.release()
+            raise
+        task.add_done_callback(cancelled)
+        return out
+
+    # ------------------------------------------------------------------
+    # sync
+    # ------------------------------------------------------------------
+    def submit(self, data: bytes, src: str = "") -> Optional[Future]:
+        """
+        bytes 가 있으면 자리를 확보(가득 차면 대기)하고 바로 Future 반환
+        (캐시 적중 → 캐시 결과, 중복 이미지 → 먼저 제출한 OCR 결과, 게이트에서 건너뜀 → "")
+        bytes 없음(캡처 생략) → URL 캐시 적중이면 완료된 Future, 아니면 None
+        """
+        if not data:
+            return self._url_only(src)
+        self._slots.acquire()
+        return self._start(src, data)
+
+    def submit_many(self, images: Iterable[ImageItem]) -> List[Future]:
+        futures = (self.submit(data, src) for src, data in images)
+        return [f for f in futures if f is not None]
+
+    @staticmethod
+    def results(futures: Iterable[Future]) -> List[str]:
+        texts: List[str] = []
+        for fut in futures:
+            try:
+                txt = fut.result()
+            except Exception:
+                continue
+            if txt:
+                texts.append(txt)
+        return _dedup_keep_order(texts)
+
+    # ------------------------------------------------------------------
+    # async
+    # ------------------------------------------------------------------
+    async def _aacquire_slot(self) -> None:
+        """
+        대기열 자리를 이벤트 루프 밖(스레드)에서 기다림
+        기다리는 중 태스크가 취소되면, 스레드가 나중에 잡은 자리를 바로 반납
+        """
+        if self._slots.acquire(blocking=False):
+            return
+        lock = threading.Lock()
+        state = {"cancelled": False, "acquired": False}
+
+        def acquire() -> None:
+            self._slots.acquire()
+            with lock:
+                if state["cancelled"]:
+                    self._slots.release()
+                else:
+                    state["acquired"] = True
+
+        try:
+            await asyncio.to_thread(acquire)
+        except asyncio.CancelledError:
+            with lock:
+                state["cancelled"] = True
+                if state["acquired"]:
+                    self._slots.release()
+            raise
+
+    async def asubmit(self, data: bytes, src: str = "") -> Optional[Future]:
+        if not data:
+            return self._url_only(src)
+        await self._aacquire_slot()
+        return self._start(src, data)
+
+    async def asubmit_many(self, images: Iterable[ImageItem]) -> List[Future]:
+        futures = [await self.asubmit(data, src) for src, data in images]
+        return [f for f in futures if f is not None]
+
+    @staticmethod
+    async def aresults(futures: Iterable[Future]) -> List[str]:
+        futures = list(futures)
+        await asyncio.gather(*(asyncio.wrap_future(f) for f in futures), return_exceptions=True)
+        return OcrWorkerPool.results(futures)
+
+    # ------------------------------------------------------------------
+    def close(self, wait: bool = True) -> None:
+        """wait=False 면 아직 시작하지 않은 작업은 취소 (캐시도 함께 닫음)"""
+        # 사전 점검을 먼저 끝내야 남은 OCR 제출까지 마친 뒤 워커 풀이 닫힘
+        if self._prechecker is not None:
+            self._prechecker.shutdown(wait=wait, cancel_futures=not wait)
+        self._executor.shutdown(wait=wait, cancel_futures=not wait)
+        if self.cache is not None:
+            self.cache.close()
+
+    def __enter__(self) -> "OcrWorkerPool":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
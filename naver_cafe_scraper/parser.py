@@ -1,9 +1,18 @@
 # naver_cafe_scraper/parser.py
 from __future__ import annotations
 
+import asyncio
+import importlib.util
+import json
+import math
 import os
 import re
-from typing import Dict, List, Tuple, Optional
+import threading
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from difflib import SequenceMatcher
+from functools import lru_cache
+from typing import Callable, Dict, List, Tuple, Optional
 
 from .utils import clean_for_kobert
 
@@ -19,32 +28,34 @@ _OCR_SCALE = 1.0  # 배율(1.0 = 원본)
 _OCR_FILTER = "unsharp"  # "unsharp" 고정
 _OCR_THRESH = 160  # 이진화 임계값(0~255)
 _OCR_DPI = 300  # DPI 메타데이터 힌트
+# 세로로 긴 이미지는 겹치는 가로 띠로 나눠 병렬 OCR (띠 높이 0 = 나누지 않음)
+_OCR_TILE_HEIGHT = int(os.getenv("NCS_OCR_TILE_HEIGHT", "2000"))
+_OCR_TILE_OVERLAP = int(os.getenv("NCS_OCR_TILE_OVERLAP", "120"))
+_OCR_TILE_THREADS = int(os.getenv("NCS_OCR_TILE_THREADS", str(min(4, os.cpu_count() or 1))))
+# 가로 폭 상한(px, 넘으면 비율 유지 축소, 0 = 제한 없음)
+_OCR_MAX_WIDTH = int(os.getenv("NCS_OCR_MAX_WIDTH", "0"))
+# 스크린샷 캡처 방식: batch(이미지 위치를 한 번에 읽고 페이지 스크린샷 몇 장에서 잘라냄)
+#                   | element(이미지마다 요소 스크린샷)
+_OCR_CAPTURE = os.getenv("NCS_OCR_CAPTURE", "batch").lower()
+_OCR_CAPTURE_SEGMENT = int(os.getenv("NCS_OCR_CAPTURE_SEGMENT", "4000"))  # 1장 최대 높이(CSS px)
 
 # Tesseract 실행 파일(있으면 사용)
 _TESSERACT_CMD = os.getenv(
     "NCS_TESSERACT_CMD", r"C:\Program Files\Tesseract-OCR\tesseract.exe"
 )
+# OCR 엔진: auto(tesserocr 있으면 사용, 없으면 pytesseract) | tesserocr | pytesseract
+_OCR_ENGINE = os.getenv("NCS_OCR_ENGINE", "auto").lower()
 # 환경변수로 OCR 껐다 켰다 하고 싶으면 사용 (없으면 기본 True)
 _OCR_ENABLED_ENV = os.getenv("NCS_OCR", "").lower() in {"1", "true", "yes", "y"}
 
+# 파싱 모드: "evaluate"(페이지 내 스크립트 1회 실행) | "html"(content() 후 오프라인 파싱)
+#           | "dom"(요소별 query_selector)
+_PARSE_MODE = os.getenv("NCS_PARSE_MODE", "evaluate").lower()
+
 
 # -----------------------------------------------------------------------------
 # 공통 유틸
 # -----------------------------------------------------------------------------
-def _text(el) -> str:
-    """Playwright ElementHandle/Locator에서 텍스트 안전 추출"""
-    if not el:
-        return ""
-    try:
-        return el.inner_text().strip()
-    except Exception:
-        try:
-            t = el.text_content()
-            return t.strip() if t else ""
-        except Exception:
-            return ""
-
-
 def _int_from_text(s: str) -> int:
     m = re.search(r"\d[\d,]*", s or "")
     return int(m.group(0).replace(",", "")) if m else 0
@@ -60,178 +71,388 @@ def _dedup_keep_order(seq: List[str]) -> List[str]:
 
 
 # -----------------------------------------------------------------------------
-# 목록 파서
+# DOM 단계 (동기/비동기 공용)
+# - DOM 순회 로직은 제너레이터로 한 번만 작성하고, Playwright 호출은 단계로 yield
+# - _run_steps 는 sync 핸들로 바로 호출, _arun_steps 는 async 핸들 결과를 await
+# - 호출 예외는 제너레이터 안으로 다시 던지므로 try/except 는 평소처럼 작성
 # -----------------------------------------------------------------------------
-def extract_posts_from_frame(target) -> List[Dict[str, object]]:
+class _Call:
+    """핸들 메서드 호출 단계"""
+
+    __slots__ = ("obj", "name", "args", "kwargs")
+
+    def __init__(self, obj, name: str, *args, **kwargs):
+        self.obj, self.name, self.args, self.kwargs = obj, name, args, kwargs
+
+    def run(self):
+        return getattr(self.obj, self.name)(*self.args, **self.kwargs)
+
+    async def arun(self):
+        return await getattr(self.obj, self.name)(*self.args, **self.kwargs)
+
+
+class _Offload:
+    """CPU 작업 단계 (async 에서는 워커 스레드에서 수행)"""
+
+    __slots__ = ("fn", "args")
+
+    def __init__(self, fn: Callable, *args):
+        self.fn, self.args = fn, args
+
+    def run(self):
+        return self.fn(*self.args)
+
+    async def arun(self):
+        return await asyncio.to_thread(self.fn, *self.args)
+
+
+class _Fetch:
     """
-    게시판 목록에서 글 목록 추출
-    - 신스킨(table.article-table) 우선, 없으면 구스킨(a.article, a.tit 등) 대응
-    반환: [{article_no,title,url,author,date,read_count,like_count}, ...]
+    이미지 원본 다운로드 단계 → src 별 bytes (skip 적중은 b"", 실패/미사용은 None)
+    sync 는 순서대로, async 는 동시에 (fetch 는 각각 sync/async 함수)
     """
-    rows: List[Dict[str, object]] = []
 
-    # 1) 신스킨: table.article-table
+    __slots__ = ("srcs", "skip", "fetch")
+
+    def __init__(self, srcs: List[str], skip, fetch):
+        self.srcs, self.skip, self.fetch = srcs, skip, fetch
+
+    def _skipped(self, src: str) -> bool:
+        return bool(self.skip and src and self.skip(src))
+
+    def run(self) -> List[Optional[bytes]]:
+        out: List[Optional[bytes]] = []
+        for src in self.srcs:
+            try:
+                if self._skipped(src):
+                    out.append(b"")
+                else:
+                    out.append(self.fetch(src) if (self.fetch and src) else None)
+            except Exception:
+                out.append(None)
+        return out
+
+    async def arun(self) -> List[Optional[bytes]]:
+        async def one(src: str) -> Optional[bytes]:
+            try:
+                if self._skipped(src):
+                    return b""
+                return await self.fetch(src) if (self.fetch and src) else None
+            except Exception:
+                return None
+
+        return list(await asyncio.gather(*(one(src) for src in self.srcs)))
+
+
+def _run_steps(steps):
+    """DOM 단계 제너레이터를 sync 핸들로 실행 → 제너레이터 반환값"""
+    value, error = None, None
+    while True:
+        try:
+            step = steps.throw(error) if error else steps.send(value)
+        except StopIteration as stop:
+            return stop.value
+        value, error = None, None
+        try:
+            value = step.run()
+        except Exception as e:
+            error = e
+
+
+async def _arun_steps(steps):
+    """_run_steps 의 비동기 버전 (async 핸들)"""
+    value, error = None, None
+    while True:
+        try:
+            step = steps.throw(error) if error else steps.send(value)
+        except StopIteration as stop:
+            return stop.value
+        value, error = None, None
+        try:
+            value = await step.arun()
+        except Exception as e:
+            error = e
+
+
+def _text_steps(el):
+    """ElementHandle/Locator 에서 텍스트 안전 추출"""
+    if not el:
+        return ""
     try:
-        table = target.query_selector("table.article-table")
-        if table:
-            trs = table.query_selector_all("tbody > tr")
-            for tr in trs:
-                no = _text(tr.query_selector("td.type_articleNumber")) or ""
-                a = tr.query_selector("a.article")
-                title = _text(a)
-                url = a.get_attribute("href") if a else ""
-                author = _text(tr.query_selector(".ArticleBoardWriterInfo .nickname"))
-                date = _text(tr.query_selector("td.type_date"))
-                rc = _int_from_text(_text(tr.query_selector("td.type_readCount")))
-                lc = _int_from_text(_text(tr.query_selector("td.type_likeCount")))
-                if title and url:
-                    rows.append(
-                        {
-                            "article_no": no,
-                            "title": title,
-                            "url": url,
-                            "author": author,
-                            "date": date,
-                            "read_count": rc,
-                            "like_count": lc,
-                        }
-                    )
-            if rows:
-                return rows
+        return (yield _Call(el, "inner_text")).strip()
     except Exception:
-        pass
+        try:
+            t = yield _Call(el, "text_content")
+            return t.strip() if t else ""
+        except Exception:
+            return ""
 
-    # 2) 구스킨(보수적)
+
+def _query_text_steps(target, selectors: List[str]):
+    """셀렉터를 순서대로 시도해 처음 찾은 요소의 텍스트"""
+    for sel in selectors:
+        try:
+            el = yield _Call(target, "query_selector", sel)
+        except Exception:
+            continue
+        if el:
+            return (yield from _text_steps(el))
+    return ""
+
+
+def _query_all_steps(root, css: str):
+    """querySelectorAll (실패 시 빈 리스트)"""
     try:
-        links = target.query_selector_all("a.article, a.tit")
-        for a in links:
-            title = _text(a)
-            url = a.get_attribute("href") or ""
-            if title and url:
-                rows.append({"title": title, "url": url})
+        return (yield _Call(root, "query_selector_all", css)) or []
     except Exception:
-        pass
-
-    return rows
+        return []
 
 
 # -----------------------------------------------------------------------------
-# 상세 파서(내부 헬퍼)
+# 목록 파서
 # -----------------------------------------------------------------------------
-def _find_content_root(target):
-    """본문 루트 노드(CafeViewer 혹은 se-viewer)"""
-    try:
-        return target.query_selector("div.CafeViewer") or target.query_selector(
-            "div.se-viewer"
-        )
-    except Exception:
-        return None
+# 목록 셀렉터 (evaluate 스크립트, DOM 폴백, html_parser 가 모두 이 표를 사용)
+_LIST_SEL: Dict[str, object] = {
+    "table": "table.article-table",
+    "row": "tbody > tr",
+    "link": "a.article",
+    "cells": {
+        "article_no": "td.type_articleNumber",
+        "head": "a.article .head",
+        "author": ".ArticleBoardWriterInfo .nickname",
+        "date": "td.type_date",
+        "read_count": "td.type_readCount",
+        "like_count": "td.type_likeCount",
+    },
+    "old_links": "a.article, a.tit",
+}
 
+# 목록 전체를 한 번의 evaluate 로 수집 (셀렉터는 _LIST_SEL 을 스크립트에 그대로 삽입)
+_LIST_JS = r"""
+() => {
+  const S = __SELECTORS__;
+  const txt = (el) => {
+    if (!el) return "";
+    const t = typeof el.innerText === "string" ? el.innerText : el.textContent;
+    return (t || "").trim();
+  };
+  const rows = [];
+  const table = document.querySelector(S.table);
+  if (table) {
+    for (const tr of table.querySelectorAll(S.row)) {
+      const a = tr.querySelector(S.link);
+      const title = txt(a);
+      const url = a ? a.getAttribute("href") || "" : "";
+      if (!title || !url) continue;
+      const row = { title: title, url: url };
+      for (const [key, sel] of Object.entries(S.cells)) row[key] = txt(tr.querySelector(sel));
+      rows.push(row);
+    }
+    if (rows.length) return { skin: "new", rows: rows };
+  }
+  for (const a of document.querySelectorAll(S.old_links)) {
+    const title = txt(a);
+    const url = a.getAttribute("href") || "";
+    if (title && url) rows.push({ title: title, url: url });
+  }
+  return { skin: "old", rows: rows };
+}
+""".replace("__SELECTORS__", json.dumps(_LIST_SEL))
 
-def _extract_basic_fields(target, data: Dict[str, object]) -> None:
-    # 제목
-    try:
-        ttl = target.query_selector("h3.title_text") or target.query_selector(
-            ".ArticleTitle .title_text, .TitleText"
-        )
-        data["title"] = _text(ttl)
-    except Exception:
-        pass
-    # 작성자
-    try:
-        nick = target.query_selector(".WriterInfo .nickname, .nick_name, .nickname")
-        data["author"] = _text(nick)
-    except Exception:
-        pass
-    # 날짜
-    try:
-        dt = target.query_selector(".article_info .date, .date")
-        data["date"] = _text(dt)
-    except Exception:
-        pass
-    # 조회/좋아요
+
+def _posts_from_raw(raw: Dict[str, object]) -> List[Dict[str, object]]:
+    """
+    목록 raw(_LIST_JS/DOM/HTML 공통 구조) → 목록 row (조회/좋아요 숫자 변환)
+    말머리("[광고]" → "광고")는 있는 글에만 head 키로 넣음
+    """
+    rows: List[Dict[str, object]] = []
+    for r in raw.get("rows") or []:
+        if raw.get("skin") == "new":
+            row: Dict[str, object] = {"article_no": r.get("article_no") or ""}
+            head = (r.get("head") or "").strip().strip("[]").strip()
+            if head:
+                row["head"] = head
+            row.update(
+                title=r["title"],
+                url=r["url"],
+                author=r.get("author") or "",
+                date=r.get("date") or "",
+                read_count=_int_from_text(r.get("read_count") or ""),
+                like_count=_int_from_text(r.get("like_count") or ""),
+            )
+            rows.append(row)
+        else:
+            rows.append({"title": r["title"], "url": r["url"]})
+    return rows
+
+
+def extract_posts_from_frame(target, *, mode: Optional[str] = None) -> List[Dict[str, object]]:
+    """
+    게시판 목록에서 글 목록 추출
+    - 신스킨(table.article-table) 우선, 없으면 구스킨(a.article, a.tit 등) 대응
+    반환: [{article_no,head(말머리가 있을 때만),title,url,author,date,read_count,like_count}, ...]
+
+    mode:
+      None       -> NCS_PARSE_MODE (기본 "evaluate")
+      "evaluate" -> 페이지 내 스크립트 1회로 전체 행 수집
+      "html"     -> content() 로 HTML만 받아 html_parser(selectolax)로 파싱
+      "dom"      -> 셀마다 query_selector 호출 ("evaluate"/"html" 실패 시 폴백)
+    """
+    return _run_steps(_posts_steps(target, mode or _PARSE_MODE))
+
+
+async def aextract_posts_from_frame(
+    target, *, mode: Optional[str] = None
+) -> List[Dict[str, object]]:
+    """extract_posts_from_frame의 비동기 버전 (html 모드 파싱은 워커 스레드에서 수행)"""
+    return await _arun_steps(_posts_steps(target, mode or _PARSE_MODE))
+
+
+def _posts_steps(target, mode: str):
+    raw = yield from _list_raw_steps(target, mode)
+    if raw is None:
+        raw = yield from _posts_dom_steps(target)
+    return _posts_from_raw(raw)
+
+
+def _list_raw_steps(target, mode: str):
+    """evaluate/html 모드의 목록 raw (미지원/실패 시 None)"""
     try:
-        rc_el = target.query_selector(".article_info .count, .count, .read")
-        data["read_count"] = _int_from_text(_text(rc_el))
+        if mode == "evaluate":
+            return (yield _Call(target, "evaluate", _LIST_JS))
+        if mode == "html":
+            from .html_parser import posts_raw_from_html
+
+            html = yield _Call(target, "content")
+            return (yield _Offload(posts_raw_from_html, html))
     except Exception:
         pass
+    return None
+
+
+def _posts_dom_steps(target):
+    """요소별 query_selector 기반 목록 raw (_LIST_JS 와 같은 구조)"""
+    sel = _LIST_SEL
+    rows: List[Dict[str, str]] = []
+
+    # 1) 신스킨: table.article-table
     try:
-        like_el = target.query_selector(".u_likeit_list_btn .u_cnt, .like_no .u_cnt")
-        data["like_count"] = _int_from_text(_text(like_el))
+        table = yield _Call(target, "query_selector", sel["table"])
+        if table:
+            for tr in (yield _Call(table, "query_selector_all", sel["row"])):
+                a = yield _Call(tr, "query_selector", sel["link"])
+                title = yield from _text_steps(a)
+                url = ((yield _Call(a, "get_attribute", "href")) or "") if a else ""
+                if not title or not url:
+                    continue
+                row = {"title": title, "url": url}
+                for key, css in sel["cells"].items():
+                    row[key] = yield from _text_steps((yield _Call(tr, "query_selector", css)))
+                rows.append(row)
+            if rows:
+                return {"skin": "new", "rows": rows}
     except Exception:
         pass
 
+    # 2) 구스킨(보수적)
+    for a in (yield from _query_all_steps(target, sel["old_links"])):
+        try:
+            title = yield from _text_steps(a)
+            url = (yield _Call(a, "get_attribute", "href")) or ""
+        except Exception:
+            continue
+        if title and url:
+            rows.append({"title": title, "url": url})
+    return {"skin": "old", "rows": rows}
 
-def _extract_body_text_and_html(content_root) -> Tuple[str, str]:
-    """본문 텍스트와 HTML"""
-    content_text, content_html = "", ""
-    if not content_root:
-        return content_text, content_html
-    try:
-        content_html = content_root.inner_html() or ""
-    except Exception:
-        content_html = ""
-    try:
-        # 문단성 요소 위주로 수집
-        paras = content_root.query_selector_all("p, div.se-text-paragraph, li")
-        texts = [(_text(p) or "").strip() for p in paras]
-        texts = [t for t in texts if t]
-        content_text = "\n".join(texts)
-    except Exception:
-        content_text = ""
-    return content_text, content_html
 
+# -----------------------------------------------------------------------------
+# 상세 파서(내부 헬퍼)
+# -----------------------------------------------------------------------------
+# 상세 셀렉터 (evaluate 스크립트, DOM 폴백, html_parser 가 모두 이 표를 사용)
+# fields: 키별로 앞에서부터 시도할 셀렉터 목록
+_DETAIL_SEL: Dict[str, object] = {
+    "fields": {
+        "title": ["h3.title_text", ".ArticleTitle .title_text, .TitleText"],
+        "author": [".WriterInfo .nickname, .nick_name, .nickname"],
+        "date": [".article_info .date, .date"],
+        "read_count": [".article_info .count, .count, .read"],
+        "like_count": [".u_likeit_list_btn .u_cnt, .like_no .u_cnt"],
+    },
+    "root": ["div.CafeViewer", "div.se-viewer"],
+    "paras": "p, div.se-text-paragraph, li",
+    "links": "a, a.se-link",
+    "images": "img, .se-oglink-thumbnail-resource",
+    "alts": "img",
+    "captions": [
+        ".se-caption",
+        ".se-imageCaption",
+        ".se-oglink-title",
+        ".se-oglink-summary",
+        ".se-module-image figcaption",
+    ],
+}
 
-def _extract_external_links_and_images(content_root) -> Tuple[List[str], List[str]]:
-    links, imgs = [], []
-    if not content_root:
-        return links, imgs
-    try:
-        for a in content_root.query_selector_all("a, a.se-link"):
-            href = a.get_attribute("href")
-            if href and href.startswith(("http://", "https://")):
-                links.append(href)
-    except Exception:
-        pass
+
+def _content_root_steps(target):
+    """본문 루트 노드(CafeViewer 혹은 se-viewer)"""
     try:
-        for img in content_root.query_selector_all(
-            "img, .se-oglink-thumbnail-resource"
-        ):
-            src = img.get_attribute("src")
-            if src:
-                imgs.append(src)
+        for sel in _DETAIL_SEL["root"]:
+            el = yield _Call(target, "query_selector", sel)
+            if el:
+                return el
     except Exception:
         pass
-    return _dedup_keep_order(links), _dedup_keep_order(imgs)
+    return None
 
 
-def _extract_image_side_texts(content_root) -> List[str]:
-    """이미지의 alt/캡션/주변 텍스트 추출 (OCR 제외)"""
-    out: List[str] = []
-    if not content_root:
+def _detail_dom_raw_steps(target, root):
+    """요소별 query_selector 기반 상세 raw (_DETAIL_JS 와 같은 구조)"""
+    sel = _DETAIL_SEL
+    out: Dict[str, object] = {}
+    for key, sels in sel["fields"].items():
+        out[key] = yield from _query_text_steps(target, sels)
+    out.update(has_root=bool(root), content_html="")
+    out.update({k: [] for k in ("paras", "links", "images", "alts", "captions")})
+    if not root:
         return out
+
     try:
-        for img in content_root.query_selector_all("img"):
-            alt = img.get_attribute("alt") or ""
-            if alt.strip():
-                out.append(alt.strip())
-    except Exception:
-        pass
-    try:
-        for cap_sel in [
-            ".se-caption",
-            ".se-imageCaption",
-            ".se-oglink-title",
-            ".se-oglink-summary",
-            ".se-module-image figcaption",
-        ]:
-            for el in content_root.query_selector_all(cap_sel):
-                t = _text(el)
-                if t:
-                    out.append(t)
+        out["content_html"] = (yield _Call(root, "inner_html")) or ""
     except Exception:
         pass
-    return _dedup_keep_order(out)
+    # 문단성 요소 위주로 수집
+    for p in (yield from _query_all_steps(root, sel["paras"])):
+        t = yield from _text_steps(p)
+        if t:
+            out["paras"].append(t)
+    for key, attr in (("links", "href"), ("images", "src")):
+        for el in (yield from _query_all_steps(root, sel[key])):
+            try:
+                v = yield _Call(el, "get_attribute", attr)
+            except Exception:
+                continue
+            if v and (key != "links" or v.startswith(("http://", "https://"))):
+                out[key].append(v)
+    for img in (yield from _query_all_steps(root, sel["alts"])):
+        try:
+            alt = ((yield _Call(img, "get_attribute", "alt")) or "").strip()
+        except Exception:
+            continue
+        if alt:
+            out["alts"].append(alt)
+    for cap_sel in sel["captions"]:
+        for el in (yield from _query_all_steps(root, cap_sel)):
+            t = yield from _text_steps(el)
+            if t:
+                out["captions"].append(t)
+    return out
+
+
+@lru_cache(maxsize=8)
+def _threshold_lut(thr: int) -> Tuple[int, ...]:
+    """이진화 룩업테이블 (0~255 → 0/255)"""
+    return tuple(255 if p > thr else 0 for p in range(256))
 
 
 def _pil_unsharp_threshold(im, thr: int) -> "Image.Image":
@@ -242,9 +463,8 @@ def _pil_unsharp_threshold(im, thr: int) -> "Image.Image":
     if _OCR_FILTER == "unsharp":
         # 기본 반경/강도/임계값은 보수적 세팅
         g = g.filter(ImageFilter.UnsharpMask(radius=1.5, percent=180, threshold=3))
-    # 임계값 이진화
-    bw = g.point(lambda p: 255 if p > thr else 0, mode="1")
-    return bw.convert("L")  # tesseract가 L/RGB에 더 안정적
+    # 임계값 이진화: L 모드 그대로 룩업테이블 1회 적용 (1비트 변환 후 L 로 되돌리지 않음)
+    return g.point(_threshold_lut(thr))  # tesseract가 L/RGB에 더 안정적
 
 
 def _apply_scale(im, scale: float) -> "Image.Image":
@@ -255,17 +475,52 @@ def _apply_scale(im, scale: float) -> "Image.Image":
     return im.resize((nw, nh))
 
 
-def _ocr_on_images(content_root) -> List[str]:
+def _apply_max_width(im, max_width: int) -> "Image.Image":
+    w, h = im.size
+    if not max_width or w <= max_width:
+        return im
+    return im.resize((max_width, max(1, int(h * max_width / w))))
+
+
+def _tile_bands(height: int, band: int, overlap: int) -> List[Tuple[int, int]]:
     """
-    이미지 요소를 스크린샷 캡처해 OCR (PIL-only 전처리).
-    - pillow, pytesseract가 없으면 빈 리스트
-    - Tesseract 설치 경로가 있으면 사용
+    세로 [0, height) 를 높이 band 이하, 이웃끼리 overlap 만큼 겹치는 띠 (top, bottom) 로 분할
+    band 의 1.5배 이하면 나누지 않음 (띠 높이는 고르게 맞춤)
+    """
+    if band <= 0 or height <= band * 1.5:
+        return [(0, height)]
+    overlap = max(0, min(overlap, band // 2))
+    n = -(-(height - overlap) // (band - overlap))  # ceil
+    step = (height - overlap) / n
+    return [(int(i * step), min(height, int((i + 1) * step) + overlap)) for i in range(n)]
+
+
+def _same_line(a: str, b: str) -> bool:
+    a, b = re.sub(r"\s+", "", a), re.sub(r"\s+", "", b)
+    return a == b or (len(a) > 3 and SequenceMatcher(None, a, b).ratio() >= 0.85)
+
+
+def _stitch_band_texts(texts: List[str], max_overlap_lines: int = 8) -> str:
+    """
+    띠별 OCR 텍스트 이어 붙이기: 앞 띠 끝줄과 다음 띠 첫줄이 겹치는 부분(가장 긴 일치)은 한 번만
     """
+    out: List[str] = []
+    for t in texts:
+        lines = [ln for ln in (t or "").splitlines() if ln.strip()]
+        n = min(len(out), len(lines), max_overlap_lines)
+        while n > 0 and not all(_same_line(a, b) for a, b in zip(out[-n:], lines[:n])):
+            n -= 1
+        out.extend(lines[n:])
+    return "\n".join(out)
+
+
+def _setup_tesseract():
+    """pytesseract 모듈 반환(없으면 None). Tesseract 설치 경로가 있으면 지정"""
     try:
         from PIL import Image  # noqa: F401
         import pytesseract
     except Exception:
-        return []
+        return None
 
     # tesseract 경로 설정(있을 경우)
     try:
@@ -273,71 +528,435 @@ def _ocr_on_images(content_root) -> List[str]:
             pytesseract.pytesseract.tesseract_cmd = _TESSERACT_CMD
     except Exception:
         pass
+    return pytesseract
 
-    if not content_root:
-        return []
 
+# -----------------------------------------------------------------------------
+# OCR 엔진
+# - tesserocr : Tesseract C-API 바인딩. 모델(traineddata)을 한 번 올려 두고 이미지마다 재사용
+# - pytesseract: 이미지마다 tesseract 프로세스 실행 (tesserocr 가 없거나 초기화 실패 시 폴백)
+# 엔진은 스레드별로 1개 생성해 재사용 (C-API 핸들은 스레드 간 공유 불가, 워커 프로세스도 동일)
+# -----------------------------------------------------------------------------
+class OcrEngine(ABC):
+    name = ""
+
+    @abstractmethod
+    def recognize(self, im) -> str:
+        """전처리된 L 모드 이미지 → 텍스트"""
+
+
+class TesserocrEngine(OcrEngine):
+    """PyTessBaseAPI 를 유지하고 raw 버퍼(SetImageBytes)로 이미지 전달 (인코딩/임시파일 없음)"""
+
+    name = "tesserocr"
+
+    def __init__(self):
+        import tesserocr
+
+        kwargs = {"lang": _OCR_LANG, "psm": _OCR_PSM, "oem": _OCR_OEM}
+        tessdata = os.path.join(os.path.dirname(_TESSERACT_CMD), "tessdata")
+        if _TESSERACT_CMD and os.path.isdir(tessdata):
+            kwargs["path"] = tessdata
+        self.api = tesserocr.PyTessBaseAPI(**kwargs)
+
+    def recognize(self, im) -> str:
+        im = im if im.mode == "L" else im.convert("L")
+        w, h = im.size
+        self.api.SetImageBytes(im.tobytes(), w, h, 1, w)
+        self.api.SetSourceResolution(_OCR_DPI)
+        return self.api.GetUTF8Text() or ""
+
+
+class PytesseractEngine(OcrEngine):
+    name = "pytesseract"
+
+    def __init__(self, pytesseract):
+        self.pytesseract = pytesseract
+        # DPI 힌트는 PNG 재인코딩 대신 --dpi 로 전달
+        self.config = f"--psm {_OCR_PSM} --oem {_OCR_OEM} --dpi {_OCR_DPI}"
+
+    def recognize(self, im) -> str:
+        return self.pytesseract.image_to_string(im, lang=_OCR_LANG, config=self.config) or ""
+
+
+_ENGINE_LOCAL = threading.local()
+
+
+def _create_ocr_engine(name: str) -> Optional[OcrEngine]:
+    if name in ("auto", "tesserocr"):
+        try:
+            return TesserocrEngine()
+        except Exception:
+            pass  # 미설치/traineddata 없음 → pytesseract 폴백
+    pytesseract = _setup_tesseract()
+    return PytesseractEngine(pytesseract) if pytesseract is not None else None
+
+
+def _engine_name() -> str:
+    """엔진을 만들지 않고 사용할 엔진 이름만 판단"""
+    if _OCR_ENGINE != "pytesseract" and importlib.util.find_spec("tesserocr") is not None:
+        return "tesserocr"
+    return "pytesseract"
+
+
+def ocr_available() -> bool:
+    """사용 가능한 OCR 엔진(tesserocr 또는 pytesseract + Tesseract)이 있는지"""
+    return _engine_name() == "tesserocr" or _setup_tesseract() is not None
+
+
+def get_ocr_engine() -> Optional[OcrEngine]:
+    """현재 스레드의 OCR 엔진 (처음 호출 시 생성, 사용 가능한 엔진이 없으면 None)"""
+    if not hasattr(_ENGINE_LOCAL, "engine"):
+        _ENGINE_LOCAL.engine = _create_ocr_engine(_OCR_ENGINE)
+    return _ENGINE_LOCAL.engine
+
+
+_TILE_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_TILE_LOCK = threading.Lock()
+
+
+def _tile_executor() -> Optional[ThreadPoolExecutor]:
+    """
+    띠 OCR 용 스레드 풀 (프로세스당 1개 유지 → 스레드별 OCR 엔진도 재사용)
+    스레드 수가 1 이하면 None → 호출 스레드에서 순서대로 (엔진을 더 만들지 않음)
+    """
+    global _TILE_EXECUTOR
+    if _OCR_TILE_THREADS <= 1:
+        return None
+    with _TILE_LOCK:
+        if _TILE_EXECUTOR is None:
+            _TILE_EXECUTOR = ThreadPoolExecutor(
+                max_workers=_OCR_TILE_THREADS, thread_name_prefix="ocr-tile"
+            )
+        return _TILE_EXECUTOR
+
+
+def init_ocr_worker(tile_threads: int) -> None:
+    """
+    OCR 워커 프로세스 초기화 (ocr.OcrWorkerPool 의 initializer)
+    - 띠 OCR 스레드 수 제한: 워커 N개 × 띠 스레드 M개 = Tesseract N×M개(+모델 메모리)가
+      코어 수를 넘지 않도록 호출 측이 코어 수 // 워커 수 로 계산해 넘김
+    - 현재 스레드의 OCR 엔진(모델 로드)을 미리 준비
+    """
+    global _OCR_TILE_THREADS, _TILE_EXECUTOR
+    with _TILE_LOCK:
+        _OCR_TILE_THREADS = max(1, int(tile_threads))
+        if _TILE_EXECUTOR is not None:
+            _TILE_EXECUTOR.shutdown(wait=False)
+            _TILE_EXECUTOR = None
+    get_ocr_engine()
+
+
+def _ocr_band(im, box: Tuple[int, int]) -> str:
+    engine = get_ocr_engine()
+    if engine is None:
+        return ""
+    top, bottom = box
+    band = im.crop((0, top, im.size[0], bottom))
+    return engine.recognize(_pil_unsharp_threshold(band, _OCR_THRESH))
+
+
+def _ocr_png_bytes(png_bytes: bytes) -> str:
+    """스크린샷 bytes 1장 → 전처리 → OCR 텍스트 (실패/빈 결과는 "")"""
+    if not png_bytes:
+        return ""
+    engine = get_ocr_engine()
+    if engine is None:
+        return ""
+
+    from io import BytesIO
+    from PIL import Image
+
+    im = Image.open(BytesIO(png_bytes))
+
+    # 스케일 적용 (요청값: 1.0 → 사실상 원본) + 폭 상한
+    im = _apply_scale(im, _OCR_SCALE)
+    im = _apply_max_width(im, _OCR_MAX_WIDTH)
+
+    # 세로로 긴 이미지: 띠별로 전처리/OCR 을 병렬 수행 후 겹친 줄 제거
+    bands = _tile_bands(im.size[1], _OCR_TILE_HEIGHT, _OCR_TILE_OVERLAP)
+    if len(bands) > 1:
+        im.load()
+        executor = _tile_executor()
+        ocr_band = lambda box: _ocr_band(im, box)  # noqa: E731
+        texts = list(executor.map(ocr_band, bands) if executor else map(ocr_band, bands))
+        return _stitch_band_texts(texts).strip()
+
+    # 언샤프 + 임계값 이진화(160)
+    im = _pil_unsharp_threshold(im, _OCR_THRESH)
+
+    return engine.recognize(im).strip()
+
+
+def ocr_settings_key() -> str:
+    """OCR 결과에 영향을 주는 설정 묶음 (OCR 캐시 키에 포함)"""
+    return "|".join(
+        str(v)
+        for v in (
+            _engine_name(),
+            _OCR_LANG,
+            _OCR_PSM,
+            _OCR_OEM,
+            _OCR_SCALE,
+            _OCR_FILTER,
+            _OCR_THRESH,
+            _OCR_DPI,
+            _OCR_TILE_HEIGHT,
+            _OCR_TILE_OVERLAP,
+            _OCR_MAX_WIDTH,
+        )
+    )
+
+
+# -----------------------------------------------------------------------------
+# 이미지 캡처 (batch: 이미지 박스 1회 조회 → 페이지 스크린샷 몇 장 → PIL 로 잘라냄)
+# -----------------------------------------------------------------------------
+# 본문 img 들의 src/뷰포트 기준 박스/로드 여부 (query_selector_all("img") 와 같은 순서)
+_IMG_BOXES_JS = r"""
+(root) => ({
+  sx: window.scrollX, sy: window.scrollY, vw: window.innerWidth, vh: window.innerHeight,
+  imgs: Array.from(root.querySelectorAll("img")).map((img) => {
+    const r = img.getBoundingClientRect();
+    return {
+      src: img.getAttribute("src") || "",
+      x: r.left, y: r.top, w: r.width, h: r.height,
+      loaded: img.complete && img.naturalWidth > 0,
+    };
+  }),
+})
+"""
+
+# iframe 콘텐츠 영역의 좌상단 (부모 문서 좌표)
+_FRAME_ORIGIN_JS = r"""
+(el) => {
+  const r = el.getBoundingClientRect();
+  return [r.left + el.clientLeft + window.scrollX, r.top + el.clientTop + window.scrollY];
+}
+"""
+
+
+def _page_boxes(info: Dict, origin, in_frame: bool) -> List[Optional[Dict[str, float]]]:
+    """
+    이미지 박스를 최상위 문서 좌표로 변환 (배치 캡처가 불가능한 이미지는 None)
+    - 아직 로드되지 않았거나(지연 로딩) 크기가 0 인 이미지
+    - iframe 안이면 iframe 뷰포트를 벗어난 이미지 (페이지 스크린샷에 보이지 않음)
+    """
+    ox, oy = origin
+    out: List[Optional[Dict[str, float]]] = []
+    for b in info.get("imgs") or []:
+        ok = bool(b.get("loaded")) and b["w"] >= 1 and b["h"] >= 1
+        if ok and in_frame:
+            ok = b["x"] >= 0 and b["y"] >= 0
+            ok = ok and b["x"] + b["w"] <= info["vw"] and b["y"] + b["h"] <= info["vh"]
+        out.append({"x": b["x"] + ox, "y": b["y"] + oy, "w": b["w"], "h": b["h"]} if ok else None)
+    return out
+
+
+def _plan_segments(
+    boxes: Dict[int, Dict[str, float]], max_height: int
+) -> List[Tuple[Dict[str, int], List[int]]]:
+    """
+    위에서부터 이미지를 묶어 높이 max_height 이하의 스크린샷 영역(clip)으로 나눔
+    (한 이미지는 반드시 한 영역 안에 통째로, max_height 보다 큰 이미지는 단독 영역)
+    """
+    groups: List[List[int]] = []
+    top = 0.0
+    for i in sorted(boxes, key=lambda k: boxes[k]["y"]):
+        b = boxes[i]
+        if not groups or b["y"] + b["h"] - top > max_height:
+            groups.append([])
+            top = b["y"]
+        groups[-1].append(i)
+
+    plans = []
+    for idxs in groups:
+        x0 = math.floor(min(boxes[i]["x"] for i in idxs))
+        y0 = math.floor(min(boxes[i]["y"] for i in idxs))
+        x1 = math.ceil(max(boxes[i]["x"] + boxes[i]["w"] for i in idxs))
+        y1 = math.ceil(max(boxes[i]["y"] + boxes[i]["h"] for i in idxs))
+        plans.append(({"x": x0, "y": y0, "width": x1 - x0, "height": y1 - y0}, idxs))
+    return plans
+
+
+def _crop_segment(
+    shot: bytes, clip: Dict[str, int], boxes: Dict[int, Dict[str, float]], idxs: List[int]
+) -> Dict[int, bytes]:
+    """영역 스크린샷에서 이미지별로 잘라 PNG bytes 로 (device scale factor 는 크기 비율로 보정)"""
+    from io import BytesIO
+    from PIL import Image
+
+    im = Image.open(BytesIO(shot))
+    im.load()
+    sx, sy = im.size[0] / clip["width"], im.size[1] / clip["height"]
+    out: Dict[int, bytes] = {}
+    for i in idxs:
+        b = boxes[i]
+        left, top = round((b["x"] - clip["x"]) * sx), round((b["y"] - clip["y"]) * sy)
+        right = round((b["x"] + b["w"] - clip["x"]) * sx)
+        bottom = round((b["y"] + b["h"] - clip["y"]) * sy)
+        if right - left < 1 or bottom - top < 1:
+            continue
+        buf = BytesIO()
+        im.crop((left, top, right, bottom)).save(buf, "PNG", compress_level=1)
+        out[i] = buf.getvalue()
+    return out
+
+
+def _image_boxes_steps(content_root):
+    if _OCR_CAPTURE != "batch":
+        return None
     try:
-        imgs = content_root.query_selector_all("img")
+        info = yield _Call(content_root, "evaluate", _IMG_BOXES_JS)
     except Exception:
-        imgs = []
+        return None
+    return info if isinstance(info, dict) else None
 
-    results: List[str] = []
-    for img in imgs:
+
+def _batch_screenshot_steps(content_root, info: Dict, wanted: List[int]):
+    """
+    wanted 이미지들을 페이지 스크린샷 몇 장에서 잘라냄 → {이미지 순번: PNG bytes}
+    빠진 이미지(지연 로딩/중첩 iframe/스크린샷 실패)는 호출 측에서 요소 스크린샷
+    """
+    try:
+        frame = yield _Call(content_root, "owner_frame")
+        page = frame.page
+        parent = frame.parent_frame
+        if parent is None:
+            origin = (info["sx"], info["sy"])
+        elif parent.parent_frame is None:
+            frame_el = yield _Call(frame, "frame_element")
+            origin = yield _Call(frame_el, "evaluate", _FRAME_ORIGIN_JS)
+        else:
+            return {}
+    except Exception:
+        return {}
+
+    boxes = _page_boxes(info, origin, parent is not None)
+    todo = {i: boxes[i] for i in wanted if i < len(boxes) and boxes[i]}
+    out: Dict[int, bytes] = {}
+    for clip, idxs in _plan_segments(todo, _OCR_CAPTURE_SEGMENT):
         try:
-            # DOM 요소 스크린샷 → bytes
-            png_bytes = img.screenshot()
-            if not png_bytes:
+            shot = yield _Call(page, "screenshot", clip=clip, full_page=True)
+            out.update(_crop_segment(shot, clip, todo, idxs))
+        except Exception:
+            continue
+    return out
+
+
+def _capture_steps(content_root, skip=None, fetch=None):
+    """
+    본문 이미지 요소별 (src, 이미지 bytes) (캡처 실패 이미지는 제외)
+    - skip(src) 가 True 인 이미지는 캡처하지 않고 (src, b"") 로 반환 (OCR 캐시 적중 등)
+    - fetch(src) 가 있으면 원본 다운로드 우선, None 이면 스크린샷으로 폴백
+    - 스크린샷은 batch 모드면 페이지 스크린샷에서 잘라내고, 안 되는 이미지만 요소 스크린샷
+    """
+    if not content_root:
+        return []
+    imgs = yield from _query_all_steps(content_root, "img")
+
+    info = (yield from _image_boxes_steps(content_root)) if imgs else None
+    if info and len(info.get("imgs") or []) != len(imgs):
+        info = None  # 그 사이 DOM 이 바뀜
+
+    # (이미지 순번, 요소, src) — src 를 못 읽은 이미지는 캡처 제외
+    todo: List[Tuple[int, object, str]] = []
+    for i, img in enumerate(imgs):
+        try:
+            if info:
+                src = info["imgs"][i]["src"]
+            else:
+                src = (yield _Call(img, "get_attribute", "src")) or ""
+        except Exception:
+            continue
+        todo.append((i, img, src))
+
+    # 다운로드 → 실패한 이미지는 배치 스크린샷 → 남은 것만 요소 스크린샷 순서대로
+    fetched = yield _Fetch([src for _i, _img, src in todo], skip, fetch)
+    pending = [i for (i, _img, _src), data in zip(todo, fetched) if data is None]
+    crops: Dict[int, bytes] = {}
+    if info and pending:
+        crops = yield from _batch_screenshot_steps(content_root, info, pending)
+
+    out: List[Tuple[str, bytes]] = []
+    for (i, img, src), data in zip(todo, fetched):
+        if data is None:
+            data = crops.get(i)
+        if data is None:
+            try:
+                data = yield _Call(img, "screenshot")
+            except Exception:
                 continue
+        out.append((src, data))
+    return out
 
-            from io import BytesIO
-            from PIL import Image
 
-            im = Image.open(BytesIO(png_bytes))
+def _capture_images(
+    content_root,
+    skip: Optional[Callable[[str], bool]] = None,
+    fetch: Optional[Callable[[str], Optional[bytes]]] = None,
+) -> List[Tuple[str, bytes]]:
+    return _run_steps(_capture_steps(content_root, skip, fetch))
 
-            # 스케일 적용 (요청값: 1.0 → 사실상 원본)
-            im = _apply_scale(im, _OCR_SCALE)
 
-            # 언샤프 + 임계값 이진화(160)
-            im = _pil_unsharp_threshold(im, _OCR_THRESH)
+async def _acapture_images(
+    content_root,
+    skip: Optional[Callable[[str], bool]] = None,
+    fetch=None,
+) -> List[Tuple[str, bytes]]:
+    """_capture_images의 비동기 버전 (fetch 는 async 함수, 다운로드는 동시에)"""
+    return await _arun_steps(_capture_steps(content_root, skip, fetch))
 
-            # Tesseract 인자 구성
-            config = f"--psm {_OCR_PSM} --oem {_OCR_OEM}"
-            # DPI 힌트: PNG 메타에 DPI 넣어서 전달 (없어도 동작)
-            buf = BytesIO()
-            im.save(buf, format="PNG", dpi=(_OCR_DPI, _OCR_DPI))
-            buf.seek(0)
-            im2 = Image.open(buf)
 
-            txt = pytesseract.image_to_string(im2, lang=_OCR_LANG, config=config) or ""
-            txt = txt.strip()
+def _ocr_steps(content_root):
+    """
+    이미지 요소를 스크린샷 캡처해 OCR (PIL-only 전처리, async 에서는 워커 스레드).
+    - pillow, pytesseract가 없으면 빈 리스트
+    - Tesseract 설치 경로가 있으면 사용
+    """
+    if not ocr_available() or not content_root:
+        return []
+
+    results: List[str] = []
+    for _src, png_bytes in (yield from _capture_steps(content_root)):
+        try:
+            txt = yield _Offload(_ocr_png_bytes, png_bytes)
             if txt:
                 results.append(txt)
         except Exception:
             continue
-
     return _dedup_keep_order(results)
 
 
-# -----------------------------------------------------------------------------
-# 상세 파서(공개 API)
-# -----------------------------------------------------------------------------
-def extract_article_detail(
+def _target_images_steps(target, skip, fetch):
+    root = yield from _content_root_steps(target)
+    return (yield from _capture_steps(root, skip, fetch))
+
+
+def capture_ocr_images(
     target,
-    *,
-    ocr: Optional[bool] = None,
-) -> Dict[str, object]:
+    skip: Optional[Callable[[str], bool]] = None,
+    fetch: Optional[Callable[[str], Optional[bytes]]] = None,
+) -> List[Tuple[str, bytes]]:
     """
-    게시글 상세 페이지에서 주요 정보 추출
-    - title, author, date, read_count, like_count
-    - content_text(본문+alt/캡션+OCR → KoBERT 전처리), content_html
-    - external_links, images
-
-    ocr:
-      None  -> 환경변수(NCS_OCR) 존재 시 해당 값, 없으면 기본 True
-      True/False -> 명시 값 우선
+    OCR 없이 본문 이미지 캡처만 수행 (OCR 은 호출 측 워커 풀에서)
+    extract_article_detail(target, ocr=False) → 캡처 → merge_ocr_texts 순으로 사용
+    fetch: 원본 다운로드 함수 (예: ocr.ImageFetcher.fetch), 실패한 이미지만 스크린샷
     """
-    data: Dict[str, object] = {
+    return _run_steps(_target_images_steps(target, skip, fetch))
+
+
+async def acapture_ocr_images(
+    target, skip: Optional[Callable[[str], bool]] = None, fetch=None
+) -> List[Tuple[str, bytes]]:
+    """capture_ocr_images의 비동기 버전 (fetch 예: ocr.ImageFetcher.afetch)"""
+    return await _arun_steps(_target_images_steps(target, skip, fetch))
+
+
+# -----------------------------------------------------------------------------
+# 상세 결과 조립(동기/비동기 공용)
+# -----------------------------------------------------------------------------
+def _empty_detail() -> Dict[str, object]:
+    return {
         "title": "",
         "author": "",
         "date": "",
@@ -349,25 +968,24 @@ def extract_article_detail(
         "images": [],
     }
 
-    # 메타 필드
-    _extract_basic_fields(target, data)
-
-    # 본문 루트/본문·HTML
-    content_root = _find_content_root(target)
-    body_text, content_html = _extract_body_text_and_html(content_root)
 
-    # 링크/이미지/이미지 주변 텍스트
-    links, images = _extract_external_links_and_images(content_root)
-    side_texts = _extract_image_side_texts(content_root)
-
-    # OCR 수행 여부 결정(인자 > 환경변수 > 기본값)
+def _resolve_ocr_enabled(ocr: Optional[bool]) -> bool:
+    """OCR 수행 여부 결정(인자 > 환경변수 > 기본값)"""
     if ocr is None:
-        ocr_enabled = _OCR_ENABLED_ENV if os.getenv("NCS_OCR") else _OCR_ENABLED_DEFAULT
-    else:
-        ocr_enabled = bool(ocr)
+        return _OCR_ENABLED_ENV if os.getenv("NCS_OCR") else _OCR_ENABLED_DEFAULT
+    return bool(ocr)
 
-    ocr_texts: List[str] = _ocr_on_images(content_root) if (ocr_enabled and content_root) else []
 
+def _assemble_detail(
+    data: Dict[str, object],
+    body_text: str,
+    content_html: str,
+    links: List[str],
+    images: List[str],
+    side_texts: List[str],
+    ocr_texts: List[str],
+) -> None:
+    """본문/부가텍스트/OCR 병합 + KoBERT 전처리 후 data에 반영"""
     # 본문+부가텍스트 병합
     merged_text = "\n".join(t for t in ([body_text] + side_texts + ocr_texts) if t).strip()
 
@@ -380,5 +998,178 @@ def extract_article_detail(
     data["content_html"] = content_html
     data["external_links"] = links
     data["images"] = images
+    if any(ocr_texts):
+        data["ocr_texts"] = [t for t in ocr_texts if t]
+
+
+def merged_ocr_texts(data: Dict[str, object]) -> List[str]:
+    """이미 병합한 OCR 텍스트 (Parquet/CSV 에서 읽어 JSON 문자열이 된 값도 허용)"""
+    v = data.get("ocr_texts")
+    if isinstance(v, str):
+        try:
+            v = json.loads(v) if v.strip().startswith("[") else [v]
+        except ValueError:
+            v = [v]
+    return [str(t) for t in v] if isinstance(v, (list, tuple)) else []
+
 
+def merge_ocr_texts(data: Dict[str, object], ocr_texts: List[str]) -> Dict[str, object]:
+    """
+    나중에 받은 OCR 텍스트를 content_text 뒤에 붙이고 KoBERT 전처리 재적용
+    병합한 텍스트는 ocr_texts 에 기록하고, 이미 기록된 텍스트는 다시 붙이지 않음
+    (같은 행에 여러 번 적용해도 결과 동일 — 수집 결과에 scripts/run_ocr.py 재실행 등)
+    """
+    done = merged_ocr_texts(data)
+    texts = [t for t in _dedup_keep_order([t for t in ocr_texts if t]) if t not in done]
+    if not texts:
+        return data
+    merged = "\n".join([str(data.get("content_text") or "")] + texts).strip()
+    data["content_text"] = clean_for_kobert(merged) or merged
+    data["ocr_texts"] = done + texts
     return data
+
+
+# 상세 필드를 한 번의 evaluate 로 수집 (셀렉터는 _DETAIL_SEL 을 스크립트에 그대로 삽입)
+_DETAIL_JS = r"""
+() => {
+  const S = __SELECTORS__;
+  const txt = (el) => {
+    if (!el) return "";
+    const t = typeof el.innerText === "string" ? el.innerText : el.textContent;
+    return (t || "").trim();
+  };
+  const q = (sels) => {
+    for (const s of sels) {
+      const el = document.querySelector(s);
+      if (el) return el;
+    }
+    return null;
+  };
+  const out = {};
+  for (const [key, sels] of Object.entries(S.fields)) out[key] = txt(q(sels));
+  Object.assign(out, {
+    has_root: false,
+    content_html: "",
+    paras: [],
+    links: [],
+    images: [],
+    alts: [],
+    captions: [],
+  });
+  const root = q(S.root);
+  if (!root) return out;
+  out.has_root = true;
+  out.content_html = root.innerHTML || "";
+  for (const p of root.querySelectorAll(S.paras)) {
+    const t = txt(p);
+    if (t) out.paras.push(t);
+  }
+  for (const a of root.querySelectorAll(S.links)) {
+    const href = a.getAttribute("href");
+    if (href && (href.startsWith("http://") || href.startsWith("https://"))) out.links.push(href);
+  }
+  for (const img of root.querySelectorAll(S.images)) {
+    const src = img.getAttribute("src");
+    if (src) out.images.push(src);
+  }
+  for (const img of root.querySelectorAll(S.alts)) {
+    const alt = (img.getAttribute("alt") || "").trim();
+    if (alt) out.alts.push(alt);
+  }
+  for (const sel of S.captions) {
+    for (const el of root.querySelectorAll(sel)) {
+      const t = txt(el);
+      if (t) out.captions.push(t);
+    }
+  }
+  return out;
+}
+""".replace("__SELECTORS__", json.dumps(_DETAIL_SEL))
+
+
+def _detail_parts_from_raw(
+    raw: Dict[str, object], data: Dict[str, object]
+) -> Tuple[str, str, List[str], List[str], List[str]]:
+    """
+    상세 raw(_DETAIL_JS/DOM/HTML 공통 구조) → data 메타 필드 반영
+    + (본문, HTML, 링크, 이미지, 부가텍스트)
+    """
+    data["title"] = raw.get("title") or ""
+    data["author"] = raw.get("author") or ""
+    data["date"] = raw.get("date") or ""
+    data["read_count"] = _int_from_text(raw.get("read_count") or "")
+    data["like_count"] = _int_from_text(raw.get("like_count") or "")
+
+    body_text = "\n".join(raw.get("paras") or [])
+    links = _dedup_keep_order(list(raw.get("links") or []))
+    images = _dedup_keep_order(list(raw.get("images") or []))
+    side_texts = _dedup_keep_order(list(raw.get("alts") or []) + list(raw.get("captions") or []))
+    return body_text, raw.get("content_html") or "", links, images, side_texts
+
+
+# -----------------------------------------------------------------------------
+# 상세 파서(공개 API)
+# -----------------------------------------------------------------------------
+def extract_article_detail(
+    target,
+    *,
+    ocr: Optional[bool] = None,
+    mode: Optional[str] = None,
+) -> Dict[str, object]:
+    """
+    게시글 상세 페이지에서 주요 정보 추출
+    - title, author, date, read_count, like_count
+    - content_text(본문+alt/캡션+OCR → KoBERT 전처리), content_html
+    - external_links, images
+
+    ocr:
+      None  -> 환경변수(NCS_OCR) 존재 시 해당 값, 없으면 기본 True
+      True/False -> 명시 값 우선
+    mode:
+      None/"evaluate"/"html"/"dom" -> extract_posts_from_frame 과 동일
+    """
+    return _run_steps(_detail_steps(target, ocr, mode or _PARSE_MODE))
+
+
+async def aextract_article_detail(
+    target,
+    *,
+    ocr: Optional[bool] = None,
+    mode: Optional[str] = None,
+) -> Dict[str, object]:
+    """extract_article_detail의 비동기 버전 (출력 형식 동일, html 파싱/OCR 은 워커 스레드)"""
+    return await _arun_steps(_detail_steps(target, ocr, mode or _PARSE_MODE))
+
+
+def _detail_steps(target, ocr: Optional[bool], mode: str):
+    raw = yield from _detail_raw_steps(target, mode)
+    root = None
+    if raw is None:
+        root = yield from _content_root_steps(target)
+        raw = yield from _detail_dom_raw_steps(target, root)
+
+    data = _empty_detail()
+    parts = _detail_parts_from_raw(raw, data)
+    ocr_texts: List[str] = []
+    if _resolve_ocr_enabled(ocr) and raw.get("has_root"):
+        # OCR은 스크린샷이 필요하므로 evaluate/html 경로면 본문 루트 핸들을 따로 조회
+        if root is None:
+            root = yield from _content_root_steps(target)
+        ocr_texts = yield from _ocr_steps(root)
+    _assemble_detail(data, *parts, ocr_texts)
+    return data
+
+
+def _detail_raw_steps(target, mode: str):
+    """evaluate/html 모드의 상세 raw (미지원/실패 시 None)"""
+    try:
+        if mode == "evaluate":
+            return (yield _Call(target, "evaluate", _DETAIL_JS))
+        if mode == "html":
+            from .html_parser import detail_raw_from_html
+
+            html = yield _Call(target, "content")
+            return (yield _Offload(detail_raw_from_html, html))
+    except Exception:
+        pass
+    return None
@@ -0,0 +1,190 @@
+# naver_cafe_scraper/pool.py
+"""
+상세 페이지용 탭(Page) 풀
+- 기사마다 new_page()/close() 하지 않고, 미리 연 탭을 빌려 쓰고 돌려받음
+- 반납 시 about:blank 로 초기화, max_uses 회 사용했거나 크래시/초기화 실패한 탭은 폐기 후 재생성
+- 여러 BrowserContext를 넘기면 탭 생성 시 라운드로빈으로 분산
+"""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager, contextmanager
+from typing import Dict, List
+
+BLANK_URL = "about:blank"
+
+
+def _as_list(contexts) -> List[object]:
+    if isinstance(contexts, (list, tuple)):
+        return list(contexts)
+    return [contexts]
+
+
+class _PoolBase:
+    def __init__(self, contexts, size: int = 1, max_uses: int = 50):
+        self.contexts = _as_list(contexts)
+        if not self.contexts:
+            raise ValueError("contexts가 비어 있습니다")
+        self.size = max(1, int(size))
+        self.max_uses = max(1, int(max_uses))
+        self._idle: List[object] = []
+        self._uses: Dict[int, int] = {}
+        self._crashed: set[int] = set()
+        self._open = 0
+        self._rr = 0
+        self.stats: Dict[str, int] = {"created": 0, "reused": 0, "recycled": 0}
+
+    def _next_context(self):
+        ctx = self.contexts[self._rr % len(self.contexts)]
+        self._rr += 1
+        return ctx
+
+    def _watch(self, page) -> None:
+        """크래시 이벤트 구독 (지원하지 않는 객체면 무시)"""
+        self._uses[id(page)] = 0
+        try:
+            page.on("crash", lambda *_: self._crashed.add(id(page)))
+        except Exception:
+            pass
+
+    def _forget(self, page) -> None:
+        self._uses.pop(id(page), None)
+        self._crashed.discard(id(page))
+        self._open -= 1
+
+    def _should_recycle(self, page, healthy: bool) -> bool:
+        if not healthy or id(page) in self._crashed:
+            return True
+        if self._uses.get(id(page), 0) >= self.max_uses:
+            return True
+        try:
+            return bool(page.is_closed())
+        except Exception:
+            return False
+
+
+class PagePool(_PoolBase):
+    """동기(playwright.sync_api) 탭 풀"""
+
+    def acquire(self):
+        if self._idle:
+            page = self._idle.pop()
+            self.stats["reused"] += 1
+        elif self._open < self.size:
+            page = self._next_context().new_page()
+            self._open += 1
+            self._watch(page)
+            self.stats["created"] += 1
+        else:
+            raise RuntimeError(f"탭 풀 고갈 (size={self.size})")
+        self._uses[id(page)] += 1
+        return page
+
+    def release(self, page, healthy: bool = True) -> None:
+        if not self._should_recycle(page, healthy):
+            try:
+                page.goto(BLANK_URL)
+                self._idle.append(page)
+                return
+            except Exception:
+                pass
+        self._discard(page)
+
+    def _discard(self, page) -> None:
+        self.stats["recycled"] += 1
+        self._forget(page)
+        try:
+            page.close()
+        except Exception:
+            pass
+
+    @contextmanager
+    def page(self):
+        """with pool.page() as page: ... (예외 발생 시 탭 폐기)"""
+        page = self.acquire()
+        healthy = False
+        try:
+            yield page
+            healthy = True
+        finally:
+            self.release(page, healthy=healthy)
+
+    def close(self) -> None:
+        while self._idle:
+            page = self._idle.pop()
+            self._forget(page)
+            try:
+                page.close()
+            except Exception:
+                pass
+
+
+class AsyncPagePool(_PoolBase):
+    """비동기(playwright.async_api) 탭 풀. size 초과 요청은 반납될 때까지 대기"""
+
+    def __init__(self, contexts, size: int = 1, max_uses: int = 50):
+        super().__init__(contexts, size=size, max_uses=max_uses)
+        self._slots = asyncio.Semaphore(self.size)
+
+    async def acquire(self):
+        await self._slots.acquire()
+        try:
+            if self._idle:
+                page = self._idle.pop()
+                self.stats["reused"] += 1
+            else:
+                self._open += 1
+                try:
+                    page = await self._next_context().new_page()
+                except Exception:
+                    self._open -= 1
+                    raise
+                self._watch(page)
+                self.stats["created"] += 1
+        except Exception:
+            self._slots.release()
+            raise
+        self._uses[id(page)] += 1
+        return page
+
+    async def release(self, page, healthy: bool = True) -> None:
+        try:
+            if not self._should_recycle(page, healthy):
+                try:
+                    await page.goto(BLANK_URL)
+                    self._idle.append(page)
+                    return
+                except Exception:
+                    pass
+            await self._discard(page)
+        finally:
+            self._slots.release()
+
+    async def _discard(self, page) -> None:
+        self.stats["recycled"] += 1
+        self._forget(page)
+        try:
+            await page.close()
+        except Exception:
+            pass
+
+    @asynccontextmanager
+    async def page(self):
+        """async with pool.page() as page: ... (예외 발생 시 탭 폐기)"""
+        page = await self.acquire()
+        healthy = False
+        try:
+            yield page
+            healthy = True
+        finally:
+            await self.release(page, healthy=healthy)
+
+    async def close(self) -> None:
+        while self._idle:
+            page = self._idle.pop()
+            self._forget(page)
+            try:
+                await page.close()
+            except Exception:
+                pass
@@ -0,0 +1,169 @@
+# naver_cafe_scraper/readiness.py
+"""
+페이지 준비(readiness) 조건 + 적응형 타임아웃
+- frame : iframe#cafe_main 이 붙거나 목록/본문 노드가 메인 DOM에 나타나면 준비
+          (신스킨에서 존재하지 않는 iframe을 wait_ms 동안 기다리지 않음)
+- list  : 목록 행 수가 연속 폴링에서 변하지 않으면 준비 (networkidle 대체)
+- detail: 제목/본문 노드가 있으면 준비 (고정 wait_for_timeout 대체)
+각 조건은 만족하는 즉시 반환하고, 타임아웃은 관측된 소요시간(p95 × factor)으로 조정
+- list/detail 타임아웃은 설정값 아래로 줄이지 않음 (느린 페이지를 덜 읽은 채 추출 방지)
+- list/detail 대기가 타임아웃이면 늘어난 타임아웃으로 retries 회 다시 대기 후 False
+"""
+
+from __future__ import annotations
+
+import itertools
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, Optional
+
+LIST_ROW_SELECTOR = "table.article-table tbody > tr, a.article, a.tit"
+DETAIL_READY_SELECTOR = "h3.title_text, .ArticleTitle .title_text, .CafeViewer, .se-viewer"
+FRAME_OR_CONTENT_SELECTOR = ", ".join(
+    ["iframe#cafe_main", LIST_ROW_SELECTOR, DETAIL_READY_SELECTOR]
+)
+
+# 행 수가 stable 회 연속 같으면 true (폴링 간 상태는 window에 토큰별로 보관)
+_STABLE_ROWS_JS = r"""
+([sel, stable, token]) => {
+  const n = document.querySelectorAll(sel).length;
+  const box = (window.__ncsReady = window.__ncsReady || {});
+  const st = box[token] || (box[token] = { last: -1, hits: 0 });
+  if (n > 0 && n === st.last) st.hits += 1;
+  else { st.last = n; st.hits = 0; }
+  return st.hits >= stable;
+}
+"""
+
+
+class AdaptiveTimeout:
+    """
+    최근 window 개 관측값의 p95 × factor 를 타임아웃으로 사용
+    - 관측 전에는 initial_ms
+    - 타임아웃으로 끝난 대기는 현재값 × 1.5 로 기록해 점차 늘어나게 함
+    """
+
+    def __init__(
+        self,
+        initial_ms: int,
+        min_ms: int = 500,
+        max_ms: int | None = None,
+        window: int = 20,
+        factor: float = 2.0,
+    ):
+        self.initial_ms = int(initial_ms)
+        self.min_ms = int(min_ms)
+        self.max_ms = int(max_ms if max_ms is not None else max(initial_ms * 2, min_ms))
+        self.factor = factor
+        self.samples: Deque[float] = deque(maxlen=window)
+
+    def current(self) -> int:
+        if not self.samples:
+            return self.initial_ms
+        ordered = sorted(self.samples)
+        p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+        return int(min(self.max_ms, max(self.min_ms, p95 * self.factor)))
+
+    def observe(self, elapsed_ms: float, timed_out: bool = False) -> None:
+        self.samples.append(self.current() * 1.5 if timed_out else elapsed_ms)
+
+
+class Readiness:
+    """페이지 타입별 준비 대기 (sync: wait_*, async: await_*)"""
+
+    def __init__(
+        self,
+        frame_ms: int,
+        list_ms: int,
+        detail_ms: int,
+        stable_polls: int = 2,
+        poll_ms: int = 100,
+        retries: int = 1,
+    ):
+        self.timeouts: Dict[str, AdaptiveTimeout] = {
+            "frame": AdaptiveTimeout(frame_ms),
+            "list": AdaptiveTimeout(list_ms, min_ms=list_ms),
+            "detail": AdaptiveTimeout(detail_ms, min_ms=detail_ms),
+        }
+        self.retries = max(0, int(retries))
+        self.stable_polls = stable_polls
+        self.poll_ms = poll_ms
+        self._tokens = itertools.count(1)
+
+    def _stable_arg(self, selector: Optional[str]) -> list:
+        return [selector or LIST_ROW_SELECTOR, self.stable_polls, f"t{next(self._tokens)}"]
+
+    def _record(self, kind: str, start: float, ok: bool) -> bool:
+        self.timeouts[kind].observe((time.monotonic() - start) * 1000, timed_out=not ok)
+        return ok
+
+    def _run(self, kind: str, fn: Callable[[int], object], retries: int = 0) -> bool:
+        for _ in range(retries + 1):
+            start = time.monotonic()
+            try:
+                fn(self.timeouts[kind].current())
+                ok = True
+            except Exception:
+                ok = False
+            if self._record(kind, start, ok):
+                return True
+        return False
+
+    async def _arun(self, kind: str, fn, retries: int = 0) -> bool:
+        for _ in range(retries + 1):
+            start = time.monotonic()
+            try:
+                await fn(self.timeouts[kind].current())
+                ok = True
+            except Exception:
+                ok = False
+            if self._record(kind, start, ok):
+                return True
+        return False
+
+    # ------------------------------------------------------------------
+    # sync (playwright.sync_api)
+    # ------------------------------------------------------------------
+    def wait_frame_or_content(self, page, selector: Optional[str] = None) -> bool:
+        sel = selector or FRAME_OR_CONTENT_SELECTOR
+        return self._run("frame", lambda t: page.wait_for_selector(sel, timeout=t))
+
+    def wait_list(self, target, selector: Optional[str] = None) -> bool:
+        """selector: 목록 행 셀렉터 (레이아웃 프로필이 알려주면 해당 스킨 것만)"""
+        return self._run(
+            "list",
+            lambda t: target.wait_for_function(
+                _STABLE_ROWS_JS, arg=self._stable_arg(selector), polling=self.poll_ms, timeout=t
+            ),
+            self.retries,
+        )
+
+    def wait_detail(self, target) -> bool:
+        return self._run(
+            "detail",
+            lambda t: target.wait_for_selector(DETAIL_READY_SELECTOR, timeout=t),
+            self.retries,
+        )
+
+    # ------------------------------------------------------------------
+    # async (playwright.async_api)
+    # ------------------------------------------------------------------
+    async def await_frame_or_content(self, page, selector: Optional[str] = None) -> bool:
+        sel = selector or FRAME_OR_CONTENT_SELECTOR
+        return await self._arun("frame", lambda t: page.wait_for_selector(sel, timeout=t))
+
+    async def await_list(self, target, selector: Optional[str] = None) -> bool:
+        return await self._arun(
+            "list",
+            lambda t: target.wait_for_function(
+                _STABLE_ROWS_JS, arg=self._stable_arg(selector), polling=self.poll_ms, timeout=t
+            ),
+            self.retries,
+        )
+
+    async def await_detail(self, target) -> bool:
+        return await self._arun(
+            "detail",
+            lambda t: target.wait_for_selector(DETAIL_READY_SELECTOR, timeout=t),
+            self.retries,
+        )
@@ -1,7 +1,8 @@
 # naver_cafe_scraper/utils.py
 import os
 import re
-from typing import Optional, Dict, List
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Dict, Iterable, List
 
 import unicodedata
 
@@ -10,7 +11,10 @@ __all__ = [
     "build_page_url",
     "load_storage_state",
     "save_storage_state",
+    "aload_storage_state",
+    "asave_storage_state",
     "clean_for_kobert",
+    "clean_many",
 ]
 
 
@@ -55,19 +59,70 @@ def save_storage_state(context, state_path: Optional[str] = None) -> None:
         context.storage_state(path=state_path)
 
 
+async def aload_storage_state(browser, state_path: Optional[str] = None):
+    """load_storage_state의 비동기 버전 (playwright.async_api Browser)"""
+    kwargs = {}
+    if state_path and os.path.exists(state_path):
+        kwargs["storage_state"] = state_path
+    return await browser.new_context(**kwargs)
+
+
+async def asave_storage_state(context, state_path: Optional[str] = None) -> None:
+    """save_storage_state의 비동기 버전"""
+    if state_path:
+        ensure_dir(os.path.dirname(state_path))
+        await context.storage_state(path=state_path)
+
+
 # -----------------------------------------------------------------------------
 # 텍스트 클리닝 (KoBERT 학습용, 사전/고정 토큰 미사용)
 # - URL/이메일/전화번호는 '보존'합니다.
 # - 문자군 통계/패턴 기반으로 노이즈 라인 제거
 # -----------------------------------------------------------------------------
+_TIME_RE = re.compile(r"\b\d{1,2}:\d{2}\b")
+_SYMBOL_RUN_RE = re.compile(r"(?:[=\-_*~·•\.]{3,})")
+_SYMBOL_ONLY_RE = re.compile(r"[\[\]{}()<>/\\|:;^`'\",.!?~=\-_* +]+")
+_CONTROL_RE = re.compile(r"[\u0000-\u001F\u007F]")
+_LINE_SPLIT_RE = re.compile(r"\r?\n+")
+_MULTI_SPACE_RE = re.compile(r"\s{2,}")
+_REPEAT_SYMBOL_RE = re.compile(r"([~\-_=·•])\1{2,}")
+_DEDUP_KEY_RE = re.compile(r"[^\w\u3131-\u318E\uAC00-\uD7A3]+")
+# " " 외의 공백 문자(\s) — 없으면 줄 단위 \s{2,} 치환을 건너뜀 (유니코드 공백은 U+3000 이하)
+_OTHER_SPACES = tuple(ch for ch in map(chr, range(0x3001)) if ch.isspace() and ch != " ")
+
+
+class _CharClassTable(dict):
+    """
+    str.translate 용 코드포인트 → 문자군 한 글자 (처음 본 문자만 분류해 저장)
+    k: 한글(음절/호환 자모), e: 영문, n: 숫자(isdigit), s: 공백(" "), o: 기타(기호)
+    """
+
+    def __missing__(self, code: int) -> str:
+        ch = chr(code)
+        if "\uAC00" <= ch <= "\uD7A3" or "\u3131" <= ch <= "\u318E":
+            cls = "k"
+        elif ("A" <= ch <= "Z") or ("a" <= ch <= "z"):
+            cls = "e"
+        elif ch.isdigit():
+            cls = "n"
+        elif ch == " ":
+            cls = "s"
+        else:
+            cls = "o"
+        self[code] = cls
+        return cls
+
+
+_CHAR_CLASS = _CharClassTable()
+
+
 def _char_stats(s: str) -> Dict[str, float]:
-    """문자군 통계: 한글/영문/숫자/공백/기호 비율 등"""
+    """문자군 통계: 한글/영문/숫자/공백/기호 비율 등 (문자 분류는 translate 1회)"""
     total = len(s)
     if total == 0:
         return {"total": 0, "ko": 0, "en": 0, "num": 0, "space": 0, "sym": 0}
-    ko = sum(1 for ch in s if "\uAC00" <= ch <= "\uD7A3" or "\u3131" <= ch <= "\u318E")
-    en = sum(1 for ch in s if ("A" <= ch <= "Z") or ("a" <= ch <= "z"))
-    num = sum(1 for ch in s if ch.isdigit())
+    classes = s.translate(_CHAR_CLASS)
+    ko, en, num = classes.count("k"), classes.count("e"), classes.count("n")
     space = s.count(" ")
     sym = total - (ko + en + num + space)
     return {
@@ -80,30 +135,33 @@ def _char_stats(s: str) -> Dict[str, float]:
     }
 
 
-def _looks_like_time_only(s: str) -> bool:
+def _looks_like_time_only(s: str, stats: Optional[Dict[str, float]] = None) -> bool:
     """시간 형태(HH:MM 등)가 주를 이루고 문자 밀도가 낮은 라인"""
-    if not re.search(r"\b\d{1,2}:\d{2}\b", s):
+    if not _TIME_RE.search(s):
         return False
-    stats = _char_stats(s)
+    stats = stats or _char_stats(s)
     letter = stats["ko"] + stats["en"]
     return (letter < 0.35) and (stats["sym"] + stats["space"] > 0.4)
 
 
 def _has_long_symbol_runs(s: str) -> bool:
     """===, --- , ___ , ***** , …… 등 긴 기호런 또는 기호-only 단문"""
-    if re.search(r"(?:[=\-_*~·•\.]{3,})", s):
+    if _SYMBOL_RUN_RE.search(s):
         return True
-    if len(s) <= 20 and re.fullmatch(r"[\[\]{}()<>/\\|:;^`'\",.!?~=\-_* +]+", s.strip() or ""):
+    if len(s) <= 20 and _SYMBOL_ONLY_RE.fullmatch(s.strip() or ""):
         return True
     return False
 
 
-def _very_low_linguistic_density(s: str) -> bool:
-    """문장성 낮음: 기호 과다/짧은 무의미 토큰 등"""
-    stats = _char_stats(s)
+def _very_low_linguistic_density(s: str, stats: Optional[Dict[str, float]] = None) -> bool:
+    """문장성 낮음: 기호 과다/짧은 무의미 토큰 등 (통계는 50자 이하 라인에서만 필요)"""
+    if len(s) > 50:
+        # 아주 짧은 단일 토큰
+        return len(s.strip()) <= 1
+    stats = stats or _char_stats(s)
     letter = stats["ko"] + stats["en"]
     # 짧고 symbol heavy 이거나 글자 밀도 낮음
-    if len(s) <= 50 and (stats["sym"] >= 0.40 or letter < 0.30):
+    if stats["sym"] >= 0.40 or letter < 0.30:
         return True
     # 아주 짧은 단일 토큰
     if len(s.strip()) <= 1:
@@ -115,14 +173,17 @@ def _very_low_linguistic_density(s: str) -> bool:
 
 
 def _is_noisy_line(line: str) -> bool:
-    """사전 없이 노이즈 라인 판별"""
+    """사전 없이 노이즈 라인 판별 (문자군 통계는 라인당 1회만 계산)"""
     if not line or not line.strip():
         return True
-    if _looks_like_time_only(line):
-        return True
+    stats: Optional[Dict[str, float]] = None
+    if _TIME_RE.search(line):
+        stats = _char_stats(line)
+        if _looks_like_time_only(line, stats):
+            return True
     if _has_long_symbol_runs(line):
         return True
-    if _very_low_linguistic_density(line):
+    if _very_low_linguistic_density(line, stats):
         return True
     return False
 
@@ -130,12 +191,13 @@ def _is_noisy_line(line: str) -> bool:
 def _normalize_visible_text(s: str) -> str:
     """언어 불문 공통 정규화"""
     s = unicodedata.normalize("NFKC", s or "")
-    # 제어문자 제거
-    s = re.sub(r"[\u0000-\u001F\u007F]", " ", s)
+    # 제어문자 제거 (탭/줄바꿈 포함)
+    s = _CONTROL_RE.sub(" ", s)
     # ZWSP 제거
     s = s.replace("\u200b", "")
-    # 여분 공백 정리
-    s = re.sub(r"[ \t]+", " ", s)
+    # 여분 공백 정리 (탭은 위에서 공백이 됐으므로 연속 공백만 축약)
+    while "  " in s:
+        s = s.replace("  ", " ")
     return s.strip()
 
 
@@ -149,13 +211,14 @@ def clean_for_kobert(text: str) -> str:
         return ""
 
     text = _normalize_visible_text(text)
-    raw_lines = [l.strip() for l in re.split(r"\r?\n+", text)]
+    raw_lines = [l.strip() for l in _LINE_SPLIT_RE.split(text)] if "\n" in text else [text]
     cleaned: List[str] = []
     seen = set()
 
     for line in raw_lines:
         # 기본 공백 정리
-        line = re.sub(r"\s{2,}", " ", line).strip()
+        if "  " in line or any(ch in line for ch in _OTHER_SPACES):
+            line = _MULTI_SPACE_RE.sub(" ", line).strip()
         if not line:
             continue
 
@@ -164,14 +227,27 @@ def clean_for_kobert(text: str) -> str:
             continue
 
         # 반복 기호 축약 (~~~~, ---- 등)
-        line = re.sub(r"([~\-_=·•])\1{2,}", r"\1\1", line).strip()
+        line = _REPEAT_SYMBOL_RE.sub(r"\1\1", line).strip()
         if not line:
             continue
 
         # 중복 제거 키(문자/숫자/한글만 비교) — 원문 표기는 유지
-        key = re.sub(r"[^\w\u3131-\u318E\uAC00-\uD7A3]+", "", line).lower()
+        key = _DEDUP_KEY_RE.sub("", line).lower()
         if key and key not in seen:
             seen.add(key)
             cleaned.append(line)
 
     return "\n".join(cleaned).strip()
+
+
+def clean_many(texts: Iterable[str], workers: int = 0, chunksize: int = 256) -> List[str]:
+    """
+    clean_for_kobert 일괄 적용 (입력 순서 유지)
+    - workers > 1 이면 프로세스 풀에서 chunksize 개씩 나눠 처리 (데이터셋 생성 등 대량 처리용)
+    - 입력이 chunksize 보다 적으면 프로세스를 띄우지 않고 바로 처리
+    """
+    texts = list(texts)
+    if workers <= 1 or len(texts) <= chunksize:
+        return [clean_for_kobert(t) for t in texts]
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        return list(ex.map(clean_for_kobert, texts, chunksize=chunksize))
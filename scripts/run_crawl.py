@@ -2,11 +2,13 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
 import os
 import sys
-from typing import Optional
+from typing import Callable, Dict, List, Optional, Union
 
-from naver_cafe_scraper import CafeCrawler, save_csv, save_json
+from naver_cafe_scraper import AsyncCafeCrawler, CafeCrawler, save_csv, save_json
+from naver_cafe_scraper.exporter import CsvSink, JsonlSink
 from naver_cafe_scraper import config as cfg
 from naver_cafe_scraper.utils import ensure_dir
 
@@ -26,6 +28,17 @@ def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
         default=None,
         help="JSON 저장 경로(선택). 지정 시 CSV와 함께 저장",
     )
+    p.add_argument(
+        "--jsonl",
+        type=str,
+        default=None,
+        help="JSON Lines 저장 경로(선택). 페이지마다 바로 추가 기록 (.gz/.zst 면 압축)",
+    )
+    p.add_argument(
+        "--stream",
+        action="store_true",
+        help="CSV도 페이지마다 바로 추가 기록(고정 컬럼). 끝에 한꺼번에 쓰지 않음",
+    )
     p.add_argument(
         "--base-url",
         type=str,
@@ -37,6 +50,31 @@ def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
         action="store_true",
         help="상세 페이지(본문/이미지/외부링크 등)까지 함께 수집",
     )
+    p.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="상세 페이지 동시 수집 수 (2 이상이면 비동기 크롤러 사용)",
+    )
+    p.add_argument(
+        "--incremental",
+        action="store_true",
+        help="게시글 인덱스(NCS_INDEX_PATH)에 없는 새 글만 수집, 전부 본 글인 페이지에서 중단",
+    )
+    p.add_argument(
+        "--checkpoint",
+        type=str,
+        nargs="?",
+        const=cfg.CHECKPOINT_PATH,
+        default=None,
+        help="완료된 페이지/글 번호를 체크포인트에 기록 (경로 생략 시 NCS_CHECKPOINT_PATH)."
+        " --stream/--jsonl 출력과 함께 사용",
+    )
+    p.add_argument(
+        "--resume",
+        action="store_true",
+        help="이전 실행의 체크포인트에서 이어서 수집 (--checkpoint 포함, 출력 파일에 이어 쓰기)",
+    )
     p.add_argument(
         "--progress",
         action="store_true",
@@ -45,29 +83,92 @@ def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
     return p.parse_args(argv)
 
 
+def _run_batches(
+    crawler: Union[CafeCrawler, AsyncCafeCrawler],
+    collect_kwargs: dict,
+    on_batch: Callable[[List[Dict[str, object]]], None],
+) -> None:
+    """crawler.iter_collect 배치를 순서대로 on_batch 에 전달 (sync/async 크롤러 공통)"""
+    if isinstance(crawler, AsyncCafeCrawler):
+
+        async def run() -> None:
+            async for batch in crawler.iter_collect(**collect_kwargs):
+                on_batch(batch)
+
+        asyncio.run(run())
+    else:
+        for batch in crawler.iter_collect(**collect_kwargs):
+            on_batch(batch)
+
+
 def main() -> int:
     args = parse_args()
 
     # base_url 기본값을 config에서 채움
     base_url = args.base_url or cfg.BASE_URL
+    checkpoint = args.checkpoint or (cfg.CHECKPOINT_PATH if args.resume else None)
+    # 끝에 한꺼번에 저장하는 포맷이 남아 있을 때만 전체 행을 메모리에 보관
+    keep_rows = bool(args.json) or (bool(args.output) and not args.stream)
+    streaming = bool(args.jsonl) or (bool(args.output) and args.stream)
+    if checkpoint and (keep_rows or not streaming):
+        # 체크포인트에는 진행 정보만 남으므로 결과 행은 페이지마다 기록하는 출력에 있어야 함
+        print(
+            "[ERR] --checkpoint/--resume 은 --stream(CSV) 또는 --jsonl 출력과만 사용할 수 있습니다"
+        )
+        return 1
 
-    crawler = CafeCrawler(
+    crawler_kwargs = dict(
         base_url=base_url,
         headless=cfg.HEADLESS,
         state_path=cfg.STATE_PATH,
         wait_ms=cfg.WAIT_MS,
     )
-
-    rows = crawler.collect(
+    collect_kwargs = dict(
         max_pages=args.pages,
         base_url=base_url,
         fetch_detail=args.detail,
         per_detail_delay_sec=0.5,
         show_progress=args.progress,  # ← 진척도 표시
+        incremental=args.incremental,
+        checkpoint_path=checkpoint,
+        resume=args.resume,
     )
 
+    if args.concurrency > 1:
+        crawler = AsyncCafeCrawler(concurrency=args.concurrency, **crawler_kwargs)
+    else:
+        crawler = CafeCrawler(**crawler_kwargs)
+
+    # 스트리밍 싱크: 페이지 배치마다 바로 기록
+    sinks = []
+    if args.stream and args.output:
+        sinks.append(CsvSink(args.output, append=args.resume))
+    if args.jsonl:
+        sinks.append(JsonlSink(args.jsonl, append=args.resume))
+    # 끝에 한꺼번에 저장하면 증분 인덱스도 저장이 끝난 뒤에 기록 (중간에 죽으면 저장 못 한 글은 다음에 다시 수집)
+    collect_kwargs["defer_index"] = keep_rows
+
+    rows: List[Dict[str, object]] = []
+    total = 0
+
+    def on_batch(batch: List[Dict[str, object]]) -> None:
+        nonlocal total
+        for sink in sinks:
+            sink.write_batch(batch)
+        total += len(batch)
+        if keep_rows:
+            rows.extend(batch)
+
+    try:
+        _run_batches(crawler, collect_kwargs, on_batch)
+    finally:
+        for sink in sinks:
+            sink.close()
+    for sink in sinks:
+        print(f"[save] {type(sink).__name__}: {sink.path} ({sink.rows_written}건)")
+
     # 저장
-    if args.output:
+    if args.output and not args.stream:
         ensure_dir(os.path.dirname(args.output))
         save_csv(rows, args.output)
         print(f"[save] CSV: {args.output}")
@@ -77,7 +178,14 @@ def main() -> int:
         save_json(rows, args.json)
         print(f"[save] JSON: {args.json}")
 
-    print(f"[done] 총 {len(rows)}건")
+    if keep_rows and args.incremental:
+        print(f"[index] 증분 인덱스 기록: {crawler.commit_index()}건")
+
+    # 저장까지 끝났으면 체크포인트는 더 필요 없음
+    if checkpoint and os.path.exists(checkpoint):
+        os.remove(checkpoint)
+
+    print(f"[done] 총 {total}건")
     return 0
 
 
@@ -0,0 +1,267 @@
+# scripts/run_ocr.py
+
+# 수집이 끝난 결과에 OCR 만 따로 적용 (브라우저 없이 images URL 을 직접 다운로드)
+# python -m scripts.run_ocr ^
+#   --input data/output/naver_cafe_titles.jsonl ^
+#   --output data/output/naver_cafe_titles_ocr.jsonl ^
+#   --workers 6 --resume
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import io
+import json
+import os
+import sys
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Deque, Dict, List, Optional, TextIO, Tuple
+
+# 프로젝트 루트 경로를 sys.path에 추가
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from naver_cafe_scraper import config as cfg
+from naver_cafe_scraper.checkpoint import CrawlCheckpoint
+from naver_cafe_scraper.exporter import JsonlSink, save_json, save_parquet
+from naver_cafe_scraper.index import article_key
+from naver_cafe_scraper.ocr import ImageFetcher, OcrCache, OcrGate, OcrWorkerPool, SessionRequest
+from naver_cafe_scraper.parser import (
+    merge_ocr_texts,
+    merged_ocr_texts,
+    ocr_available,
+    ocr_settings_key,
+)
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    p = argparse.ArgumentParser(description="수집 결과(images URL)에 OCR 적용 → content_text 갱신")
+    p.add_argument(
+        "--input", required=True, help="수집 결과 경로 (.json / .jsonl(.gz, .zst) / .parquet)"
+    )
+    p.add_argument("--output", help="저장 경로 (미지정 시 입력 파일명 뒤에 _ocr, 같은 포맷)")
+    p.add_argument("--workers", type=int, default=cfg.OCR_WORKERS, help="OCR 프로세스 수")
+    p.add_argument("--fetch-threads", type=int, default=8, help="이미지 동시 다운로드 수")
+    p.add_argument(
+        "--cache",
+        default=cfg.OCR_CACHE_PATH,
+        help="OCR 결과 캐시 경로 (빈 값이면 사용 안 함)",
+    )
+    p.add_argument(
+        "--checkpoint",
+        help="체크포인트 경로 (미지정 시 <output>.ckpt.jsonl, 행마다 OCR 결과 기록)",
+    )
+    p.add_argument("--resume", action="store_true", help="이전 실행의 체크포인트에서 이어서 처리")
+    p.add_argument("--progress", action="store_true", help="콘솔에 진행상황 표시")
+    return p.parse_args(argv)
+
+
+# -----------------------------------------------------------------------------
+# 입출력
+# -----------------------------------------------------------------------------
+def _open_text_reader(path: str) -> TextIO:
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt", encoding="utf-8")
+    if path.endswith(".zst"):
+        import zstandard
+
+        raw = open(path, "rb")
+        return io.TextIOWrapper(zstandard.ZstdDecompressor().stream_reader(raw), encoding="utf-8")
+    return open(path, "r", encoding="utf-8")
+
+
+def _format_of(path: str) -> str:
+    base = path[: -len(".gz")] if path.endswith(".gz") else path
+    base = base[: -len(".zst")] if base.endswith(".zst") else base
+    ext = os.path.splitext(base)[1].lower().lstrip(".")
+    if ext not in {"json", "jsonl", "parquet"}:
+        raise ValueError(f"지원하지 않는 확장자: {path}")
+    return ext
+
+
+def load_rows(path: str) -> List[Dict[str, Any]]:
+    fmt = _format_of(path)
+    if fmt == "parquet":
+        import pyarrow.parquet as pq
+
+        return pq.read_table(path).to_pylist()
+    with _open_text_reader(path) as f:
+        if fmt == "jsonl":
+            return [json.loads(line) for line in f if line.strip()]
+        data = json.load(f)
+    if isinstance(data, dict) and "rows" in data:
+        return data["rows"]  # {"rows":[...]} 형태도 허용
+    if isinstance(data, list):
+        return data
+    raise ValueError("Unsupported JSON structure")
+
+
+def save_rows(rows: List[Dict[str, Any]], path: str) -> str:
+    fmt = _format_of(path)
+    if fmt == "parquet":
+        return save_parquet(rows, path)
+    if fmt == "json":
+        return save_json(rows, path)
+    with JsonlSink(path) as sink:
+        sink.write_batch(rows)
+    return sink.path
+
+
+def default_output(path: str) -> str:
+    """a/b.jsonl.gz → a/b_ocr.jsonl.gz"""
+    head, name = os.path.split(path)
+    stem, dot, rest = name.partition(".")
+    return os.path.join(head, f"{stem}_ocr{dot}{rest}")
+
+
+def image_urls(row: Dict[str, Any]) -> List[str]:
+    """images 컬럼 → URL 리스트 (CSV 에서 변환된 JSON 문자열도 허용)"""
+    v = row.get("images")
+    if isinstance(v, str):
+        try:
+            v = json.loads(v) if v.strip().startswith("[") else [v]
+        except ValueError:
+            v = [v]
+    return [str(u) for u in (v or []) if u]
+
+
+# -----------------------------------------------------------------------------
+# OCR 파이프라인: 다운로드(스레드) → OCR(프로세스 풀) → 행 순서대로 병합/체크포인트
+# -----------------------------------------------------------------------------
+def _make_session(threads: int):
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    retry = Retry(total=2, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504))
+    adapter = HTTPAdapter(pool_connections=threads, pool_maxsize=threads, max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def backfill(
+    rows: List[Dict[str, Any]],
+    pool: OcrWorkerPool,
+    fetcher: ImageFetcher,
+    ckpt: Optional[CrawlCheckpoint] = None,
+    fetch_threads: int = 8,
+    chunk_rows: int = 32,
+    show_progress: bool = False,
+) -> Dict[str, int]:
+    """
+    rows 의 content_text 에 이미지 OCR 텍스트를 병합 (rows 를 그대로 수정)
+    - 체크포인트에 결과가 있는 행은 다운로드/OCR 없이 기록된 content_text 로 복원
+    - 이미 OCR 텍스트가 병합된 행(ocr_texts 있음, 이전 실행의 출력 등)은 건너뜀
+    - 다운로드는 chunk_rows 행씩 fetch_threads 개 동시, OCR 은 워커 풀에서 계속 진행
+    - 캐시에 URL 이 있는 이미지는 다운로드 생략
+    """
+    stats = {"rows": 0, "resumed": 0, "already_ocr": 0, "no_images": 0, "ocr": 0}
+    pending: Deque[Tuple[Dict[str, Any], str, List[Future]]] = deque()
+    max_pending_rows = max(chunk_rows, pool.max_pending)
+
+    def finish() -> None:
+        row, key, futures = pending.popleft()
+        merge_ocr_texts(row, OcrWorkerPool.results(futures))
+        if ckpt is not None:
+            done = {"content_text": row.get("content_text"), "ocr_texts": row.get("ocr_texts")}
+            ckpt.add_detail(0, key, done)
+        stats["ocr"] += 1
+
+    def download(src: str) -> bytes:
+        if pool.skip_capture(src):
+            return b""
+        return fetcher.fetch(src) or b""
+
+    with ThreadPoolExecutor(max_workers=max(1, fetch_threads)) as threads:
+        for start in range(0, len(rows), chunk_rows):
+            todo: List[Tuple[Dict[str, Any], str, List[str]]] = []
+            for i, row in enumerate(rows[start : start + chunk_rows], start):
+                stats["rows"] += 1
+                key = article_key(row) or f"#{i}"
+                done = ckpt.detail(key) if ckpt is not None else None
+                urls = image_urls(row)
+                if done is not None:
+                    row["content_text"] = done.get("content_text")
+                    if done.get("ocr_texts"):
+                        row["ocr_texts"] = done["ocr_texts"]
+                    stats["resumed"] += 1
+                elif merged_ocr_texts(row):
+                    stats["already_ocr"] += 1
+                elif not urls:
+                    stats["no_images"] += 1
+                else:
+                    todo.append((row, key, urls))
+
+            srcs = [u for _row, _key, urls in todo for u in urls]
+            datas = iter(threads.map(download, srcs))
+            for row, key, urls in todo:
+                images = [(u, next(datas)) for u in urls]
+                pending.append((row, key, pool.submit_many(images)))
+
+            # 앞에서부터 끝난 행은 바로 병합, 밀린 행이 너무 많으면 기다림
+            while pending and (
+                len(pending) > max_pending_rows or all(f.done() for f in pending[0][2])
+            ):
+                finish()
+            if show_progress:
+                sys.stdout.write(f"[ocr] {stats['rows']}/{len(rows)}\r")
+                sys.stdout.flush()
+
+    while pending:
+        finish()
+    return stats
+
+
+def main() -> int:
+    args = parse_args()
+    if not os.path.exists(args.input):
+        print(f"[ERR] 입력 파일이 없습니다: {args.input}")
+        return 1
+    if not ocr_available():
+        print("[ERR] OCR 엔진(tesserocr/pytesseract + Tesseract)을 찾을 수 없습니다")
+        return 1
+
+    output = args.output or default_output(args.input)
+    ckpt_path = args.checkpoint or f"{output}.ckpt.jsonl"
+    rows = load_rows(args.input)
+
+    meta = {"stage": "ocr", "input": os.path.abspath(args.input), "ocr": ocr_settings_key()}
+    ckpt = CrawlCheckpoint(ckpt_path, meta, resume=args.resume)
+    cache = OcrCache(args.cache, max_entries=cfg.OCR_CACHE_MAX_ENTRIES) if args.cache else None
+    gate = OcrGate() if cfg.OCR_GATE else None
+    session = _make_session(args.fetch_threads)
+    fetcher = ImageFetcher(SessionRequest(session))
+
+    try:
+        with OcrWorkerPool(args.workers, cache=cache, gate=gate) as pool:
+            stats = backfill(
+                rows,
+                pool,
+                fetcher,
+                ckpt,
+                fetch_threads=args.fetch_threads,
+                show_progress=args.progress,
+            )
+            print(f"\n[ocr] {stats} pool={pool.stats} fetch={fetcher.stats}")
+            if cache is not None:
+                print(f"[ocr] cache={dict(cache.stats)}")
+            if gate is not None:
+                print(f"[ocr] gate={dict(gate.stats)}")
+    finally:
+        ckpt.close()
+        session.close()
+
+    out = save_rows(rows, output)
+    print(f"[save] {out} ({len(rows)}건)")
+
+    # 저장까지 끝났으면 체크포인트는 더 필요 없음
+    os.remove(ckpt_path)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
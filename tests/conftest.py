@@ -1,7 +1,131 @@
 import os
 import sys
+import types
+
+import pytest
 
 # 프로젝트 루트 경로 추가
 ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if ROOT_DIR not in sys.path:
     sys.path.insert(0, ROOT_DIR)
+
+# 테스트 중 레이아웃 프로필을 data/ 에 쓰지 않도록 메모리 캐시 사용
+os.environ.setdefault("NCS_LAYOUT_CACHE", "")
+
+# OCR 결과 캐시도 data/ 에 만들지 않음
+os.environ.setdefault("NCS_OCR_CACHE", "")
+
+
+# -----------------------------------------------------------------------------
+# sync Playwright 흉내 (CafeCrawler.collect 흐름 테스트용)
+# -----------------------------------------------------------------------------
+class FakePage:
+    """goto 한 URL, 기다린 셀렉터만 기록 (대기는 항상 즉시 성공)"""
+
+    def __init__(self):
+        self.url = ""
+        self.urls = []
+        self.selectors = []
+
+    def goto(self, url, **kw):
+        self.url = url
+        self.urls.append(url)
+
+    def frames(self):
+        return []
+
+    def wait_for_selector(self, selector, **kw):
+        self.selectors.append(selector)
+
+    def wait_for_function(self, *a, **kw):
+        pass
+
+    def content(self):
+        return f"<html><!-- {self.url} --></html>"
+
+    def close(self):
+        pass
+
+
+class FakeContext:
+    """new_page 마다 새 FakePage (pages[0] = 목록 탭, 이후는 상세 탭)"""
+
+    def __init__(self):
+        self.pages = []
+
+    @property
+    def page(self):
+        return self.pages[0]
+
+    def new_page(self):
+        self.pages.append(FakePage())
+        return self.pages[-1]
+
+    def storage_state(self, **kw):
+        return {}
+
+    def close(self):
+        pass
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.context = FakeContext()
+        self.closed = 0
+
+    def new_context(self, **kw):
+        return self.context
+
+    def reset(self):
+        """다음 collect 는 새 컨텍스트(새 탭)로"""
+        self.context = FakeContext()
+        return self.context
+
+    def close(self):
+        self.closed += 1
+
+
+class FakePlaywright:
+    def __init__(self, browser):
+        self.chromium = types.SimpleNamespace(launch=lambda **kw: browser)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *a):
+        return False
+
+
+@pytest.fixture
+def fake_browser(monkeypatch):
+    """crawler.sync_playwright 를 FakePlaywright 로 교체 (페이지 사이 대기 없음)"""
+    import naver_cafe_scraper.crawler as crawler_mod
+
+    browser = FakeBrowser()
+    monkeypatch.setattr(crawler_mod, "sync_playwright", lambda: FakePlaywright(browser))
+    monkeypatch.setattr(crawler_mod, "REQUEST_DELAY_SEC", 0)
+    return browser
+
+
+@pytest.fixture
+def list_pages(fake_browser, monkeypatch):
+    """
+    board(페이지 번호 → 목록 행)로 extract_posts_from_frame 을 대신함
+    list_pages(board) 호출마다 새 컨텍스트, 방문한 페이지 번호 리스트 반환
+    """
+    import naver_cafe_scraper.crawler as crawler_mod
+
+    def use(board):
+        visited = []
+        ctx = fake_browser.reset()
+
+        def fake_extract(target):
+            p = int(ctx.page.url.rsplit("page=", 1)[1])
+            visited.append(p)
+            rows = board(p) if callable(board) else board.get(p, [])
+            return [dict(r) for r in rows]
+
+        monkeypatch.setattr(crawler_mod, "extract_posts_from_frame", fake_extract)
+        return visited
+
+    return use
@@ -0,0 +1,137 @@
+import asyncio
+import types
+
+from naver_cafe_scraper.async_crawler import AsyncCafeCrawler
+
+
+class FakePage:
+    def __init__(self):
+        self.urls = []
+        self.frames = []
+
+    async def goto(self, url, **kwargs):
+        self.urls.append(url)
+
+    async def wait_for_selector(self, *a, **kw):
+        raise TimeoutError("not found")
+
+    async def wait_for_timeout(self, ms):
+        return
+
+    async def close(self):
+        pass
+
+
+class FakeContext:
+    def __init__(self):
+        self.pages = []
+
+    async def new_page(self):
+        page = FakePage()
+        self.pages.append(page)
+        return page
+
+    async def storage_state(self, **kw):
+        return {}
+
+    async def close(self):
+        pass
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.ctx = FakeContext()
+
+    async def new_context(self, **kw):
+        return self.ctx
+
+    async def close(self):
+        pass
+
+
+class FakeAsyncPlaywright:
+    def __init__(self):
+        async def launch(**kw):
+            return FakeBrowser()
+
+        self.chromium = types.SimpleNamespace(launch=launch)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *a):
+        return False
+
+
+def test_async_collect_concurrent_detail(monkeypatch):
+    import naver_cafe_scraper.async_crawler as mod
+
+    monkeypatch.setattr(mod, "async_playwright", lambda: FakeAsyncPlaywright())
+    monkeypatch.setattr(mod, "REQUEST_DELAY_SEC", 0)
+
+    async def fake_list(target):
+        return [{"title": f"T{i}", "url": f"u{i}", "author": "list"} for i in range(6)] + [
+            {"title": "T0", "url": "u0"},  # 중복 제거 대상
+        ]
+
+    in_flight = {"now": 0, "max": 0}
+
+    async def fake_detail(target):
+        in_flight["now"] += 1
+        in_flight["max"] = max(in_flight["max"], in_flight["now"])
+        await asyncio.sleep(0.01)
+        in_flight["now"] -= 1
+        # author는 빈 값 → 목록 값 유지(CrawlerCore.merge_truthy)
+        return {"content_text": "본문", "author": "", "images": []}
+
+    monkeypatch.setattr(mod, "aextract_posts_from_frame", fake_list)
+    monkeypatch.setattr(mod, "aextract_article_detail", fake_detail)
+
+    c = AsyncCafeCrawler(base_url="https://x?page=1", headless=True, wait_ms=1, concurrency=3)
+    rows = asyncio.run(c.collect(max_pages=1, fetch_detail=True, per_detail_delay_sec=0))
+
+    assert [r["url"] for r in rows] == [f"u{i}" for i in range(6)]
+    assert all(r["content_text"] == "본문" and r["author"] == "list" for r in rows)
+    assert all(r["page"] == 1 for r in rows)
+    assert 1 < in_flight["max"] <= 3
+
+
+def test_async_iter_collect_batches(monkeypatch):
+    import naver_cafe_scraper.async_crawler as mod
+
+    monkeypatch.setattr(mod, "async_playwright", lambda: FakeAsyncPlaywright())
+    monkeypatch.setattr(mod, "REQUEST_DELAY_SEC", 0)
+
+    async def fake_list(target):
+        return [{"title": "T", "url": "u0"}, {"title": "T", "url": "u0"}]
+
+    monkeypatch.setattr(mod, "aextract_posts_from_frame", fake_list)
+
+    async def run():
+        c = AsyncCafeCrawler(base_url="https://x?page=1", headless=True, wait_ms=1)
+        return [batch async for batch in c.iter_collect(max_pages=2)]
+
+    batches = asyncio.run(run())
+    assert [len(b) for b in batches] == [1, 0]
+    assert batches[0][0]["page"] == 1
+
+
+def test_async_crawler_is_a_sibling_sharing_core():
+    from naver_cafe_scraper.crawler import CafeCrawler
+
+    assert not issubclass(AsyncCafeCrawler, CafeCrawler)
+    c = AsyncCafeCrawler(base_url="https://x?page=1", headless=True, wait_ms=1, concurrency=2)
+    s = CafeCrawler(base_url="https://x?page=1", headless=True, wait_ms=1)
+    assert type(c.core) is type(s.core)
+    assert c.core.wait_ms == s.core.wait_ms == 1 and c.concurrency == 2
+    assert c.layout is c.core.layout and c.route_stats == {}
+
+    # 예전 속성/헬퍼 이름은 core 로 위임
+    for crawler in (c, s):
+        assert crawler.base_url == "https://x?page=1" and crawler.wait_ms == 1
+        crawler.wait_ms = 5
+        assert crawler.core.wait_ms == 5
+        assert crawler._merge_truthy({"a": 1, "b": 2}, {"a": None, "b": 3}) == {"a": 1, "b": 3}
+        assert crawler._resolve_url("/a/1") == "https://cafe.naver.com/a/1"
+        assert len(crawler._dedupe_rows([{"title": "t"}, {"title": "t"}], False)) == 1
+        crawler._print_progress("", end="")
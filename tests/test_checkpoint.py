@@ -0,0 +1,94 @@
+import pytest
+
+from naver_cafe_scraper.checkpoint import CrawlCheckpoint
+
+META = {"start_url": "https://x?page=1", "fetch_detail": True}
+
+
+def test_checkpoint_roundtrip_and_truncated_tail(tmp_path):
+    path = str(tmp_path / "ckpt.jsonl")
+    ck = CrawlCheckpoint(path, META)
+    ck.complete_page(1, [{"title": "A", "url": "/articles/11", "content_text": "본문"}])
+    ck.close()
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"type": "page", "page": 2, "artic')  # 강제 종료로 잘린 줄
+
+    ck = CrawlCheckpoint(path, META, resume=True)
+    assert ck.page_done(1) and not ck.page_done(2)
+    rows = [{"url": "/articles/11"}, {"url": "/articles/12"}, {"title": "키 없음"}]
+    assert ck.unfinished(rows) == rows[1:]
+    ck.complete_page(2, [])
+    ck.close()
+
+    # 진행 정보만 기록 (row 데이터 없음)
+    with open(path, encoding="utf-8") as f:
+        assert "본문" not in f.read()
+    ck = CrawlCheckpoint(path, META, resume=True)
+    assert ck.page_done(2)
+    ck.close()
+
+    # resume 없이 열면 새로 시작
+    ck = CrawlCheckpoint(path, META)
+    ck.close()
+    assert not CrawlCheckpoint(path, META, resume=True).page_done(1)
+
+
+def test_checkpoint_keeps_detail_records(tmp_path):
+    # OCR 백필(scripts/run_ocr.py)은 행마다 결과를 기록해 두고 재개
+    path = str(tmp_path / "ckpt.jsonl")
+    ck = CrawlCheckpoint(path, META)
+    ck.add_detail(0, "u1", {"content_text": "본문"})
+    ck.close()
+    ck = CrawlCheckpoint(path, META, resume=True)
+    assert ck.detail("u1") == {"content_text": "본문"} and ck.detail("u2") is None
+    ck.close()
+
+
+def test_checkpoint_meta_mismatch(tmp_path):
+    path = str(tmp_path / "ckpt.jsonl")
+    CrawlCheckpoint(path, META).close()
+    with pytest.raises(ValueError):
+        CrawlCheckpoint(path, {**META, "fetch_detail": False}, resume=True)
+
+
+def _board(p):
+    return [{"title": f"T{p}-{i}", "url": f"/articles/{p}{i}"} for i in range(2)]
+
+
+def test_collect_resumes_after_interrupt(list_pages, monkeypatch, tmp_path):
+    from naver_cafe_scraper.crawler import CafeCrawler
+
+    fetched, crash = [], {"at": "/articles/21"}
+
+    def fake_fetch(self, pool, link):
+        if link == crash.get("at"):
+            crash.clear()
+            raise KeyboardInterrupt  # 2페이지 두 번째 상세에서 중단
+        fetched.append(link)
+        return {"content_text": f"본문 {link}"}
+
+    monkeypatch.setattr(CafeCrawler, "_fetch_detail", fake_fetch)
+    path = str(tmp_path / "ckpt.jsonl")
+    c = CafeCrawler(base_url="https://x?page=1", headless=True)
+    kw = dict(max_pages=3, fetch_detail=True, per_detail_delay_sec=0, checkpoint_path=path)
+
+    saved = []
+    visited = list_pages(_board)
+    with pytest.raises(KeyboardInterrupt):
+        for batch in c.iter_collect(**kw):
+            saved.extend(batch)  # 스트리밍 싱크 역할
+    assert visited == [1, 2]
+    assert [r["url"] for r in saved] == ["/articles/10", "/articles/11"]
+
+    # 재개: 그사이 새 글이 올라와 1페이지 글 하나가 2페이지로 밀림
+    new = {"title": "T0", "url": "/articles/99"}
+    shifted = {1: [new] + _board(1)[:1], 2: _board(1)[1:] + _board(2), 3: _board(3)}
+    fetched.clear()
+    visited = list_pages(shifted)
+    for batch in c.iter_collect(resume=True, **kw):
+        saved.extend(batch)
+    assert visited == [2, 3]  # 완료된 1페이지는 다시 열지 않음
+    # 이미 저장된 글(/articles/11)은 밀려 와도 다시 열지 않음, 중단된 2페이지는 처음부터
+    assert fetched == ["/articles/20", "/articles/21", "/articles/30", "/articles/31"]
+    assert [r["url"] for r in saved] == [f"/articles/{n}" for n in (10, 11, 20, 21, 30, 31)]
+    assert all(r["content_text"] == f"본문 {r['url']}" for r in saved)
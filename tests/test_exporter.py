@@ -39,9 +39,123 @@ def test_save_csv_with_fields(tmp_path):
     assert len(df) == 2
 
 
+def test_save_csv_optional_columns_only_when_present(tmp_path):
+    path = save_csv(ROWS, path=str(tmp_path / "plain.csv"))
+    columns = list(pd.read_csv(path).columns)
+    assert "head" not in columns and "ocr_texts" not in columns
+    assert columns[:2] == ["page", "article_no"] and "content_text" in columns
+
+    rows = [dict(ROWS[0], head="광고"), ROWS[1]]
+    columns = list(pd.read_csv(save_csv(rows, path=str(tmp_path / "head.csv"))).columns)
+    assert columns[:4] == ["page", "article_no", "head", "title"]
+    assert "ocr_texts" not in columns
+
+
 def test_save_json_pretty(tmp_path):
     out = tmp_path / "out.json"
     path = save_json(ROWS, path=str(out), fields=["article_no", "title"])
     data = json.loads(Path(path).read_text(encoding="utf-8"))
     assert isinstance(data, list) and len(data) == 2
     assert set(data[0].keys()) == {"article_no", "title"}
+
+
+def test_jsonl_sink_appends_batches(tmp_path):
+    import gzip
+
+    from naver_cafe_scraper.exporter import JsonlSink
+
+    for name, opener in [("out.jsonl", open), ("out.jsonl.gz", gzip.open)]:
+        path = tmp_path / name
+        with JsonlSink(path) as sink:
+            assert sink.write_batch(ROWS[:1]) == 1
+            sink.write_batch([])
+            sink.write_batch(ROWS[1:] + [{"title": "한글", "images": ["i1"]}])
+            assert sink.rows_written == 3
+        with opener(path, "rt", encoding="utf-8") as f:
+            lines = [json.loads(line) for line in f]
+        assert lines[0] == ROWS[0] and lines[2]["images"] == ["i1"]
+
+
+def test_jsonl_sink_zstd(tmp_path):
+    import pytest
+
+    zstandard = pytest.importorskip("zstandard")
+    from naver_cafe_scraper.exporter import JsonlSink
+
+    path = tmp_path / "out.jsonl.zst"
+    with JsonlSink(path) as sink:
+        sink.write_batch(ROWS)
+    with open(path, "rb") as f:
+        text = zstandard.ZstdDecompressor().stream_reader(f).read().decode("utf-8")
+    assert [json.loads(line)["article_no"] for line in text.splitlines()] == ["1", "2"]
+
+
+def test_csv_sink_fixed_schema(tmp_path):
+    from naver_cafe_scraper.exporter import PREFERRED_FIELDS, CsvSink
+
+    path = tmp_path / "out.csv"
+    with CsvSink(path) as sink:
+        sink.write_batch(ROWS)
+        sink.write_batch(
+            [{"title": "t3", "url": "u3", "head": "[광고]", "images": ["a", "b"], "extra": 1}]
+        )
+    df = pd.read_csv(path, encoding="utf-8-sig")
+    assert list(df.columns) == PREFERRED_FIELDS
+    assert "head" in df.columns and df.loc[2, "head"] == "[광고]"
+    assert len(df) == 3
+    assert json.loads(df.loc[2, "images"]) == ["a", "b"]
+
+
+def test_stream_sinks_append_on_resume(tmp_path):
+    import gzip
+
+    from naver_cafe_scraper.exporter import CsvSink, JsonlSink
+
+    csv_path, jsonl_path = tmp_path / "out.csv", tmp_path / "out.jsonl.gz"
+    for append, rows in [(False, ROWS[:1]), (True, ROWS[1:])]:
+        with CsvSink(csv_path, append=append) as a, JsonlSink(jsonl_path, append=append) as b:
+            a.write_batch(rows)
+            b.write_batch(rows)
+    df = pd.read_csv(csv_path, encoding="utf-8-sig", dtype=str)
+    assert list(df["article_no"]) == ["1", "2"]  # 헤더/BOM 은 한 번만
+    with gzip.open(jsonl_path, "rt", encoding="utf-8") as f:
+        assert [json.loads(line)["article_no"] for line in f] == ["1", "2"]
+
+
+def test_save_parquet_typed_schema(tmp_path):
+    import pytest
+
+    pq = pytest.importorskip("pyarrow.parquet")
+    from naver_cafe_scraper.exporter import save_parquet
+
+    rows = [
+        dict(ROWS[0], images=["i1", "i2"], external_links=[]),
+        # CSV 에서 읽어 온 형태: 리스트는 JSON 문자열, 결측은 NaN, 숫자는 float/문자열
+        dict(ROWS[1], article_no=2.0, read_count="1,272", images='["i3"]', like_count=float("nan")),
+    ]
+    out = save_parquet(rows, path=str(tmp_path / "out.parquet"), row_group_size=1)
+    f = pq.ParquetFile(out)
+    assert f.metadata.num_row_groups == 2
+    schema = f.schema_arrow
+    assert str(schema.field("read_count").type) == "int64"
+    assert str(schema.field("images").type) == "list<element: string>"
+    assert "RLE_DICTIONARY" in str(f.metadata.row_group(0).column(schema.get_field_index("author")))
+
+    table = f.read()
+    assert table.column("article_no").to_pylist() == ["1", "2"]
+    assert table.column("read_count").to_pylist() == [10, 1272]
+    assert table.column("like_count").to_pylist() == [1, None]
+    assert table.column("images").to_pylist() == [["i1", "i2"], ["i3"]]
+
+
+def test_save_parquet_projection(tmp_path):
+    import pytest
+
+    pq = pytest.importorskip("pyarrow.parquet")
+    from naver_cafe_scraper.exporter import save_parquet
+
+    fields = ["title", "read_count", "extra"]
+    out = save_parquet([dict(r, extra={"k": 1}) for r in ROWS], tmp_path / "p.parquet", fields)
+    table = pq.read_table(out)
+    assert table.column_names == fields
+    assert table.column("extra").to_pylist() == ['{"k": 1}', '{"k": 1}']
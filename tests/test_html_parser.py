@@ -0,0 +1,88 @@
+import pytest
+
+pytest.importorskip("selectolax")
+
+from naver_cafe_scraper import parser
+from naver_cafe_scraper.html_parser import parse_article_detail_html, parse_posts_html
+
+LIST_HTML = """
+<table class="article-table">
+  <tbody>
+    <tr>
+      <td class="td_normal type_articleNumber">13709326</td>
+      <td>
+        <a class="article" href="https://cafe.naver.com/f-e/cafes/29434212/articles/13709326">
+          <span class="head">[광고]</span>메가박스   6천원 영화표
+        </a>
+      </td>
+      <td><div class="ArticleBoardWriterInfo"><span class="nickname">탐딜을찾아</span></div></td>
+      <td class="td_normal type_date">2025.08.08.</td>
+      <td class="td_normal type_readCount">1,272</td>
+      <td class="td_normal type_likeCount">5</td>
+    </tr>
+    <tr><td>링크 없는 행</td></tr>
+  </tbody>
+</table>
+"""
+
+DETAIL_HTML = """
+<div class="ArticleTitle"><h3 class="title_text">11번가) 과학 생활동화</h3></div>
+<div class="WriterInfo"><span class="nickname">똘돌잉</span></div>
+<div class="article_info"><span class="date">2025.08.08. 23:17</span>
+  <span class="count">조회 586</span></div>
+<div class="like_no"><em class="u_cnt">9</em></div>
+<div class="se-viewer">
+  <div class="se-text-paragraph">미국 아마존 판매 1위 과학 생활동화 세트예요</div>
+  <a class="se-link" href="https://www.11st.co.kr/p/1">링크</a>
+  <a href="/relative">상대 링크</a>
+  <img src="https://img/1.jpg" alt="상품 대표 이미지 사진">
+  <img src="https://img/1.jpg">
+  <div class="se-caption">택배 배송 안내 캡션입니다</div>
+</div>
+"""
+
+
+def test_parse_posts_html_new_skin():
+    rows = parse_posts_html(LIST_HTML)
+    assert rows == [
+        {
+            "article_no": "13709326",
+            "head": "광고",
+            "title": "[광고]메가박스 6천원 영화표",
+            "url": "https://cafe.naver.com/f-e/cafes/29434212/articles/13709326",
+            "author": "탐딜을찾아",
+            "date": "2025.08.08.",
+            "read_count": 1272,
+            "like_count": 5,
+        }
+    ]
+
+
+def test_parse_posts_html_old_skin_fallback():
+    html = '<a class="article" href="/a/1">첫 글</a><a class="tit" href="/a/2">둘째 글</a>'
+    assert parse_posts_html(html) == [
+        {"title": "첫 글", "url": "/a/1"},
+        {"title": "둘째 글", "url": "/a/2"},
+    ]
+
+
+def test_parse_article_detail_html():
+    data = parse_article_detail_html(DETAIL_HTML)
+    assert data["title"] == "11번가) 과학 생활동화"
+    assert data["author"] == "똘돌잉"
+    assert data["date"] == "2025.08.08. 23:17"
+    assert data["read_count"] == 586 and data["like_count"] == 9
+    assert data["external_links"] == ["https://www.11st.co.kr/p/1"]
+    assert data["images"] == ["https://img/1.jpg"]
+    assert "미국 아마존 판매 1위" in data["content_text"]
+    assert "택배 배송 안내 캡션입니다" in data["content_text"]
+    assert data["content_html"].lstrip().startswith('<div class="se-text-paragraph">')
+
+
+def test_html_mode_uses_page_content():
+    class ContentOnly:
+        def content(self):
+            return LIST_HTML
+
+    rows = parser.extract_posts_from_frame(ContentOnly(), mode="html")
+    assert [r["article_no"] for r in rows] == ["13709326"]
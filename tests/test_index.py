@@ -0,0 +1,170 @@
+import sqlite3
+
+from naver_cafe_scraper.index import ArticleIndex, article_key
+
+
+def test_article_key_prefers_article_no():
+    assert article_key({"article_no": "13709326", "url": "x"}) == "13709326"
+    assert article_key({"url": "https://cafe.naver.com/f-e/cafes/1/articles/42?x=1"}) == "42"
+    assert article_key({"url": "/ArticleRead.nhn?clubid=1&articleid=7"}) == "7"
+    assert article_key({"url": "/etc"}) == "/etc"
+    assert article_key({}) == ""
+
+
+def test_index_known_and_mark(tmp_path):
+    path = str(tmp_path / "sub" / "index.sqlite3")
+    with ArticleIndex(path) as index:
+        rows = [{"article_no": "1", "title": "a", "url": "u1"}, {"url": "/articles/2"}]
+        assert index.known(rows) == set()
+        assert index.mark(rows, when=100.0) == 2
+        assert index.mark([{"title": "키 없음"}]) == 0
+
+    with ArticleIndex(path) as index:
+        assert len(index) == 2
+        assert index.known(rows + [{"article_no": "3"}]) == {"1", "2"}
+        assert index.last_crawled({"article_no": "1"}) == 100.0
+        index.mark([{"article_no": "1", "title": "a2", "url": "u1"}], when=200.0)
+        assert index.last_crawled({"article_no": "1"}) == 200.0
+        assert index.last_crawled({"article_no": "9"}) is None
+
+
+def test_index_changed_compares_full_dates_only(tmp_path):
+    with ArticleIndex(str(tmp_path / "i.db")) as index:
+        index.mark([{"article_no": "1", "date": "2024.01.02.", "read_count": 10}])
+        index.mark([{"article_no": "2", "date": "2024.01.03."}])
+        index.mark([{"article_no": "4", "date": "12:04"}])
+        rows = [
+            {"article_no": "1", "date": "2024. 1. 2.", "read_count": 99, "like_count": 7},
+            {"article_no": "2", "date": "2024.01.05."},  # 날짜 변화(재게시)
+            {"article_no": "3", "date": "2024.01.01."},  # 처음 보는 글은 changed 아님
+            {"article_no": "4", "date": "2024.01.04."},  # 시각만 기록된 글 → 비교 안 함
+        ]
+        assert index.changed(rows) == {"2"}
+        # 목록에 없는 값은 비교하지 않음
+        assert index.changed([{"article_no": "1"}, {"article_no": "2", "date": "09:30"}]) == set()
+        # 값 없이(시각만) 다시 기록해도 이전 비교 값 유지
+        index.mark([{"article_no": "2", "date": "09:30"}])
+        assert index.changed([{"article_no": "2", "date": "2024.01.03."}]) == set()
+
+
+def test_index_migrates_old_schema(tmp_path):
+    path = str(tmp_path / "old.db")
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE articles (key TEXT PRIMARY KEY, article_no TEXT, url TEXT, title TEXT, "
+        "last_crawled REAL NOT NULL)"
+    )
+    conn.execute("INSERT INTO articles VALUES ('1', '1', 'u1', 't', 1.0)")
+    conn.commit()
+    conn.close()
+
+    with ArticleIndex(path) as index:
+        assert index.known([{"article_no": "1"}]) == {"1"}
+        assert index.changed([{"article_no": "1", "date": "2024.01.02."}]) == set()
+        index.mark([{"article_no": "1", "date": "2024.01.02."}])
+        assert index.changed([{"article_no": "1", "date": "2024.01.09."}]) == {"1"}
+
+
+def test_incremental_collect_stops_at_known_page(list_pages, tmp_path):
+    from naver_cafe_scraper.crawler import CafeCrawler
+
+    def row(n):
+        return {"article_no": str(n), "title": f"T{n}", "url": f"/articles/{n}"}
+
+    board = {1: [row(5), row(4)], 2: [row(3), row(2)], 3: [row(1)]}
+    c = CafeCrawler(base_url="https://x?page=1", headless=True, index_path=str(tmp_path / "i.db"))
+
+    pages_seen = list_pages(board)
+    first = c.collect(max_pages=3, incremental=True)
+    assert [r["article_no"] for r in first] == ["5", "4", "3", "2", "1"]
+    assert pages_seen == [1, 2, 3]
+
+    # 새 글 2건 등장 → 1페이지는 새 글, 2페이지는 전부 본 글이라 중단
+    board = {1: [row(7), row(6)], 2: [row(5), row(4)], 3: [row(3), row(2)]}
+    pages_seen = list_pages(board)
+    second = c.collect(max_pages=3, incremental=True)
+    assert [r["article_no"] for r in second] == ["7", "6"]
+    assert pages_seen == [1, 2]
+
+    # 증분 모드가 아니면 인덱스와 무관하게 전체 수집
+    pages_seen = list_pages(board)
+    assert len(c.collect(max_pages=3)) == 6
+
+
+def _detail_spy(c, monkeypatch):
+    fetched = []
+
+    def fake_detail(pool, link):
+        fetched.append(link)
+        return {"content_text": f"본문 {link}"}
+
+    monkeypatch.setattr(c, "_fetch_detail", fake_detail)
+    return fetched
+
+
+def test_incremental_collect_refetches_changed_articles(list_pages, monkeypatch, tmp_path):
+    from naver_cafe_scraper.crawler import CafeCrawler
+
+    def row(n, date="2024.01.02."):
+        return {"article_no": str(n), "url": f"/articles/{n}", "date": date}
+
+    c = CafeCrawler(base_url="https://x?page=1", headless=True, index_path=str(tmp_path / "i.db"))
+    fetched = _detail_spy(c, monkeypatch)
+    list_pages({1: [row(2), row(1)], 2: []})
+    assert len(c.collect(max_pages=2, fetch_detail=True, incremental=True)) == 2
+
+    # 새 글 없음, 1번 글 날짜만 변화(재게시) → 그 글만 상세 재수집 후 중단
+    fetched.clear()
+    pages_seen = list_pages({1: [row(2), row(1, date="2024.01.05.")], 2: [row(0)]})
+    again = c.collect(max_pages=2, fetch_detail=True, incremental=True, per_detail_delay_sec=0)
+    assert [r["article_no"] for r in again] == ["1"]
+    assert fetched == ["/articles/1"] and pages_seen == [1]
+    assert again[0]["content_text"] == "본문 /articles/1"
+
+
+def test_incremental_collect_ignores_view_counts_and_date_rollover(
+    list_pages, monkeypatch, tmp_path
+):
+    from naver_cafe_scraper.crawler import CafeCrawler
+
+    def row(n, date, reads):
+        return {"article_no": str(n), "url": f"/articles/{n}", "date": date, "read_count": reads}
+
+    c = CafeCrawler(base_url="https://x?page=1", headless=True, index_path=str(tmp_path / "i.db"))
+    fetched = _detail_spy(c, monkeypatch)
+    list_pages({1: [row(2, "12:04", 5), row(1, "2024.01.02.", 40)], 2: []})
+    assert len(c.collect(max_pages=2, fetch_detail=True, incremental=True)) == 2
+
+    # 다음 날: 오늘 글은 시각 → 날짜로 바뀌고 조회수는 늘어남 → 다시 열지 않음
+    fetched.clear()
+    pages_seen = list_pages({1: [row(2, "2024.01.03.", 80), row(1, "2024.01.02.", 95)]})
+    again = c.collect(max_pages=2, fetch_detail=True, incremental=True, per_detail_delay_sec=0)
+    assert again == [] and fetched == [] and pages_seen == [1]
+
+
+def test_index_marked_only_after_rows_are_saved(list_pages, tmp_path):
+    from naver_cafe_scraper.crawler import CafeCrawler
+
+    def row(n):
+        return {"article_no": str(n), "title": f"T{n}", "url": f"/articles/{n}"}
+
+    path = str(tmp_path / "i.db")
+    c = CafeCrawler(base_url="https://x?page=1", headless=True, index_path=path)
+    list_pages({1: [row(4), row(3)], 2: [row(2), row(1)]})
+
+    # 첫 배치를 받은 뒤 (저장 전에) 죽으면 → 그 배치는 인덱스에 남지 않음
+    it = c.iter_collect(max_pages=2, incremental=True)
+    assert [r["article_no"] for r in next(it)] == ["4", "3"]
+    it.close()
+    with ArticleIndex(path) as index:
+        assert len(index) == 0
+
+    # defer_index → 결과를 저장한 뒤 commit_index 에서만 기록
+    list_pages({1: [row(4), row(3)], 2: [row(2), row(1)]})
+    assert len(c.collect(max_pages=2, incremental=True, defer_index=True)) == 4
+    with ArticleIndex(path) as index:
+        assert len(index) == 0
+    assert c.commit_index() == 4
+    assert c.commit_index() == 0
+    with ArticleIndex(path) as index:
+        assert index.known([row(1), row(4)]) == {"1", "4"}
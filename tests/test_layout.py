@@ -0,0 +1,120 @@
+from naver_cafe_scraper.layout import LayoutProfile, LayoutStore, board_key, infer_list_skin
+from naver_cafe_scraper.readiness import FRAME_OR_CONTENT_SELECTOR
+
+
+def test_board_key_variants():
+    assert board_key("https://cafe.naver.com/f-e/cafes/29434212/menus/77?page=1") == "29434212:77"
+    assert board_key("https://cafe.naver.com/f-e/cafes/29434212/articles/1") == "29434212:"
+    old = (
+        "https://cafe.naver.com/x?iframe_url=/ArticleList.nhn%3Fsearch.clubid=10%26search.menuid=4"
+    )
+    assert board_key(old) == "10:4"
+    assert board_key("http://127.0.0.1:8000/board?page=1") == "127.0.0.1/board"
+
+
+def test_infer_list_skin():
+    assert infer_list_skin([]) is None
+    assert infer_list_skin([{"title": "t", "url": "u"}]) == "old"
+    assert infer_list_skin([{"article_no": "1", "title": "t", "url": "u"}]) == "new"
+
+
+def test_store_roundtrip_and_ttl(tmp_path):
+    path = tmp_path / "layout.json"
+    store = LayoutStore(str(path), ttl_sec=60)
+    prof = store.get("1:2")
+    assert prof.list_frame is None
+    assert prof.record(list_frame=False, list_skin="new", detail_frame=None)
+    assert not prof.record(list_frame=False)  # 변경 없음
+    store.save(prof)
+
+    loaded = LayoutStore(str(path), ttl_sec=60).get("1:2")
+    assert loaded.list_frame is False and loaded.list_skin == "new"
+    assert loaded.list_row_selector == "table.article-table tbody > tr"
+    assert LayoutStore(str(path), ttl_sec=0).get("1:2").list_skin is None  # 만료
+
+    loaded.forget("list_skin")
+    assert loaded.list_row_selector is None
+
+
+def test_store_without_path_and_corrupt_file(tmp_path):
+    mem = LayoutStore("")
+    mem.save(LayoutProfile("k", list_frame=True, detected_at=1e12))
+    assert mem.get("k").list_frame is True
+
+    bad = tmp_path / "bad.json"
+    bad.write_text("{not json", encoding="utf-8")
+    assert LayoutStore(str(bad)).get("k").list_frame is None
+
+
+def test_collect_probes_once_per_board(fake_browser, monkeypatch, tmp_path):
+    import naver_cafe_scraper.crawler as crawler_mod
+    from naver_cafe_scraper.crawler import CafeCrawler
+
+    monkeypatch.setattr(
+        crawler_mod,
+        "extract_posts_from_frame",
+        lambda target: [{"article_no": "1", "title": "A", "url": "u1"}],
+    )
+
+    url = "https://cafe.naver.com/f-e/cafes/1/menus/2?page=1"
+    cache = str(tmp_path / "layout.json")
+    c = CafeCrawler(base_url=url, headless=True, layout_cache_path=cache)
+    c.collect(max_pages=3)
+    # 첫 페이지만 프레임/콘텐츠 탐색, 이후는 메인 DOM 으로 바로 진행
+    assert fake_browser.context.page.selectors.count(FRAME_OR_CONTENT_SELECTOR) == 1
+    assert c.layout.list_frame is False and c.layout.list_skin == "new"
+
+    # 다음 실행은 디스크 프로필을 사용 → 탐색 없음
+    ctx2 = fake_browser.reset()
+    CafeCrawler(base_url=url, headless=True, layout_cache_path=cache).collect(max_pages=2)
+    assert FRAME_OR_CONTENT_SELECTOR not in ctx2.page.selectors
+
+
+def test_collect_reprobes_when_profile_yields_nothing(fake_browser, monkeypatch, tmp_path):
+    import naver_cafe_scraper.crawler as crawler_mod
+    from naver_cafe_scraper.crawler import CafeCrawler
+
+    calls = {"n": 0}
+
+    def fake_extract(target):
+        calls["n"] += 1
+        return [] if calls["n"] == 1 else [{"title": "A", "url": "u1"}]
+
+    monkeypatch.setattr(crawler_mod, "extract_posts_from_frame", fake_extract)
+
+    url = "https://cafe.naver.com/f-e/cafes/1/menus/2?page=1"
+    store = LayoutStore(str(tmp_path / "layout.json"))
+    store.save(LayoutProfile("1:2", list_frame=False, list_skin="new", detected_at=1e12))
+
+    c = CafeCrawler(base_url=url, headless=True, layout_cache_path=store.path)
+    rows = c.collect(max_pages=1)
+    assert len(rows) == 1 and calls["n"] == 2
+    assert fake_browser.context.page.selectors.count(FRAME_OR_CONTENT_SELECTOR) == 1
+    assert c.layout.list_skin == "old"
+
+
+def test_offline_detail_reopens_when_profile_yields_nothing(list_pages, monkeypatch, tmp_path):
+    import naver_cafe_scraper.core as core_mod
+    import naver_cafe_scraper.crawler as crawler_mod
+    from naver_cafe_scraper.crawler import CafeCrawler
+
+    monkeypatch.setattr(core_mod, "PARSE_MODE", "html")
+    monkeypatch.setattr(core_mod, "OCR_ENABLED", False)
+    parsed = []
+
+    def fake_parse(html):
+        parsed.append(html)
+        return {} if len(parsed) == 1 else {"title": "A", "content_text": "본문"}
+
+    monkeypatch.setattr(crawler_mod, "parse_article_detail_html", fake_parse)
+
+    url = "https://cafe.naver.com/f-e/cafes/1/menus/2?page=1"
+    store = LayoutStore(str(tmp_path / "layout.json"))
+    store.save(LayoutProfile("1:2", list_frame=False, detail_frame=True, detected_at=1e12))
+    list_pages({1: [{"title": "A", "url": "/articles/1"}]})
+
+    c = CafeCrawler(base_url=url, headless=True, layout_cache_path=store.path)
+    rows = c.collect(max_pages=1, fetch_detail=True, per_detail_delay_sec=0)
+    # 프로필(iframe)대로 받은 HTML 이 비면 프로필을 버리고 탭을 다시 열어 전체 탐색
+    assert len(parsed) == 2 and rows[0]["content_text"] == "본문"
+    assert c.core.offline_detail and c.layout.detail_frame is False
@@ -0,0 +1,66 @@
+import urllib.error
+import urllib.request
+
+import pytest
+
+pytest.importorskip("selectolax")
+pytest.importorskip("PIL")
+
+from benchmarks.mock_cafe import MockCafeConfig, MockCafeServer
+from naver_cafe_scraper.html_parser import parse_article_detail_html, parse_posts_html
+
+
+def _html(server, path):
+    status, _ctype, body, _key = server.render(path)
+    assert status == 200
+    return body.decode("utf-8")
+
+
+def test_mock_list_pages_parse_in_both_layouts():
+    new = MockCafeServer(MockCafeConfig(layout="new", articles=20, rows_per_page=15))
+    rows = parse_posts_html(_html(new, "/cafes/29434212/menus/1?page=1"))
+    assert len(rows) == 15
+    assert rows[0]["url"] == f"{new.base}/f-e/cafes/29434212/articles/10000020"
+    assert rows[0]["read_count"] is not None
+    # 마지막 페이지는 남은 글만, 그 뒤는 빈 목록
+    assert len(parse_posts_html(_html(new, "/cafes/29434212/menus/1?page=2"))) == 5
+    assert parse_posts_html(_html(new, "/cafes/29434212/menus/1?page=3")) == []
+
+    old = MockCafeServer(MockCafeConfig(layout="iframe", articles=20, rows_per_page=15))
+    outer = _html(old, "/cafes/29434212/menus/1?page=2")
+    assert 'id="cafe_main"' in outer and "search.page=2" in outer
+    inner = parse_posts_html(_html(old, "/ArticleList.nhn?search.page=2"))
+    assert [r["url"].rsplit("/", 1)[1] for r in inner] == [str(10000005 - i) for i in range(5)]
+
+
+def test_mock_article_is_deterministic_and_points_images_at_server():
+    server = MockCafeServer(MockCafeConfig(images=4))
+    html = _html(server, "/f-e/cafes/29434212/articles/10000007")
+    assert html == _html(MockCafeServer(MockCafeConfig(images=4)), "/f-e/cafes/1/articles/10000007")
+
+    det = parse_article_detail_html(html)
+    assert det["title"] and det["content_text"]
+    assert det["images"] == [f"{server.base}/img/10000007/{i}.png" for i in range(4)]
+    status, ctype, body, key = server.render("/img/10000007/0.png")
+    assert (status, ctype, key) == (200, "image/png", "image")
+    assert body[:8] == b"\x89PNG\r\n\x1a\n"
+
+
+def test_mock_server_injects_reproducible_errors_over_http():
+    def statuses():
+        config = MockCafeConfig(articles=200, error_rate=0.3, jitter_ms=2, latency_ms=1)
+        with MockCafeServer(config) as server:
+            out = []
+            for n in range(1, 11):
+                url = server.board_url.replace("page=1", f"page={n}")
+                try:
+                    with urllib.request.urlopen(url, timeout=5) as resp:
+                        out.append(resp.status)
+                except urllib.error.HTTPError as e:
+                    out.append(e.code)
+            return out, dict(server.stats)
+
+    first, stats = statuses()
+    assert first == statuses()[0]
+    assert set(first) == {200, 503}
+    assert stats["list"] + stats["error"] == stats["requests"] == 10
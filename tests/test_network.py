@@ -0,0 +1,66 @@
+import types
+
+import pytest
+
+from naver_cafe_scraper.network import RouteBlocker
+
+
+def make_route(url, resource_type):
+    calls = []
+    route = types.SimpleNamespace(
+        request=types.SimpleNamespace(url=url, resource_type=resource_type),
+        continue_=lambda: calls.append("continue"),
+        abort=lambda: calls.append("abort"),
+    )
+    return route, calls
+
+
+def test_list_lite_blocks_assets_and_third_party():
+    b = RouteBlocker("list-lite")
+    assert b.decide("https://cafe.naver.com/f-e/cafes/1/menus/2", "document")
+    assert b.decide("https://ssl.pstatic.net/static/cafe/app.js", "script")
+    assert not b.decide("https://cafeptthumb-phinf.pstatic.net/a.jpg", "image")
+    assert not b.decide("https://ssl.pstatic.net/font.woff2", "font")
+    assert not b.decide("https://www.googletagmanager.com/gtm.js", "script")
+    assert not b.decide("https://lcs.naver.com/m?u=x", "ping")
+    assert b.decide("data:image/png;base64,AAAA", "image")
+
+
+def test_detail_ocr_allows_only_content_images():
+    b = RouteBlocker("detail-ocr")
+    assert b.decide("https://cafeptthumb-phinf.pstatic.net/a.jpg", "image")
+    assert not b.decide("https://ssl.pstatic.net/static/icon.png", "image")
+    assert not b.decide("https://ssl.pstatic.net/video.mp4", "media")
+
+
+def test_first_party_hosts_and_counters():
+    b = RouteBlocker("list-lite", first_party_hosts=("127.0.0.1",))
+    for url, rtype in [
+        ("http://127.0.0.1:8000/list?page=1", "document"),
+        ("http://127.0.0.1:8000/img/1.png", "image"),
+        ("https://ads.example.com/a.js", "script"),
+    ]:
+        route, calls = make_route(url, rtype)
+        b.handle(route)
+    assert b.summary() == {
+        "profile": "list-lite",
+        "allowed": 1,
+        "blocked": 2,
+        "blocked_by_type": {"image": 1, "script": 1},
+    }
+
+
+def test_none_profile_is_not_installed_and_unknown_profile_rejected():
+    class Target:
+        routes = []
+
+        def route(self, pattern, handler):
+            self.routes.append(pattern)
+
+    t = Target()
+    RouteBlocker("none").install(t)
+    assert t.routes == []
+    RouteBlocker("detail-lite").install(t)
+    assert t.routes == ["**/*"]
+    with pytest.raises(ValueError):
+        RouteBlocker("bogus")
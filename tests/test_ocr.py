@@ -0,0 +1,786 @@
+import sys
+import threading
+import types
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+from naver_cafe_scraper.ocr import ImageFetcher, OcrCache, OcrWorkerPool
+from naver_cafe_scraper.parser import _acapture_images, _capture_images, merge_ocr_texts
+
+
+def _thread_pool(fn, **kw):
+    return OcrWorkerPool(2, fn=fn, executor=ThreadPoolExecutor(2), **kw)
+
+
+def test_pool_results_skip_failures_and_dedupe():
+    def fn(data):
+        if data == b"bad":
+            raise RuntimeError("ocr 실패")
+        return data.decode()
+
+    with _thread_pool(fn) as pool:
+        futures = pool.submit_many([("a", b"x"), ("b", b"bad"), ("c", b"x"), ("d", b"")])
+        assert OcrWorkerPool.results(futures) == ["x"]
+    assert len(futures) == 3  # 빈 bytes 는 넘기지 않음
+    assert pool.stats == {"submitted": 3, "done": 2, "failed": 1}
+
+
+def test_pool_submit_blocks_when_queue_full():
+    gate = threading.Event()
+
+    def fn(data):
+        gate.wait(5)
+        return data.decode()
+
+    pool = _thread_pool(fn, max_pending=2)
+    pool.submit(b"1")
+    pool.submit(b"2")
+    third = threading.Thread(target=pool.submit, args=(b"3",))
+    third.start()
+    third.join(0.2)
+    assert third.is_alive()  # 대기열이 가득 차 있음
+    gate.set()
+    third.join(5)
+    assert not third.is_alive()
+    pool.close()
+    assert pool.stats["done"] == 3
+
+
+def test_pool_runs_in_worker_processes():
+    with OcrWorkerPool(1, fn=bytes.decode) as pool:
+        assert OcrWorkerPool.results(pool.submit_many([("s", b"hello")])) == ["hello"]
+
+
+def test_async_submit_and_results():
+    import asyncio
+
+    async def run():
+        with _thread_pool(bytes.decode, max_pending=1) as pool:
+            futures = await pool.asubmit_many([("a", b"one"), ("b", b"two")])
+            return await OcrWorkerPool.aresults(futures)
+
+    assert asyncio.run(run()) == ["one", "two"]
+
+
+def _png(color):
+    from io import BytesIO
+
+    from PIL import Image
+
+    buf = BytesIO()
+    Image.new("RGB", (8, 8), color).save(buf, format="PNG")
+    return buf.getvalue()
+
+
+def test_cache_url_and_pixel_keys(tmp_path):
+    path = str(tmp_path / "ocr.sqlite3")
+    banner = _png("red")
+    with OcrCache(path) as cache:
+        assert cache.get(cache.keys("http://a/1.png", banner)) is None
+        cache.put(cache.keys("http://a/1.png", banner), "광고 배너")
+        assert cache.has_url("http://a/1.png")
+        # 다른 URL 이라도 같은 그림이면 적중, 그 URL 도 함께 기록
+        assert cache.get(cache.keys("http://b/2.png", _png("red"))) == "광고 배너"
+        assert cache.has_url("http://b/2.png")
+        assert cache.get(cache.keys("http://a/1.png", b"")) == "광고 배너"
+        assert cache.stats == {"url_hits": 1, "pixel_hits": 1, "misses": 1, "evicted": 0}
+
+    # 재시작 후에도 유지, OCR 설정이 다르면 다른 키
+    with OcrCache(path) as cache:
+        assert cache.has_url("http://a/1.png")
+    with OcrCache(path, settings="kor|11") as cache:
+        assert not cache.has_url("http://a/1.png")
+
+
+def test_cache_evicts_least_recently_used():
+    cache = OcrCache(":memory:", max_entries=10)
+    for i in range(12):
+        cache.put([f"k{i}"], str(i))
+    cache.get(["k0"])  # 최근 사용 → 남음
+    cache._evict()
+    assert len(cache) == 9
+    assert cache.get(["k0"]) == "0"
+    assert cache.get(["k1"]) is None and cache.get(["k3"]) is None
+    assert cache.stats["evicted"] == 3
+    cache.close()
+
+
+def test_pool_uses_cache_before_ocr():
+    calls = []
+
+    def fn(data):
+        calls.append(data)
+        return "글자"
+
+    with _thread_pool(fn, cache=OcrCache(":memory:")) as pool:
+        img = _png("blue")
+        first = pool.submit_many([("u1", img)])
+        assert OcrWorkerPool.results(first) == ["글자"]
+        assert pool.skip_capture("u1") and not pool.skip_capture("u2")
+        # URL 적중(캡처 생략) + 픽셀 적중 → OCR 추가 호출 없음
+        again = pool.submit_many([("u1", b""), ("u2", img), ("u3", b"")])
+        assert len(again) == 2
+        assert OcrWorkerPool.results(again) == ["글자"]
+        assert len(calls) == 1
+        assert pool.stats["submitted"] == 1
+
+
+class FakeResponse:
+    def __init__(self, status, ctype, body):
+        self.ok = 200 <= status < 300
+        self.headers = {"content-type": ctype}
+        self._body = body
+        self.disposed = False
+
+    def body(self):
+        return self._body
+
+    def dispose(self):
+        self.disposed = True
+
+
+RESPONSES = {
+    "https://img/ok.png": (200, "image/png", b"PNGDATA"),
+    "https://img/404.png": (404, "text/html", b"not found"),
+    "https://img/html": (200, "text/html", b"<html>"),
+}
+
+
+class FakeRequest:
+    def __init__(self):
+        self.calls = []
+
+    def get(self, url, **kw):
+        self.calls.append((url, kw["headers"]["Referer"]))
+        if url not in RESPONSES:
+            raise RuntimeError("timeout")
+        return FakeResponse(*RESPONSES[url])
+
+
+class FakeImg:
+    def __init__(self, src):
+        self.src = src
+
+    def get_attribute(self, name):
+        return self.src
+
+    def screenshot(self):
+        return f"SHOT {self.src}".encode()
+
+
+class FakeRoot:
+    def __init__(self, *srcs):
+        self.imgs = [FakeImg(s) for s in srcs]
+
+    def query_selector_all(self, sel):
+        return self.imgs
+
+
+SRCS = ("https://img/ok.png", "https://img/404.png", "https://img/html", "https://img/slow", "x")
+
+
+def test_fetcher_downloads_and_falls_back_to_screenshot():
+    req = FakeRequest()
+    fetcher = ImageFetcher(req, max_bytes=100)
+    out = _capture_images(FakeRoot(*SRCS, "data:image/png;base64,QUJD"), fetch=fetcher.fetch)
+    assert [data for _src, data in out] == [
+        b"PNGDATA",
+        b"SHOT https://img/404.png",
+        b"SHOT https://img/html",
+        b"SHOT https://img/slow",
+        b"SHOT x",  # http(s)/data 가 아니면 요청하지 않음
+        b"ABC",
+    ]
+    assert len(req.calls) == 4 and req.calls[0][1] == "https://cafe.naver.com/"
+    assert fetcher.stats == {"fetched": 2, "failed": 4}
+    assert ImageFetcher(req, max_bytes=3).fetch("https://img/ok.png") is None
+
+
+def test_async_fetcher_limits_concurrency():
+    import asyncio
+
+    state = {"now": 0, "peak": 0}
+
+    class AsyncRequest:
+        async def get(self, url, **kw):
+            state["now"] += 1
+            state["peak"] = max(state["peak"], state["now"])
+            await asyncio.sleep(0.01)
+            state["now"] -= 1
+            resp = FakeResponse(*RESPONSES.get(url, (500, "", b"")))
+
+            async def body():
+                return resp._body
+
+            async def dispose():
+                pass
+
+            resp.body, resp.dispose = body, dispose
+            return resp
+
+    class AsyncImg(FakeImg):
+        async def get_attribute(self, name):
+            return self.src
+
+        async def screenshot(self):
+            return f"SHOT {self.src}".encode()
+
+    class AsyncRoot:
+        async def query_selector_all(self, sel):
+            return [AsyncImg(s) for s in ["https://img/ok.png"] * 5 + ["https://img/404.png"]]
+
+    fetcher = ImageFetcher(AsyncRequest(), concurrency=2)
+    out = asyncio.run(_acapture_images(AsyncRoot(), fetch=fetcher.afetch))
+    assert [d for _s, d in out] == [b"PNGDATA"] * 5 + [b"SHOT https://img/404.png"]
+    assert state["peak"] == 2
+
+
+def test_merge_ocr_texts_recleans_content():
+    data = {"content_text": "본문입니다"}
+    merge_ocr_texts(data, ["", "이미지 글자"])
+    assert data["content_text"] == "본문입니다 이미지 글자"
+    assert merge_ocr_texts({"content_text": "그대로"}, []) == {"content_text": "그대로"}
+
+
+def test_merge_ocr_texts_is_idempotent():
+    data = merge_ocr_texts({"content_text": "본문입니다"}, ["이미지 글자", "이미지 글자"])
+    once = dict(data)
+    assert merge_ocr_texts(data, ["이미지 글자"]) == once
+    assert once["ocr_texts"] == ["이미지 글자"]
+
+    # CSV 로 저장했다 읽은 행: ocr_texts 가 JSON 문자열
+    row = {"content_text": once["content_text"], "ocr_texts": '["이미지 글자"]'}
+    assert merge_ocr_texts(row, ["이미지 글자"])["content_text"] == once["content_text"]
+    merge_ocr_texts(row, ["새 글자"])
+    assert row["ocr_texts"] == ["이미지 글자", "새 글자"]
+
+
+def test_backfill_skips_rows_that_already_have_ocr():
+    from scripts.run_ocr import backfill
+
+    class NoPool:
+        max_pending = 4
+
+        def submit_many(self, images):
+            raise AssertionError("OCR 된 행은 다시 제출하지 않음")
+
+    rows = [
+        {"url": "u1", "content_text": "본문", "images": ["a"], "ocr_texts": ["글자"]},
+        {"url": "u2", "content_text": "본문", "images": '["a"]', "ocr_texts": '["글자"]'},
+        {"url": "u3", "content_text": "본문", "images": []},
+    ]
+    stats = backfill(rows, NoPool(), fetcher=None)
+    assert (stats["rows"], stats["already_ocr"], stats["no_images"], stats["ocr"]) == (3, 2, 1, 0)
+    assert [r["content_text"] for r in rows] == ["본문"] * 3
+
+
+def test_collect_hands_off_ocr_and_merges_per_page(fake_browser, monkeypatch, tmp_path):
+    import naver_cafe_scraper.core as core_mod
+    import naver_cafe_scraper.crawler as crawler_mod
+    from naver_cafe_scraper.checkpoint import CrawlCheckpoint
+    from naver_cafe_scraper.core import CrawlerCore
+    from naver_cafe_scraper.crawler import CafeCrawler
+
+    calls = []
+
+    def fake_detail(target, ocr=None):
+        calls.append(ocr)
+        return {"content_text": f"본문 {target.url[-2:]}"}
+
+    monkeypatch.setattr(core_mod, "OCR_ENABLED", True)
+    monkeypatch.setattr(
+        crawler_mod, "extract_posts_from_frame", lambda t: [{"title": "A", "url": "/a1"}]
+    )
+    monkeypatch.setattr(crawler_mod, "extract_article_detail", fake_detail)
+    monkeypatch.setattr(
+        crawler_mod, "capture_ocr_images", lambda t, **kw: [("i1", b"OCR1"), ("i2", b"OCR1")]
+    )
+    monkeypatch.setattr(
+        CrawlerCore, "open_ocr_pool", lambda self, fetch_detail: _thread_pool(bytes.decode)
+    )
+
+    path = str(tmp_path / "ckpt.jsonl")
+    c = CafeCrawler(base_url="https://x?page=1", headless=True, ocr_workers=2)
+    rows = c.collect(max_pages=1, fetch_detail=True, per_detail_delay_sec=0, checkpoint_path=path)
+
+    assert calls == [False]  # 상세 파싱 중에는 OCR 하지 않음
+    assert rows[0]["content_text"] == "본문 a1 OCR1"
+    assert c.core.ocr is None and not c.core.ocr_pending
+    ck = CrawlCheckpoint(path, {"start_url": "https://x?page=1", "fetch_detail": True}, True)
+    assert ck.page_done(1) and ck.unfinished(rows) == []  # 병합 후 저장된 글로 기록
+    ck.close()
+
+
+def _reference_preprocess(im, thr):
+    """이전 구현: lambda point → 1비트 → L"""
+    from PIL import ImageFilter
+
+    g = im.convert("L").filter(ImageFilter.UnsharpMask(radius=1.5, percent=180, threshold=3))
+    return g.point(lambda p: 255 if p > thr else 0, mode="1").convert("L")
+
+
+def test_threshold_lut_matches_previous_pipeline():
+    import numpy as np
+    from PIL import Image
+
+    from naver_cafe_scraper.parser import _pil_unsharp_threshold
+
+    rng = np.random.default_rng(0)
+    im = Image.fromarray(rng.integers(0, 256, (64, 48, 3), dtype=np.uint8), "RGB")
+    for thr in (0, 127, 160, 255):
+        out = _pil_unsharp_threshold(im, thr)
+        assert out.mode == "L"
+        assert out.tobytes() == _reference_preprocess(im, thr).tobytes()
+
+
+def test_pytesseract_engine_passes_dpi_flag_without_png_roundtrip(monkeypatch):
+    from naver_cafe_scraper import parser
+
+    seen = {}
+
+    def image_to_string(im, lang, config):
+        seen.update(mode=im.mode, format=im.format, lang=lang, config=config)
+        return " 글자 \n"
+
+    engine = parser.PytesseractEngine(types.SimpleNamespace(image_to_string=image_to_string))
+    monkeypatch.setattr(parser, "get_ocr_engine", lambda: engine)
+    assert parser._ocr_png_bytes(_png("white")) == "글자"
+    assert seen["mode"] == "L" and seen["format"] is None  # 재인코딩된 PNG 가 아님
+    assert seen["config"] == "--psm 6 --oem 1 --dpi 300"
+
+
+class FakeTessAPI:
+    created = 0
+
+    def __init__(self, **kw):
+        FakeTessAPI.created += 1
+        self.kw = kw
+
+    def SetImageBytes(self, data, w, h, bpp, bpl):
+        self.image = (len(data), w, h, bpp, bpl)
+
+    def SetSourceResolution(self, dpi):
+        self.dpi = dpi
+
+    def GetUTF8Text(self):
+        return "엔진 결과"
+
+
+def test_engine_prefers_persistent_tesserocr_per_thread(monkeypatch):
+    from naver_cafe_scraper import parser
+
+    monkeypatch.setitem(sys.modules, "tesserocr", types.SimpleNamespace(PyTessBaseAPI=FakeTessAPI))
+    monkeypatch.setattr(parser, "_ENGINE_LOCAL", threading.local())
+    FakeTessAPI.created = 0
+
+    engine = parser.get_ocr_engine()
+    assert engine.name == "tesserocr" and engine.api.kw["psm"] == 6
+    assert parser._ocr_png_bytes(_png("white")) == "엔진 결과"
+    assert parser._ocr_png_bytes(_png("black")) == "엔진 결과"
+    assert engine.api.image == (64, 8, 8, 1, 8) and engine.api.dpi == 300  # raw L 버퍼
+    assert FakeTessAPI.created == 1  # 이미지마다 모델을 다시 올리지 않음
+
+    other = []
+    t = threading.Thread(target=lambda: other.append(parser.get_ocr_engine()))
+    t.start()
+    t.join()
+    assert other[0] is not engine and FakeTessAPI.created == 2
+
+
+def test_engine_falls_back_to_pytesseract(monkeypatch):
+    from naver_cafe_scraper import parser
+
+    def broken(**kw):
+        raise RuntimeError("traineddata 없음")
+
+    monkeypatch.setitem(sys.modules, "tesserocr", types.SimpleNamespace(PyTessBaseAPI=broken))
+    fake = types.SimpleNamespace(image_to_string=lambda *a, **kw: "")
+    monkeypatch.setattr(parser, "_setup_tesseract", lambda: fake)
+    assert isinstance(parser._create_ocr_engine("auto"), parser.PytesseractEngine)
+    assert isinstance(parser._create_ocr_engine("pytesseract"), parser.PytesseractEngine)
+    monkeypatch.setattr(parser, "_setup_tesseract", lambda: None)
+    assert parser._create_ocr_engine("auto") is None
+
+
+def _text_image(lines=6, shift=0):
+    from PIL import Image, ImageDraw, ImageFont
+
+    try:
+        font = ImageFont.load_default(size=28)
+    except TypeError:
+        font = ImageFont.load_default()
+    im = Image.new("RGB", (600, 40 * lines + 20), "white")
+    draw = ImageDraw.Draw(im)
+    for i in range(lines):
+        draw.text(
+            (10 + shift, 10 + i * 40),
+            f"특가 할인 SALE {i} 지금 구매하세요",
+            fill="black",
+            font=font,
+        )
+    return im
+
+
+def _photo():
+    import numpy as np
+    from PIL import Image, ImageFilter
+
+    rng = np.random.default_rng(1)
+    small = Image.fromarray(rng.integers(0, 256, (60, 80, 3), dtype=np.uint8), "RGB")
+    return small.resize((800, 600), Image.BICUBIC).filter(ImageFilter.GaussianBlur(10))
+
+
+def test_gate_reasons():
+    from PIL import Image
+
+    from naver_cafe_scraper.ocr import OcrGate
+
+    gate = OcrGate()
+    text_reason, text_hash = gate.check(_text_image())
+    assert text_reason is None
+    gate.remember(text_hash, "first")
+
+    assert gate.check(None)[0] == "unreadable"
+    assert gate.check(Image.new("RGB", (1, 1)))[0] == "too_small"  # 스페이서
+    assert gate.check(Image.new("RGB", (500, 300), (240, 200, 200)))[0] == "low_contrast"
+    assert gate.check(_photo())[0] == "no_text"
+    reason, match = gate.check(_text_image(shift=1))  # 거의 같은 그림
+    assert reason == "duplicate" and gate.payload(match) == "first"
+    assert gate.stats == {
+        "passed": 1,
+        "unreadable": 1,
+        "too_small": 1,
+        "low_contrast": 1,
+        "no_text": 1,
+        "duplicate": 1,
+    }
+
+
+def test_gate_hash_buckets_match_linear_scan():
+    import random
+
+    from naver_cafe_scraper.ocr import OcrGate
+
+    rng = random.Random(7)
+    gate = OcrGate(hash_distance=4, max_hashes=300)
+    stored = [rng.getrandbits(64) for _ in range(400)]
+    for i, h in enumerate(stored):
+        gate.remember(h, i)
+    kept = stored[-300:]  # 오래된 100개는 밀려남
+    assert len(gate._seen) == 300
+    assert sum(len(b) for b in gate._buckets[0].values()) == 300
+
+    def flip(h, n):
+        for bit in rng.sample(range(64), n):
+            h ^= 1 << bit
+        return h
+
+    for h in kept[:50]:
+        near = flip(h, 4)
+        match = gate._match(near)
+        assert match is not None and bin(match ^ near).count("1") <= 4
+    for h in stored[:50]:
+        assert gate._match(h) is None or gate._match(h) in kept
+    for _ in range(200):
+        q = rng.getrandbits(64)
+        linear = [k for k in kept if bin(k ^ q).count("1") <= 4]
+        assert (gate._match(q) is not None) == bool(linear)
+
+
+def test_pool_gate_skips_and_shares_duplicate_futures():
+    from io import BytesIO
+
+    from naver_cafe_scraper.ocr import OcrGate
+
+    def encode(im):
+        buf = BytesIO()
+        im.save(buf, format="PNG")
+        return buf.getvalue()
+
+    calls = []
+
+    def fn(data):
+        calls.append(data)
+        return "광고 문구"
+
+    with _thread_pool(fn, gate=OcrGate()) as pool:
+        futures = pool.submit_many(
+            [
+                ("a", encode(_text_image())),
+                ("b", encode(_photo())),
+                ("c", encode(_text_image(shift=1))),
+            ]
+        )
+        # 사진은 건너뜀(""), 거의 같은 그림은 먼저 제출한 OCR 결과를 함께 사용
+        assert [f.result(5) for f in futures] == ["광고 문구", "", "광고 문구"]
+        assert OcrWorkerPool.results(futures) == ["광고 문구"]
+    assert len(calls) == 1
+    assert pool.gate.stats["no_text"] == 1 and pool.gate.stats["duplicate"] == 1
+
+
+def test_pool_prechecks_images_off_the_calling_thread(monkeypatch):
+    from naver_cafe_scraper import ocr
+    from naver_cafe_scraper.ocr import OcrGate
+
+    decoded_on = []
+    open_image = ocr._open_image
+
+    def spy(data):
+        decoded_on.append(threading.current_thread().name)
+        return open_image(data)
+
+    monkeypatch.setattr(ocr, "_open_image", spy)
+    with _thread_pool(lambda data: "글자", cache=OcrCache(":memory:"), gate=OcrGate()) as pool:
+        futures = pool.submit_many([("a", _png("red")), ("b", _png("blue"))])
+        assert OcrWorkerPool.results(futures) == []  # 8px 이미지는 too_small
+    assert decoded_on and all(name.startswith("ocr-precheck") for name in decoded_on)
+
+
+def test_async_submit_cancelled_while_waiting_releases_slot():
+    import asyncio
+
+    release = threading.Event()
+
+    def fn(data):
+        release.wait(5)
+        return data.decode()
+
+    async def run(pool):
+        first = await pool.asubmit(b"1")
+        waiting = asyncio.ensure_future(pool.asubmit(b"2"))
+        await asyncio.sleep(0.2)
+        assert not waiting.done()  # 자리가 없어 대기 중
+        waiting.cancel()
+        await asyncio.gather(waiting, return_exceptions=True)
+        release.set()
+        return await OcrWorkerPool.aresults([first])
+
+    with _thread_pool(fn, max_pending=1) as pool:
+        assert asyncio.run(run(pool)) == ["1"]
+        # 취소된 대기 스레드가 잡은 자리는 반납됨 → 새 제출 가능
+        assert pool._slots.acquire(timeout=5)
+        pool._slots.release()
+        assert OcrWorkerPool.results([pool.submit(b"3")]) == ["3"]
+
+
+def test_tile_bands_cover_image_with_overlap():
+    from naver_cafe_scraper.parser import _tile_bands
+
+    assert _tile_bands(2500, 2000, 120) == [(0, 2500)]
+    assert _tile_bands(4000, 0, 120) == [(0, 4000)]
+    bands = _tile_bands(10000, 2000, 120)
+    assert bands[0][0] == 0 and bands[-1][1] == 10000
+    assert all(b - t <= 2000 for t, b in bands)
+    assert all(prev[1] - nxt[0] >= 120 for prev, nxt in zip(bands, bands[1:]))
+
+
+def test_stitch_band_texts_drops_repeated_boundary_lines():
+    from naver_cafe_scraper.parser import _stitch_band_texts
+
+    texts = ["첫 줄\n둘째 줄\n경계 줄입니다\n", "경계 줄 입니다\n넷째 줄", "다섯째"]
+    assert _stitch_band_texts(texts) == "첫 줄\n둘째 줄\n경계 줄입니다\n넷째 줄\n다섯째"
+    assert _stitch_band_texts(["가\n나", "다\n라"]) == "가\n나\n다\n라"
+
+
+def test_tall_image_is_ocr_in_parallel_bands(monkeypatch):
+    from io import BytesIO
+
+    from PIL import Image
+
+    from naver_cafe_scraper import parser
+
+    calls = []
+
+    class BandEngine(parser.OcrEngine):
+        name = "fake"
+
+        def recognize(self, im):
+            calls.append((threading.current_thread().name, im.size))
+            return "공통 머리\n본문"
+
+    engine = BandEngine()
+    monkeypatch.setattr(parser, "get_ocr_engine", lambda: engine)
+    monkeypatch.setattr(parser, "_OCR_TILE_HEIGHT", 300)
+    monkeypatch.setattr(parser, "_OCR_TILE_OVERLAP", 40)
+    monkeypatch.setattr(parser, "_OCR_MAX_WIDTH", 200)
+    monkeypatch.setattr(parser, "_OCR_TILE_THREADS", 2)
+    monkeypatch.setattr(parser, "_TILE_EXECUTOR", None)
+    buf = BytesIO()
+    Image.new("RGB", (400, 2000), "white").save(buf, "PNG")
+
+    text = parser._ocr_png_bytes(buf.getvalue())
+    bands = parser._tile_bands(1000, 300, 40)  # 폭 상한 200 → 200x1000 으로 축소
+    assert len(calls) == len(bands) > 1
+    assert all(size[0] == 200 and size[1] <= 300 for _, size in calls)
+    assert all(name.startswith("ocr-tile") for name, _ in calls)
+    assert text == parser._stitch_band_texts(["공통 머리\n본문"] * len(bands))
+
+    # 워커 프로세스 초기화에서 띠 스레드 1개로 줄이면 호출 스레드에서 순서대로
+    calls.clear()
+    parser.init_ocr_worker(1)
+    assert parser._tile_executor() is None
+    assert parser._ocr_png_bytes(buf.getvalue()) == text
+    assert [name for name, _ in calls] == [threading.current_thread().name] * len(bands)
+
+
+def test_worker_tile_threads_fit_cores(monkeypatch):
+    from naver_cafe_scraper import ocr
+
+    monkeypatch.setattr(ocr, "_OCR_TILE_THREADS", 4)
+    assert ocr.worker_tile_threads(7, cpu_count=8) == 1  # 기본 워커 수(코어-1)
+    assert ocr.worker_tile_threads(2, cpu_count=8) == 4
+    assert ocr.worker_tile_threads(3, cpu_count=8) == 2
+    assert ocr.worker_tile_threads(16, cpu_count=8) == 1
+
+
+class FakeShotPage:
+    """문서 전체 이미지(DOC)에서 clip 영역을 device scale 2 로 돌려주는 페이지"""
+
+    def __init__(self, doc):
+        self.doc, self.clips = doc, []
+
+    def screenshot(self, clip, full_page):
+        assert full_page
+        self.clips.append(clip)
+        x, y, w, h = clip["x"], clip["y"], clip["width"], clip["height"]
+        return _png_of(self.doc.crop((x, y, x + w, y + h)).resize((w * 2, h * 2)))
+
+
+def _png_of(im):
+    from io import BytesIO
+
+    buf = BytesIO()
+    im.save(buf, "PNG")
+    return buf.getvalue()
+
+
+def _doc_with_blocks():
+    from PIL import Image
+
+    doc = Image.new("RGB", (300, 6000), "white")
+    for x, y, color in ((10, 120, "red"), (10, 300, "blue"), (20, 5100, "green")):
+        doc.paste(Image.new("RGB", (50, 30), color), (x, y))
+    return doc
+
+
+class BatchRoot(FakeRoot):
+    def __init__(self, page, boxes, parent=None, origin=None, scroll=(0, 100)):
+        super().__init__(*(b["src"] for b in boxes))
+        frame_el = types.SimpleNamespace(evaluate=lambda js: origin)
+        self.frame = types.SimpleNamespace(
+            page=page, parent_frame=parent, frame_element=lambda: frame_el
+        )
+        self.info = {"sx": scroll[0], "sy": scroll[1], "vw": 300, "vh": 1000, "imgs": boxes}
+
+    def evaluate(self, js):
+        return self.info
+
+    def owner_frame(self):
+        return self.frame
+
+
+def _box(src, x, y, loaded=True):
+    return {"src": src, "x": x, "y": y, "w": 50, "h": 30, "loaded": loaded}
+
+
+def test_plan_segments_keeps_each_image_whole():
+    from naver_cafe_scraper.parser import _plan_segments
+
+    boxes = {0: _box("a", 10, 0), 1: _box("b", 0, 3960), 2: _box("c", 0, 3980)}
+    plans = _plan_segments(boxes, 4000)
+    assert [idxs for _clip, idxs in plans] == [[0, 1], [2]]
+    assert plans[0][0] == {"x": 0, "y": 0, "width": 60, "height": 3990}
+
+
+def test_batch_capture_crops_page_screenshots():
+    from PIL import Image
+
+    page = FakeShotPage(_doc_with_blocks())
+    boxes = [
+        _box("https://img/a", 10, 20),
+        _box("https://img/lazy", 10, 200, loaded=False),  # 지연 로딩 → 요소 스크린샷
+        _box("https://img/b", 10, 200),
+        _box("https://img/c", 20, 5000),
+    ]
+    root = BatchRoot(page, boxes)
+    out = _capture_images(root, skip=lambda src: src.endswith("/b"))
+    assert [src for src, _ in out] == [b["src"] for b in boxes]
+    assert out[1][1] == b"SHOT https://img/lazy" and out[2][1] == b""
+    crops = [Image.open(BytesIO(out[i][1])).convert("RGB") for i in (0, 3)]
+    assert [c.size for c in crops] == [(100, 60), (100, 60)]  # device scale 2
+    assert [c.getpixel((50, 30)) for c in crops] == [(255, 0, 0), (0, 128, 0)]
+    assert len(page.clips) == 2  # 4000px 넘게 떨어진 이미지는 다음 스크린샷
+
+
+def test_batch_capture_in_iframe_and_async():
+    import asyncio
+
+    from PIL import Image
+
+    page = FakeShotPage(_doc_with_blocks())
+    boxes = [_box("https://img/blue", 0, 100), _box("https://img/out", 0, 1200)]
+    main = types.SimpleNamespace(parent_frame=None)
+    # iframe 콘텐츠 좌상단이 문서 (10, 200), iframe 뷰포트 밖 이미지는 요소 스크린샷
+    root = BatchRoot(page, boxes, parent=main, origin=[10, 200], scroll=(0, 0))
+    out = _capture_images(root)
+    assert Image.open(BytesIO(out[0][1])).convert("RGB").getpixel((10, 10)) == (0, 0, 255)
+    assert out[1][1] == b"SHOT https://img/out"
+
+    class AsyncBatchRoot:
+        async def query_selector_all(self, sel):
+            return [
+                types.SimpleNamespace(screenshot=_async_value(f"SHOT {b['src']}".encode()))
+                for b in boxes
+            ]
+
+        async def evaluate(self, js):
+            return root.info
+
+        async def owner_frame(self):
+            async def frame_element():
+                return types.SimpleNamespace(evaluate=_async_value([10, 200]))
+
+            async def screenshot(clip, full_page):
+                return page.screenshot(clip, full_page)
+
+            return types.SimpleNamespace(
+                page=types.SimpleNamespace(screenshot=screenshot),
+                parent_frame=main,
+                frame_element=frame_element,
+            )
+
+    aout = asyncio.run(_acapture_images(AsyncBatchRoot()))
+    assert [d for _s, d in aout] == [d for _s, d in out]
+
+
+def _async_value(value):
+    async def fn(*a, **kw):
+        return value
+
+    return fn
+
+
+def test_session_request_adapts_requests_session_for_fetcher():
+    from naver_cafe_scraper.ocr import SessionRequest
+
+    class Resp:
+        def __init__(self, status, ctype, content):
+            self.ok, self.headers, self.content = status < 400, {"content-type": ctype}, content
+            self.closed = False
+
+        def close(self):
+            self.closed = True
+
+    class Session:
+        def __init__(self):
+            self.calls = []
+
+        def get(self, url, headers, timeout):
+            self.calls.append((url, headers, timeout))
+            return Resp(*RESPONSES.get(url, (404, "text/html", b"")))
+
+    session = Session()
+    fetcher = ImageFetcher(SessionRequest(session), timeout_ms=5000)
+    assert fetcher.fetch("https://img/ok.png") == b"PNGDATA"
+    assert fetcher.fetch("https://img/404.png") is None
+    assert session.calls[0] == ("https://img/ok.png", {"Referer": "https://cafe.naver.com/"}, 5.0)
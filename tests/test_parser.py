@@ -36,7 +36,7 @@ class Node:
         # 본 테스트에서 사용하는 셀렉터만 지원:
         # - 태그 조합: "table.article-table tbody tr"
         # - 클래스 선택: ".Board ...", ".nickname", ".type_date" 등
-        # - 자손 결합자: 공백
+        # - 자손 결합자: 공백, 자식 결합자: ">" (앞뒤 공백 필요, "tbody > tr")
         # - 쉼표로 여러 셀렉터 OR: "td.type_date, td.td_date"
         parts_or = [p.strip() for p in css.split(",")]
         out = []
@@ -73,13 +73,21 @@ def match_simple(node, simple):
 
 
 def select_desc(root, tokens):
-    # 후손 결합자만 처리
+    # 후손 결합자(공백) + 자식 결합자(">")
     cur = [root]
+    child = False
     for tok in tokens:
+        if tok == ">":
+            child = True
+            continue
         nxt = []
         for n in cur:
-            nxt.extend(find_desc(n, tok))
+            if child:
+                nxt.extend(c for c in n.children if c.tag is not None and match_simple(c, tok))
+            else:
+                nxt.extend(find_desc(n, tok))
         cur = nxt
+        child = False
     return cur
 
 
@@ -224,3 +232,149 @@ def test_extract_posts_from_frame_contract():
     assert r1["date"] == "12:04"
     assert r1["read_count"] == 76
     assert r1["like_count"] == 0
+
+
+class EvalTarget:
+    """evaluate 결과만 돌려주는 가짜 프레임"""
+
+    def __init__(self, result):
+        self.result = result
+        self.scripts = []
+
+    def evaluate(self, script):
+        self.scripts.append(script)
+        if isinstance(self.result, Exception):
+            raise self.result
+        return self.result
+
+
+def test_extract_posts_evaluate_mode_single_round_trip():
+    from naver_cafe_scraper import parser
+
+    target = EvalTarget(
+        {
+            "skin": "new",
+            "rows": [
+                {
+                    "article_no": "13709326",
+                    "title": "메가박스 6천원 영화표",
+                    "url": "https://cafe.naver.com/f-e/cafes/29434212/articles/13709326",
+                    "author": "탐딜을찾아",
+                    "date": "2025.08.08.",
+                    "read_count": "1,272",
+                    "like_count": "5",
+                }
+            ],
+        }
+    )
+    rows = parser.extract_posts_from_frame(target, mode="evaluate")
+    assert len(target.scripts) == 1
+    assert rows == [
+        {
+            "article_no": "13709326",
+            "title": "메가박스 6천원 영화표",
+            "url": "https://cafe.naver.com/f-e/cafes/29434212/articles/13709326",
+            "author": "탐딜을찾아",
+            "date": "2025.08.08.",
+            "read_count": 1272,
+            "like_count": 5,
+        }
+    ]
+
+    old = EvalTarget({"skin": "old", "rows": [{"title": "t", "url": "u"}]})
+    assert parser.extract_posts_from_frame(old, mode="evaluate") == [{"title": "t", "url": "u"}]
+
+
+def test_extract_posts_evaluate_falls_back_to_dom():
+    from naver_cafe_scraper import parser
+
+    class Fallback(FakePage):
+        def evaluate(self, script):
+            raise RuntimeError("evaluate unsupported")
+
+    page = Fallback('<a class="tit" href="/a/1">제목</a>')
+    assert parser.extract_posts_from_frame(page, mode="evaluate") == [
+        {"title": "제목", "url": "/a/1"}
+    ]
+
+
+def test_extract_article_detail_evaluate_mode():
+    from naver_cafe_scraper import parser
+
+    target = EvalTarget(
+        {
+            "title": "11번가) 과학/수학 생활동화",
+            "author": "똘돌잉",
+            "date": "2025.08.08. 23:17",
+            "read_count": "조회 586",
+            "like_count": "9",
+            "has_root": True,
+            "content_html": "<p>본문</p>",
+            "paras": ["미국 아마존 판매 1위 과학 생활동화 세트예요"],
+            "links": ["https://www.11st.co.kr/p/1", "https://www.11st.co.kr/p/1"],
+            "images": ["https://img/1.jpg", "https://img/1.jpg", "https://img/2.jpg"],
+            "alts": ["상품 대표 이미지 사진"],
+            "captions": ["상품 대표 이미지 사진"],
+        }
+    )
+    data = parser.extract_article_detail(target, ocr=False, mode="evaluate")
+    assert len(target.scripts) == 1
+    assert data["title"] == "11번가) 과학/수학 생활동화"
+    assert data["read_count"] == 586 and data["like_count"] == 9
+    assert data["external_links"] == ["https://www.11st.co.kr/p/1"]
+    assert data["images"] == ["https://img/1.jpg", "https://img/2.jpg"]
+    # 본문 + alt/캡션(중복 제거) 병합 후 KoBERT 전처리
+    assert data["content_text"] == "미국 아마존 판매 1위 과학 생활동화 세트예요 상품 대표 이미지 사진"
+    assert data["content_html"] == "<p>본문</p>"
+
+
+DETAIL_SAMPLE = """
+<h3 class="title_text">제목</h3>
+<div class="WriterInfo"><span class="nickname">작성자</span></div>
+<div class="CafeViewer">
+  <p>첫 문단</p>
+  <p><a href="https://ext/1">링크</a><a href="/internal">내부</a></p>
+  <img src="https://img/1.jpg" alt="대체 텍스트">
+  <div class="se-caption">캡션</div>
+</div>
+"""
+
+
+class AsyncNode:
+    """FakePage 노드를 async 핸들처럼 감쌈"""
+
+    def __init__(self, node):
+        self.node = node
+
+    async def query_selector(self, css):
+        found = self.node.query_selector(css)
+        return AsyncNode(found) if found else None
+
+    async def query_selector_all(self, css):
+        return [AsyncNode(n) for n in self.node.query_selector_all(css)]
+
+    async def inner_text(self):
+        return self.node.inner_text()
+
+    async def get_attribute(self, name):
+        return self.node.get_attribute(name)
+
+
+def test_dom_mode_sync_and_async_share_one_path():
+    import asyncio
+
+    from naver_cafe_scraper import parser
+
+    page = FakePage(DETAIL_SAMPLE)
+    data = parser.extract_article_detail(page, ocr=False, mode="dom")
+    assert data["title"] == "제목" and data["author"] == "작성자"
+    assert data["external_links"] == ["https://ext/1"]
+    assert data["images"] == ["https://img/1.jpg"]
+    assert "첫 문단" in data["content_text"] and "캡션" in data["content_text"]
+    adata = asyncio.run(parser.aextract_article_detail(AsyncNode(page), ocr=False, mode="dom"))
+    assert adata == data
+
+    old = FakePage('<a class="tit" href="/a/1">제목</a>')
+    rows = asyncio.run(parser.aextract_posts_from_frame(AsyncNode(old), mode="dom"))
+    assert rows == parser.extract_posts_from_frame(old, mode="dom")
+    assert rows == [{"title": "제목", "url": "/a/1"}]
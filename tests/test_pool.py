@@ -0,0 +1,117 @@
+import asyncio
+
+import pytest
+
+from naver_cafe_scraper.pool import AsyncPagePool, PagePool
+
+
+class FakePage:
+    def __init__(self):
+        self.urls = []
+        self.closed = False
+        self.handlers = {}
+
+    def goto(self, url, **kw):
+        self.urls.append(url)
+
+    def on(self, event, fn):
+        self.handlers[event] = fn
+
+    def is_closed(self):
+        return self.closed
+
+    def close(self):
+        self.closed = True
+
+
+class FakeContext:
+    def __init__(self):
+        self.pages = []
+
+    def new_page(self):
+        page = FakePage()
+        self.pages.append(page)
+        return page
+
+
+def test_pool_reuses_and_resets_page():
+    ctx = FakeContext()
+    pool = PagePool(ctx, size=1, max_uses=10)
+    for i in range(3):
+        with pool.page() as page:
+            page.goto(f"u{i}")
+    assert len(ctx.pages) == 1
+    assert ctx.pages[0].urls == ["u0", "about:blank", "u1", "about:blank", "u2", "about:blank"]
+    assert pool.stats == {"created": 1, "reused": 2, "recycled": 0}
+
+
+def test_pool_recycles_after_max_uses_and_on_error():
+    ctx = FakeContext()
+    pool = PagePool(ctx, size=1, max_uses=2)
+    for _ in range(2):
+        with pool.page():
+            pass
+    assert ctx.pages[0].closed  # 2회 사용 후 폐기
+
+    with pytest.raises(ValueError):
+        with pool.page():
+            raise ValueError("boom")
+    assert ctx.pages[1].closed  # 예외 발생 탭 폐기
+
+    with pool.page() as page:
+        page.handlers["crash"]()  # 크래시 이벤트
+    assert ctx.pages[2].closed
+    assert len(ctx.pages) == 3 and pool.stats["recycled"] == 3
+
+
+def test_pool_round_robin_contexts_and_exhaustion():
+    c1, c2 = FakeContext(), FakeContext()
+    pool = PagePool([c1, c2], size=2)
+    p1, p2 = pool.acquire(), pool.acquire()
+    assert len(c1.pages) == 1 and len(c2.pages) == 1
+    with pytest.raises(RuntimeError):
+        pool.acquire()
+    pool.release(p1)
+    pool.release(p2)
+    pool.close()
+    assert p1.closed and p2.closed
+
+
+class FakeAsyncPage(FakePage):
+    async def goto(self, url, **kw):
+        self.urls.append(url)
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeAsyncContext:
+    def __init__(self):
+        self.pages = []
+
+    async def new_page(self):
+        page = FakeAsyncPage()
+        self.pages.append(page)
+        return page
+
+
+def test_async_pool_bounds_open_tabs():
+    ctx = FakeAsyncContext()
+
+    async def run():
+        pool = AsyncPagePool(ctx, size=2)
+        active = {"now": 0, "max": 0}
+
+        async def work():
+            async with pool.page():
+                active["now"] += 1
+                active["max"] = max(active["max"], active["now"])
+                await asyncio.sleep(0.01)
+                active["now"] -= 1
+
+        await asyncio.gather(*(work() for _ in range(6)))
+        await pool.close()
+        return active["max"]
+
+    assert asyncio.run(run()) == 2
+    assert len(ctx.pages) == 2
@@ -0,0 +1,116 @@
+import asyncio
+
+from naver_cafe_scraper import readiness
+from naver_cafe_scraper.readiness import AdaptiveTimeout, Readiness
+
+
+class FakeTarget:
+    def __init__(self, ready=True):
+        self.ready = ready
+        self.calls = []
+
+    def wait_for_selector(self, selector, timeout=None):
+        self.calls.append(("selector", selector, timeout))
+        if not self.ready:
+            raise TimeoutError("timeout")
+
+    def wait_for_function(self, expr, arg=None, polling=None, timeout=None):
+        self.calls.append(("function", arg, timeout))
+        if not self.ready:
+            raise TimeoutError("timeout")
+
+
+class FakeAsyncTarget(FakeTarget):
+    async def wait_for_selector(self, selector, timeout=None):
+        FakeTarget.wait_for_selector(self, selector, timeout)
+
+    async def wait_for_function(self, expr, arg=None, polling=None, timeout=None):
+        FakeTarget.wait_for_function(self, expr, arg, polling, timeout)
+
+
+def test_adaptive_timeout_tracks_observations():
+    t = AdaptiveTimeout(5000, min_ms=500, window=5)
+    assert t.current() == 5000
+    for ms in (100, 120, 110, 130, 90):
+        t.observe(ms)
+    assert t.current() == 500  # p95(130) × 2 < min_ms
+    for ms in (800, 900, 1000, 1100, 1200):
+        t.observe(ms)
+    assert t.current() == 2400
+    t.observe(0, timed_out=True)
+    assert t.current() == 7200
+
+
+def test_adaptive_timeout_clamped_to_max():
+    t = AdaptiveTimeout(1000)
+    for _ in range(5):
+        t.observe(0, timed_out=True)
+    assert t.current() == 2000
+
+
+def test_readiness_sync_waits_are_best_effort():
+    r = Readiness(frame_ms=3000, list_ms=10000, detail_ms=4000)
+    ok = FakeTarget()
+    assert r.wait_frame_or_content(ok)
+    assert r.wait_list(ok)
+    assert r.wait_detail(ok)
+    assert ok.calls[0] == ("selector", readiness.FRAME_OR_CONTENT_SELECTOR, 3000)
+    assert ok.calls[1][0] == "function" and ok.calls[1][2] == 10000
+    assert ok.calls[2] == ("selector", readiness.DETAIL_READY_SELECTOR, 4000)
+
+    # 실패해도 예외 없이 False, 다음 대기 시간은 늘어남
+    r2 = Readiness(frame_ms=3000, list_ms=10000, detail_ms=4000)
+    assert r2.wait_detail(FakeTarget(ready=False)) is False
+    assert r2.timeouts["detail"].current() == 8000  # max_ms(= initial × 2)로 제한
+
+
+def test_readiness_stable_tokens_are_unique():
+    r = Readiness(frame_ms=1000, list_ms=1000, detail_ms=1000)
+    t = FakeTarget()
+    r.wait_list(t)
+    r.wait_list(t)
+    assert t.calls[0][1][2] != t.calls[1][1][2]
+
+
+def test_readiness_async_waits():
+    r = Readiness(frame_ms=3000, list_ms=10000, detail_ms=4000)
+
+    async def run():
+        ok = FakeAsyncTarget()
+        bad = FakeAsyncTarget(ready=False)
+        return (
+            await r.await_frame_or_content(ok),
+            await r.await_list(ok),
+            await r.await_detail(bad),
+        )
+
+    assert asyncio.run(run()) == (True, True, False)
+
+
+def test_readiness_list_and_detail_timeouts_never_drop_below_configured():
+    r = Readiness(frame_ms=3000, list_ms=10000, detail_ms=4000)
+    fast = FakeTarget()
+    for _ in range(20):
+        r.wait_frame_or_content(fast)
+        r.wait_list(fast)
+        r.wait_detail(fast)
+    assert r.timeouts["frame"].current() == 500  # 프레임 대기만 관측값으로 줄어듦
+    assert r.timeouts["list"].current() == 10000
+    assert r.timeouts["detail"].current() == 4000
+
+
+def test_readiness_retries_timed_out_wait_once():
+    class Flaky(FakeTarget):
+        def wait_for_selector(self, selector, timeout=None):
+            self.ready = len(self.calls) > 0
+            FakeTarget.wait_for_selector(self, selector, timeout)
+
+    r = Readiness(frame_ms=3000, list_ms=10000, detail_ms=4000)
+    flaky = Flaky()
+    assert r.wait_detail(flaky) is True
+    assert [c[2] for c in flaky.calls] == [4000, 8000]  # 두 번째는 늘어난 타임아웃
+
+    bad = FakeTarget(ready=False)
+    assert r.wait_list(bad) is False
+    assert len(bad.calls) == 2
+    assert Readiness(1000, 1000, 1000, retries=0).wait_detail(FakeTarget(ready=False)) is False
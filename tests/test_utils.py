@@ -1,8 +1,12 @@
 from pathlib import Path
 
+import pytest
+
 from naver_cafe_scraper.utils import (
     ensure_dir,
     build_page_url,
+    clean_for_kobert,
+    clean_many,
     load_storage_state,
     save_storage_state,
 )
@@ -63,3 +67,36 @@ def test_load_and_save_storage_state(tmp_path):
     ctx2 = load_storage_state(fake_browser, str(state_path))
     # FakeBrowser.new_context가 받은 첫 인자가 storage_state
     assert fake_browser.created[-1] == str(state_path)
+
+
+# 문자군 통계를 한 번에 세도록 바꾸기 전 구현의 출력 (그대로 유지돼야 함)
+CLEAN_CASES = [
+    ("", ""),
+    ("  ", ""),
+    ("12:30", ""),
+    ("오늘 12:30 만나요", "오늘 12:30 만나요"),
+    ("=====", ""),
+    ("ㅋㅋㅋㅋ 진짜 웃기네요 ㅋㅋ", ""),
+    ("a\tb\n\nc", "a b c"),
+    ("가나다라마바사아자차카타파하 " * 4 + "12:30", "가나다라마바사아자차카타파하 " * 4 + "12:30"),
+    ("문의: 010-1234-5678 / http://example.com/a?b=1 ~~~~~ 감사합니다!!", ""),
+    ("①②③ ² ٣ 숫자 테스트 문장입니다 여기", "123 2 ٣ 숫자 테스트 문장입니다 여기"),
+    ("\u200b제로폭\u3000공백\xa0테스트 문장입니다~~~", ""),
+    ("x" * 60, "x" * 60),
+    (
+        "  \x85 가나다 \u2028 라마바 사아자 차카타 파하 가나다 라마바 사아자 차카타 파하 가나다",
+        "가나다 라마바 사아자 차카타 파하 가나다 라마바 사아자 차카타 파하 가나다",
+    ),
+]
+
+
+@pytest.mark.parametrize("text,expected", CLEAN_CASES)
+def test_clean_for_kobert_output_is_stable(text, expected):
+    assert clean_for_kobert(text) == expected
+
+
+def test_clean_many_keeps_order_with_process_pool():
+    texts = [text for text, _ in CLEAN_CASES] * 3
+    expected = [clean_for_kobert(t) for t in texts]
+    assert clean_many(texts) == expected
+    assert clean_many(texts, workers=2, chunksize=4) == expected